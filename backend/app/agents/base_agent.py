@@ -4,74 +4,134 @@ Base Agent class and supporting types for MileSync multi-agent system.
 All specialized agents inherit from BaseAgent and implement the process() method.
 """
 
+import asyncio
 import logging
+import sys
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
 from datetime import datetime
-from enum import Enum
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, Mapping, Optional, Tuple, Type, TypeVar
 
 from fastapi import HTTPException
 import openai
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
+
+from app.agents.outputs import (  # noqa: F401 - re-exported for agents
+    DailySummary,
+    EmotionalAssessment,
+    ExecutionOutput,
+    FoundationOutput,
+    GoalType,
+    HabitAnalysis,
+    HabitLoop,
+    Intervention,
+    MilestoneOutput,
+    PatternInsights,
+    PlanningOutput,
+    PsychologicalOutput,
+    Resource,
+    SMARTGoal,
+    SupportOutput,
+    SustainabilityOutput,
+    TaskFrequency,
+    TaskSchedule,
+    TaskScheduleItem,
+)
+from app.agents.task_history import TaskHistoryColumns
+from app.agents.types import AgentType  # noqa: F401 - re-exported for agents
+# Reason: Imported once at module load (openai_clients does not import agents,
+# so there is no cycle); attribute access at call time keeps it patchable.
+from app.services import openai_clients
+from app.utils.clock import utcnow
+from app.utils.ids import generate_trace_id
 
 logger = logging.getLogger(__name__)
 
+OutputModelT = TypeVar("OutputModelT", bound=BaseModel)
 
-class AgentType(str, Enum):
-    """Types of agents in the MileSync system."""
-    FOUNDATION = "foundation"
-    PLANNING = "planning"
-    EXECUTION = "execution"
-    SUSTAINABILITY = "sustainability"
-    SUPPORT = "support"
-    PSYCHOLOGICAL = "psychological"
-
-
-class GoalType(str, Enum):
-    """Goal duration classification."""
-    SHORT_TERM = "short_term"    # <3 months
-    LONG_TERM = "long_term"      # 3-12 months
-    RESOLUTION = "resolution"    # Year-long commitment
 
+def normalize_role(role: Any) -> str:
+    """
+    Normalize a chat message role to an interned plain string.
+    
+    Reason: Roles are drawn from a tiny fixed set but arrive as fresh strings
+    (or MessageRole members) on every request; interning lets every message
+    dict share one "user"/"assistant"/"system" object.
+    
+    Args:
+        role: Role string or str-valued enum member (None means "user")
+        
+    Returns:
+        Interned role string
+    """
+    return sys.intern(str(getattr(role, "value", role) or "user"))
 
-class TaskFrequency(str, Enum):
-    """How often a task should be performed."""
-    DAILY = "daily"
-    WEEKLY = "weekly"
-    MONTHLY = "monthly"
-    ONE_TIME = "one_time"
 
+# Reason: AgentContext and AgentResponse are built on every route and chain
+# hop from trusted internal data, so they are slotted dataclasses rather than
+# Pydantic models; validation stays on the HTTP schemas and LLM output models.
 
-class AgentContext(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class AgentContext:
     """Context passed to agents for processing."""
     
     user_id: int
     goal_id: Optional[int] = None
     session_id: Optional[int] = None
-    messages: List[Dict[str, str]] = Field(default_factory=list)
+    messages: List[Dict[str, str]] = field(default_factory=list)
     user_profile: Optional[Dict[str, Any]] = None
     current_goal: Optional[Dict[str, Any]] = None
     task_history: Optional[List[Dict[str, Any]]] = None
-    additional_context: Optional[Dict[str, Any]] = None
+    task_summary: Optional[Dict[str, int]] = None  # Task counts by status
+    additional_context: Optional[Mapping[str, Any]] = None
+    _task_columns: Optional[Tuple[Any, TaskHistoryColumns]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    def set_task_history(
+        self,
+        rows: List[Dict[str, Any]],
+        columns: TaskHistoryColumns,
+    ) -> None:
+        """
+        Attach task history rows together with their prebuilt columns.
+        
+        Args:
+            rows: Task history dicts
+            columns: Columnar view of the same rows, in the same order
+        """
+        self.task_history = rows
+        self._task_columns = (rows, columns)
     
-    class Config:
-        extra = "allow"
+    def task_columns(self) -> TaskHistoryColumns:
+        """
+        Columnar view of task_history, built once and reused.
+        
+        Returns:
+            TaskHistoryColumns for the current task_history rows
+        """
+        rows = self.task_history or []
+        cached = self._task_columns
+        # Rebuild if task_history was reassigned since the last call
+        if cached is None or cached[0] is not rows:
+            cached = (rows, TaskHistoryColumns.from_dicts(rows))
+            self._task_columns = cached
+        return cached[1]
 
 
-class AgentResponse(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class AgentResponse:
     """Standard response from any agent."""
     
     agent_type: AgentType
     success: bool = True
     message: str = ""
-    data: Dict[str, Any] = Field(default_factory=dict)
+    data: Dict[str, Any] = field(default_factory=dict)
     next_agent: Optional[AgentType] = None  # For agent chaining
     requires_user_input: bool = False
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = field(default_factory=utcnow)
     trace_id: Optional[str] = None  # For Opik tracing
-    
-    class Config:
-        use_enum_values = True
 
 
 class BaseAgent(ABC):
@@ -94,6 +154,9 @@ class BaseAgent(ABC):
     def __init__(self):
         """Initialize the base agent."""
         self._setup_logging()
+        self._client = None
+        self._async_client = None
+        self._system_message: Optional[Dict[str, str]] = None
     
     def _setup_logging(self):
         """Configure logging for this agent."""
@@ -122,6 +185,43 @@ class BaseAgent(ABC):
         """
         pass
     
+    @property
+    def client(self):
+        """
+        Shared OpenAI client, resolved once per agent.
+        
+        Returns:
+            The OpenAI client, or None if no API key is configured
+        """
+        if self._client is None:
+            self._client = openai_clients.get_openai_client()
+        return self._client
+    
+    @property
+    def async_client(self):
+        """
+        Shared AsyncOpenAI client, resolved once per agent.
+        
+        Returns:
+            The AsyncOpenAI client, or None if no API key is configured
+        """
+        if self._async_client is None:
+            self._async_client = openai_clients.get_async_openai_client()
+        return self._async_client
+    
+    @property
+    def system_message(self) -> Dict[str, str]:
+        """
+        System message dict for this agent's prompt.
+        
+        Reason: Rebuilt only when the prompt text changes, so admin prompt
+        updates (which clear the openai_clients prompt cache) still take effect.
+        """
+        prompt = self.get_system_prompt()
+        if self._system_message is None or self._system_message["content"] != prompt:
+            self._system_message = {"role": "system", "content": prompt}
+        return self._system_message
+    
     async def generate_response(
         self,
         context: AgentContext,
@@ -137,33 +237,45 @@ class BaseAgent(ABC):
         Returns:
             Generated response string
         """
-        from app.services.ai_service import get_openai_client
+        parts = [
+            delta async for delta in self.generate_response_stream(context, user_message)
+        ]
+        return "".join(parts)
+    
+    async def generate_response_stream(
+        self,
+        context: AgentContext,
+        user_message: str
+    ) -> AsyncIterator[str]:
+        """
+        Stream an LLM response using this agent's prompt.
         
-        client = get_openai_client()
+        Reason: Tokens are yielded as they arrive so callers can forward or
+        process them while the rest of the completion is still in flight.
+        
+        Args:
+            context: Current agent context
+            user_message: The user's message
+            
+        Yields:
+            Response text deltas, in order
+        """
+        client = self.async_client
         if not client:
             raise ValueError("OpenAI client not configured")
         
-        messages = [
-            {"role": "system", "content": self.get_system_prompt()},
-        ]
-        
-        # Add conversation history
-        for msg in context.messages:
-            messages.append({
-                "role": msg.get("role", "user"),
-                "content": msg.get("content", "")
-            })
-        
-        # Add current message
-        messages.append({"role": "user", "content": user_message})
+        messages = self._build_messages(context, user_message)
         
         try:
-            response = client.chat.completions.create(
+            stream = await client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=messages,
-                temperature=0.7
+                temperature=0.7,
+                stream=True
             )
-            return response.choices[0].message.content
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
         except openai.RateLimitError as e:
             self.logger.error(f"OpenAI rate limit reached: {e}")
             raise HTTPException(
@@ -174,6 +286,118 @@ class BaseAgent(ABC):
             self.logger.error(f"Error generating response: {e}")
             raise
     
+    async def generate_responses_batch(
+        self,
+        pairs: List[Tuple[AgentContext, str]]
+    ) -> List[str]:
+        """
+        Generate LLM responses for several independent prompts concurrently.
+        
+        All completions are dispatched at once on the async client, so N
+        prompts cost roughly one round trip of wall-clock time instead of N.
+        
+        Args:
+            pairs: (context, user_message) tuples to answer
+            
+        Returns:
+            Generated response strings, in the same order as pairs
+        """
+        if not pairs:
+            return []
+        
+        client = self.async_client
+        if not client:
+            raise ValueError("OpenAI client not configured")
+        
+        all_messages = [
+            self._build_messages(context, user_message)
+            for context, user_message in pairs
+        ]
+        
+        try:
+            responses = await asyncio.gather(*[
+                client.chat.completions.create(
+                    model="gpt-4o-mini",
+                    messages=messages,
+                    temperature=0.7
+                )
+                for messages in all_messages
+            ])
+            return [r.choices[0].message.content for r in responses]
+        except openai.RateLimitError as e:
+            self.logger.error(f"OpenAI rate limit reached: {e}")
+            raise HTTPException(
+                status_code=429,
+                detail="OPENAI_LIMIT_REACHED"
+            )
+        except Exception as e:
+            self.logger.error(f"Error generating batch responses: {e}")
+            raise
+    
+    async def generate_structured_response(
+        self,
+        prompt: str,
+        response_schema: Type[OutputModelT],
+        temperature: float = 0.7
+    ) -> OutputModelT:
+        """
+        Generate an LLM response constrained to a Pydantic output schema.
+        
+        The schema is sent as a json_schema response_format, so the API
+        returns bare JSON that is validated in one model_validate_json pass.
+        
+        Args:
+            prompt: Instruction sent after the system prompt
+            response_schema: Output model the response must conform to
+            temperature: Sampling temperature
+            
+        Returns:
+            Validated instance of response_schema
+            
+        Raises:
+            ValueError: If the OpenAI client is not configured
+            pydantic.ValidationError: If the response doesn't match the schema
+        """
+        client = self.async_client
+        if not client:
+            raise ValueError("OpenAI client not configured")
+        
+        try:
+            response = await client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    self.system_message,
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=temperature,
+                response_format=json_schema_response_format(response_schema)
+            )
+        except openai.RateLimitError as e:
+            self.logger.error(f"OpenAI rate limit reached: {e}")
+            raise HTTPException(
+                status_code=429,
+                detail="OPENAI_LIMIT_REACHED"
+            )
+        
+        return response_schema.model_validate_json(response.choices[0].message.content)
+    
+    def _build_messages(
+        self,
+        context: AgentContext,
+        user_message: str
+    ) -> List[Dict[str, str]]:
+        """Build the chat messages list: system prompt, history, then the new message."""
+        return [
+            self.system_message,
+            # Conversation history
+            *(
+                {"role": normalize_role(msg.get("role")), "content": msg.get("content", "")}
+                for msg in context.messages
+            ),
+            # Current message
+            {"role": "user", "content": user_message},
+        ]
+    
     def create_response(
         self,
         success: bool = True,
@@ -195,8 +419,6 @@ class BaseAgent(ABC):
         Returns:
             Formatted AgentResponse
         """
-        import uuid
-        
         return AgentResponse(
             agent_type=self.agent_type,
             success=success,
@@ -204,155 +426,30 @@ class BaseAgent(ABC):
             data=data or {},
             next_agent=next_agent,
             requires_user_input=requires_user_input,
-            trace_id=str(uuid.uuid4())
+            trace_id=generate_trace_id()
         )
 
 
-# Output schemas for each agent type
-
-class FoundationOutput(BaseModel):
-    """Output from Foundation Agent."""
-    goal_summary: str
-    goal_type: GoalType
-    motivation_score: int = Field(ge=1, le=10)
-    feasibility_score: int = Field(ge=1, le=10)
-    clarity_score: int = Field(ge=1, le=10)
-    identified_obstacles: List[str] = Field(default_factory=list)
-    success_criteria: List[str] = Field(default_factory=list)
-    baseline_metrics: Dict[str, Any] = Field(default_factory=dict)
-    user_constraints: Dict[str, Any] = Field(default_factory=dict)
-    recommended_adjustments: List[str] = Field(default_factory=list)
-
-
-class SMARTGoal(BaseModel):
-    """SMART goal breakdown."""
-    specific: str
-    measurable: str
-    achievable: str
-    relevant: str
-    time_bound: str
-
-
-class TaskScheduleItem(BaseModel):
-    """A scheduled task item."""
-    title: str
-    description: Optional[str] = None
-    frequency: TaskFrequency
-    estimated_minutes: int = 30
-    priority: str = "medium"
-
-
-class TaskSchedule(BaseModel):
-    """Complete task schedule."""
-    daily: List[TaskScheduleItem] = Field(default_factory=list)
-    weekly: List[TaskScheduleItem] = Field(default_factory=list)
-    monthly: List[TaskScheduleItem] = Field(default_factory=list)
-
-
-class MilestoneOutput(BaseModel):
-    """Milestone from planning."""
-    id: str
-    title: str
-    description: Optional[str] = None
-    deadline: Optional[str] = None
-    success_criteria: List[str] = Field(default_factory=list)
-    tasks: List[TaskScheduleItem] = Field(default_factory=list)
-
-
-class PlanningOutput(BaseModel):
-    """Output from Planning Agent."""
-    smart_goal: SMARTGoal
-    milestones: List[MilestoneOutput] = Field(default_factory=list)
-    task_schedule: TaskSchedule = Field(default_factory=TaskSchedule)
-    dependencies: List[Dict[str, str]] = Field(default_factory=list)
-    total_estimated_hours: int = 0
-    critical_path: List[str] = Field(default_factory=list)
-
-
-class DailySummary(BaseModel):
-    """Daily execution summary."""
-    tasks_completed: int = 0
-    tasks_pending: int = 0
-    streak_count: int = 0
-    completion_rate: float = 0.0
-
-
-class ExecutionOutput(BaseModel):
-    """Output from Execution Agent."""
-    daily_summary: DailySummary = Field(default_factory=DailySummary)
-    adjustments_recommended: List[str] = Field(default_factory=list)
-    blockers_identified: List[str] = Field(default_factory=list)
-    next_actions: List[str] = Field(default_factory=list)
-    motivational_message: str = ""
-
-
-class HabitLoop(BaseModel):
-    """Habit loop structure."""
-    cue: str
-    routine: str
-    reward: str
-
-
-class HabitAnalysis(BaseModel):
-    """Habit formation analysis."""
-    habit_score: int = Field(default=0, ge=0, le=100)
-    days_consistent: int = 0
-    habit_loops: List[HabitLoop] = Field(default_factory=list)
-
-
-class PatternInsights(BaseModel):
-    """Pattern detection insights."""
-    best_days: List[str] = Field(default_factory=list)
-    best_times: List[str] = Field(default_factory=list)
-    failure_patterns: List[str] = Field(default_factory=list)
-
-
-class SustainabilityOutput(BaseModel):
-    """Output from Sustainability Agent."""
-    habit_analysis: HabitAnalysis = Field(default_factory=HabitAnalysis)
-    pattern_insights: PatternInsights = Field(default_factory=PatternInsights)
-    sustainability_score: int = Field(ge=0, le=100, default=50)
-    burnout_risk: str = "LOW"  # LOW, MEDIUM, HIGH
-    recommendations: List[str] = Field(default_factory=list)
-
-
-class Resource(BaseModel):
-    """Recommended resource."""
-    type: str  # COURSE, BOOK, TOOL, COMMUNITY, EXPERT
-    name: str
-    url: Optional[str] = None
-    relevance_score: float = 0.0
-    time_commitment: Optional[str] = None
-    cost: str = "Free"
-
-
-class SupportOutput(BaseModel):
-    """Output from Support Agent."""
-    recommended_resources: List[Resource] = Field(default_factory=list)
-    integration_suggestions: List[str] = Field(default_factory=list)
-    community_matches: List[str] = Field(default_factory=list)
-    expert_recommendations: List[str] = Field(default_factory=list)
-
-
-class EmotionalAssessment(BaseModel):
-    """Emotional state assessment."""
-    motivation_level: int = Field(ge=1, le=10, default=5)
-    stress_level: int = Field(ge=1, le=10, default=5)
-    confidence_level: int = Field(ge=1, le=10, default=5)
-    detected_patterns: List[str] = Field(default_factory=list)
-
-
-class Intervention(BaseModel):
-    """Psychological intervention."""
-    type: str
-    technique: str
-    message: str
-    exercises: List[str] = Field(default_factory=list)
-
-
-class PsychologicalOutput(BaseModel):
-    """Output from Psychological Agent."""
-    emotional_assessment: EmotionalAssessment = Field(default_factory=EmotionalAssessment)
-    intervention: Optional[Intervention] = None
-    affirmations: List[str] = Field(default_factory=list)
-    progress_celebration: str = ""
+@lru_cache(maxsize=None)
+def json_schema_response_format(schema: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    Build (once per model) the OpenAI response_format for an output schema.
+    
+    Reason: strict mode is off because the output models use free-form
+    Dict[str, Any] fields and ge/le bounds, which strict schemas can't express;
+    Pydantic enforces those when the response is validated.
+    
+    Args:
+        schema: Pydantic output model
+        
+    Returns:
+        response_format dict for chat.completions.create
+    """
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": schema.__name__,
+            "schema": schema.model_json_schema(),
+            "strict": False,
+        },
+    }
@@ -9,6 +9,8 @@ import logging
 from datetime import datetime
 from typing import Optional
 
+import numpy as np
+
 from app.agents.base_agent import (
     AgentContext,
     AgentResponse,
@@ -17,6 +19,10 @@ from app.agents.base_agent import (
     DailySummary,
     ExecutionOutput,
 )
+from app.agents.scoring import completion_stats, current_streak
+from app.agents.task_history import TaskHistoryColumns
+from app.services import openai_clients
+from app.utils.clock import utcnow
 
 logger = logging.getLogger(__name__)
 
@@ -67,8 +73,7 @@ class ExecutionAgent(BaseAgent):
     
     def get_system_prompt(self) -> str:
         """Get the Execution Agent system prompt."""
-        from app.services.ai_service import get_system_prompt
-        return get_system_prompt("execution_system_prompt", EXECUTION_SYSTEM_PROMPT)
+        return openai_clients.get_system_prompt("execution_system_prompt", EXECUTION_SYSTEM_PROMPT)
     
     async def process(self, context: AgentContext) -> AgentResponse:
         """
@@ -99,13 +104,16 @@ class ExecutionAgent(BaseAgent):
         task_history = context.task_history or []
         
         # Calculate metrics
-        today_tasks = [t for t in task_history if self._is_today(t.get("created_at"))]
-        completed = sum(1 for t in today_tasks if t.get("status") == "completed")
-        pending = len(today_tasks) - completed
-        completion_rate = completed / len(today_tasks) if today_tasks else 0
+        columns = context.task_columns()
+        today = np.datetime64(utcnow().date(), "D")
+        today_mask = columns.created_at.astype("datetime64[D]") == today
+        today_tasks = [t for t, is_today in zip(task_history, today_mask) if is_today]
+        completed, pending, completion_rate = completion_stats(
+            columns.completed_mask()[today_mask]
+        )
         
         # Calculate streak
-        streak = self._calculate_streak(task_history)
+        streak = self._calculate_streak(columns)
         
         # Generate recommendations
         adjustments = []
@@ -128,8 +136,8 @@ class ExecutionAgent(BaseAgent):
         else:
             motivational = "🌟 Every step counts. What's one thing you can do right now?"
         
-        output = ExecutionOutput(
-            daily_summary=DailySummary(
+        output = ExecutionOutput.model_construct(
+            daily_summary=DailySummary.model_construct(
                 tasks_completed=completed,
                 tasks_pending=pending,
                 streak_count=streak,
@@ -154,7 +162,7 @@ class ExecutionAgent(BaseAgent):
             task_id = context.additional_context.get("task_id")
         
         # Generate celebratory response
-        streak = self._calculate_streak(context.task_history or [])
+        streak = self._calculate_streak(context.task_columns())
         
         messages = [
             "✅ Task completed! Great job!",
@@ -209,45 +217,29 @@ class ExecutionAgent(BaseAgent):
             return False
         try:
             date = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-            return date.date() == datetime.utcnow().date()
+            return date.date() == utcnow().date()
         except (ValueError, AttributeError):
             return False
     
-    def _calculate_streak(self, task_history: list) -> int:
-        """Calculate current completion streak."""
-        if not task_history:
+    def _calculate_streak(self, columns: TaskHistoryColumns) -> int:
+        """
+        Calculate current completion streak.
+        
+        Args:
+            columns: The context's task history columns (context.task_columns())
+        """
+        if not len(columns):
             return 0
         
-        # Sort by date
-        completed = [
-            t for t in task_history
-            if t.get("status") == "completed" and t.get("completed_at")
+        completed_at = columns.completed_at[
+            columns.completed_mask() & ~np.isnat(columns.completed_at)
         ]
         
-        if not completed:
-            return 0
-        
         # Count consecutive days with completions
-        streak = 0
-        current_date = datetime.utcnow().date()
-        
-        dates_with_completions = set()
-        for t in completed:
-            try:
-                date = datetime.fromisoformat(
-                    t["completed_at"].replace("Z", "+00:00")
-                ).date()
-                dates_with_completions.add(date)
-            except (ValueError, KeyError):
-                continue
-        
-        # Count streak
-        from datetime import timedelta
-        while current_date in dates_with_completions:
-            streak += 1
-            current_date = current_date - timedelta(days=1)
-        
-        return streak
+        return current_streak(
+            completed_at.astype("datetime64[D]"),
+            utcnow().date()
+        )
     
     def _format_summary_message(self, output: ExecutionOutput) -> str:
         """Format daily summary as readable message."""
@@ -4,18 +4,19 @@ Foundation Agent for MileSync.
 Handles initial goal intake, user profiling, and baseline establishment.
 """
 
-import json
 import logging
 from typing import Optional
 
+from pydantic import ValidationError
+
 from app.agents.base_agent import (
     AgentContext,
     AgentResponse,
     AgentType,
     BaseAgent,
     FoundationOutput,
-    GoalType,
 )
+from app.services import openai_clients
 
 logger = logging.getLogger(__name__)
 
@@ -68,8 +69,7 @@ class FoundationAgent(BaseAgent):
     
     def get_system_prompt(self) -> str:
         """Get the Foundation Agent system prompt."""
-        from app.services.ai_service import get_system_prompt
-        return get_system_prompt("foundation_system_prompt", FOUNDATION_SYSTEM_PROMPT)
+        return openai_clients.get_system_prompt("foundation_system_prompt", FOUNDATION_SYSTEM_PROMPT)
     
     async def process(self, context: AgentContext) -> AgentResponse:
         """
@@ -182,45 +182,11 @@ Generate a structured assessment in JSON format with these fields:
 Respond with ONLY the JSON, no other text."""
 
         try:
-            from app.services.ai_service import get_openai_client
-            
-            client = get_openai_client()
-            if not client:
-                raise ValueError("OpenAI client not configured")
-            
-            response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": self.get_system_prompt()},
-                    {"role": "user", "content": assessment_prompt}
-                ],
-                temperature=0.3
-            )
-            
-            response_text = response.choices[0].message.content
-            
-            # Parse JSON response
             try:
-                # Clean up response if needed
-                if "```json" in response_text:
-                    response_text = response_text.split("```json")[1].split("```")[0]
-                elif "```" in response_text:
-                    response_text = response_text.split("```")[1].split("```")[0]
-                
-                assessment_data = json.loads(response_text.strip())
-                
-                # Validate with Pydantic
-                output = FoundationOutput(
-                    goal_summary=assessment_data.get("goal_summary", ""),
-                    goal_type=GoalType(assessment_data.get("goal_type", "long_term").lower()),
-                    motivation_score=assessment_data.get("motivation_score", 5),
-                    feasibility_score=assessment_data.get("feasibility_score", 5),
-                    clarity_score=assessment_data.get("clarity_score", 5),
-                    identified_obstacles=assessment_data.get("identified_obstacles", []),
-                    success_criteria=assessment_data.get("success_criteria", []),
-                    baseline_metrics=assessment_data.get("baseline_metrics", {}),
-                    user_constraints=assessment_data.get("user_constraints", {}),
-                    recommended_adjustments=assessment_data.get("recommended_adjustments", [])
+                output = await self.generate_structured_response(
+                    assessment_prompt,
+                    FoundationOutput,
+                    temperature=0.3
                 )
                 
                 return self.create_response(
@@ -230,8 +196,8 @@ Respond with ONLY the JSON, no other text."""
                     next_agent=AgentType.PLANNING  # Chain to Planning Agent
                 )
                 
-            except json.JSONDecodeError as e:
-                self.logger.error(f"JSON parse error: {e}")
+            except ValidationError as e:
+                self.logger.error(f"Assessment validation error: {e}")
                 return self.create_response(
                     success=False,
                     message="I had trouble processing the assessment. Let me try again."
@@ -0,0 +1,179 @@
+"""
+Structured output schemas for MileSync agents.
+
+Re-exported from app.agents.base_agent, which is where agents import them.
+"""
+
+from enum import Enum
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class GoalType(str, Enum):
+    """Goal duration classification."""
+    SHORT_TERM = "short_term"    # <3 months
+    LONG_TERM = "long_term"      # 3-12 months
+    RESOLUTION = "resolution"    # Year-long commitment
+
+
+class TaskFrequency(str, Enum):
+    """How often a task should be performed."""
+    DAILY = "daily"
+    WEEKLY = "weekly"
+    MONTHLY = "monthly"
+    ONE_TIME = "one_time"
+
+
+# Output schemas for each agent type
+#
+# Reason: Outputs parsed from LLM JSON must be validated, but agents that build
+# outputs from their own already-clamped values (Execution, Sustainability,
+# Psychological) use model_construct() to skip redundant validation.
+
+class FoundationOutput(BaseModel):
+    """Output from Foundation Agent."""
+    goal_summary: str
+    goal_type: GoalType
+    motivation_score: int = Field(ge=1, le=10)
+    feasibility_score: int = Field(ge=1, le=10)
+    clarity_score: int = Field(ge=1, le=10)
+    identified_obstacles: List[str] = Field(default_factory=list)
+    success_criteria: List[str] = Field(default_factory=list)
+    baseline_metrics: Dict[str, Any] = Field(default_factory=dict)
+    user_constraints: Dict[str, Any] = Field(default_factory=dict)
+    recommended_adjustments: List[str] = Field(default_factory=list)
+
+
+class SMARTGoal(BaseModel):
+    """SMART goal breakdown."""
+    specific: str
+    measurable: str
+    achievable: str
+    relevant: str
+    time_bound: str
+
+
+class TaskScheduleItem(BaseModel):
+    """A scheduled task item."""
+    title: str
+    description: Optional[str] = None
+    frequency: TaskFrequency
+    estimated_minutes: int = 30
+    priority: str = "medium"
+
+
+class TaskSchedule(BaseModel):
+    """Complete task schedule."""
+    daily: List[TaskScheduleItem] = Field(default_factory=list)
+    weekly: List[TaskScheduleItem] = Field(default_factory=list)
+    monthly: List[TaskScheduleItem] = Field(default_factory=list)
+
+
+class MilestoneOutput(BaseModel):
+    """Milestone from planning."""
+    id: str
+    title: str
+    description: Optional[str] = None
+    deadline: Optional[str] = None
+    success_criteria: List[str] = Field(default_factory=list)
+    tasks: List[TaskScheduleItem] = Field(default_factory=list)
+
+
+class PlanningOutput(BaseModel):
+    """Output from Planning Agent."""
+    smart_goal: SMARTGoal
+    milestones: List[MilestoneOutput] = Field(default_factory=list)
+    task_schedule: TaskSchedule = Field(default_factory=TaskSchedule)
+    dependencies: List[Dict[str, str]] = Field(default_factory=list)
+    total_estimated_hours: int = 0
+    critical_path: List[str] = Field(default_factory=list)
+
+
+class DailySummary(BaseModel):
+    """Daily execution summary."""
+    tasks_completed: int = 0
+    tasks_pending: int = 0
+    streak_count: int = 0
+    completion_rate: float = 0.0
+
+
+class ExecutionOutput(BaseModel):
+    """Output from Execution Agent."""
+    daily_summary: DailySummary = Field(default_factory=DailySummary)
+    adjustments_recommended: List[str] = Field(default_factory=list)
+    blockers_identified: List[str] = Field(default_factory=list)
+    next_actions: List[str] = Field(default_factory=list)
+    motivational_message: str = ""
+
+
+class HabitLoop(BaseModel):
+    """Habit loop structure."""
+    cue: str
+    routine: str
+    reward: str
+
+
+class HabitAnalysis(BaseModel):
+    """Habit formation analysis."""
+    habit_score: int = Field(default=0, ge=0, le=100)
+    days_consistent: int = 0
+    habit_loops: List[HabitLoop] = Field(default_factory=list)
+
+
+class PatternInsights(BaseModel):
+    """Pattern detection insights."""
+    best_days: List[str] = Field(default_factory=list)
+    best_times: List[str] = Field(default_factory=list)
+    failure_patterns: List[str] = Field(default_factory=list)
+
+
+class SustainabilityOutput(BaseModel):
+    """Output from Sustainability Agent."""
+    habit_analysis: HabitAnalysis = Field(default_factory=HabitAnalysis)
+    pattern_insights: PatternInsights = Field(default_factory=PatternInsights)
+    sustainability_score: int = Field(ge=0, le=100, default=50)
+    burnout_risk: str = "LOW"  # LOW, MEDIUM, HIGH
+    recommendations: List[str] = Field(default_factory=list)
+
+
+class Resource(BaseModel):
+    """Recommended resource."""
+    type: str  # COURSE, BOOK, TOOL, COMMUNITY, EXPERT
+    name: str
+    url: Optional[str] = None
+    relevance_score: float = 0.0
+    time_commitment: Optional[str] = None
+    cost: str = "Free"
+
+
+class SupportOutput(BaseModel):
+    """Output from Support Agent."""
+    recommended_resources: List[Resource] = Field(default_factory=list)
+    integration_suggestions: List[str] = Field(default_factory=list)
+    community_matches: List[str] = Field(default_factory=list)
+    expert_recommendations: List[str] = Field(default_factory=list)
+
+
+class EmotionalAssessment(BaseModel):
+    """Emotional state assessment."""
+    motivation_level: int = Field(ge=1, le=10, default=5)
+    stress_level: int = Field(ge=1, le=10, default=5)
+    confidence_level: int = Field(ge=1, le=10, default=5)
+    detected_patterns: List[str] = Field(default_factory=list)
+
+
+class Intervention(BaseModel):
+    """Psychological intervention."""
+    type: str
+    technique: str
+    message: str
+    exercises: List[str] = Field(default_factory=list)
+
+
+class PsychologicalOutput(BaseModel):
+    """Output from Psychological Agent."""
+    emotional_assessment: EmotionalAssessment = Field(default_factory=EmotionalAssessment)
+    intervention: Optional[Intervention] = None
+    affirmations: List[str] = Field(default_factory=list)
+    progress_celebration: str = ""
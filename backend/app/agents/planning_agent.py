@@ -4,23 +4,21 @@ Planning Agent for MileSync.
 Transforms goals into SMART objectives with detailed execution plans.
 """
 
-import json
 import logging
 from datetime import datetime, timedelta
 from typing import Optional
 
+from pydantic import ValidationError
+
 from app.agents.base_agent import (
     AgentContext,
     AgentResponse,
     AgentType,
     BaseAgent,
-    MilestoneOutput,
     PlanningOutput,
-    SMARTGoal,
-    TaskFrequency,
-    TaskSchedule,
-    TaskScheduleItem,
 )
+from app.utils import json_utils
+from app.services import openai_clients
 
 logger = logging.getLogger(__name__)
 
@@ -80,8 +78,7 @@ class PlanningAgent(BaseAgent):
     
     def get_system_prompt(self) -> str:
         """Get the Planning Agent system prompt."""
-        from app.services.ai_service import get_system_prompt
-        return get_system_prompt("planning_system_prompt", PLANNING_SYSTEM_PROMPT)
+        return openai_clients.get_system_prompt("planning_system_prompt", PLANNING_SYSTEM_PROMPT)
     
     async def process(self, context: AgentContext) -> AgentResponse:
         """
@@ -174,35 +171,12 @@ Rules:
 Respond with ONLY valid JSON."""
 
         try:
-            from app.services.ai_service import get_openai_client
-            
-            client = get_openai_client()
-            if not client:
-                raise ValueError("OpenAI client not configured")
-            
-            response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": self.get_system_prompt()},
-                    {"role": "user", "content": planning_prompt}
-                ],
-                temperature=0.4
-            )
-            
-            response_text = response.choices[0].message.content
-            
-            # Parse JSON response
             try:
-                # Clean up response
-                if "```json" in response_text:
-                    response_text = response_text.split("```json")[1].split("```")[0]
-                elif "```" in response_text:
-                    response_text = response_text.split("```")[1].split("```")[0]
-                
-                plan_data = json.loads(response_text.strip())
-                
-                # Build output
-                output = self._build_planning_output(plan_data)
+                output = await self.generate_structured_response(
+                    planning_prompt,
+                    PlanningOutput,
+                    temperature=0.4
+                )
                 
                 return self.create_response(
                     success=True,
@@ -211,8 +185,8 @@ Respond with ONLY valid JSON."""
                     next_agent=AgentType.EXECUTION  # Chain to Execution Agent
                 )
                 
-            except json.JSONDecodeError as e:
-                self.logger.error(f"JSON parse error: {e}\nResponse: {response_text[:500]}")
+            except ValidationError as e:
+                self.logger.error(f"Plan validation error: {e}")
                 return self.create_response(
                     success=False,
                     message="I had trouble creating the plan structure. Let me try again."
@@ -245,7 +219,7 @@ Respond with ONLY valid JSON."""
             
             constraints = foundation_data.get('user_constraints', {})
             if constraints:
-                parts.append(f"Constraints: {json.dumps(constraints)}")
+                parts.append(f"Constraints: {json_utils.dumps(constraints)}")
         
         if context.current_goal:
             goal = context.current_goal
@@ -264,79 +238,6 @@ Respond with ONLY valid JSON."""
         
         return "\n".join(parts)
     
-    def _build_planning_output(self, plan_data: dict) -> PlanningOutput:
-        """Build a PlanningOutput from parsed JSON."""
-        # Build SMART goal
-        smart_data = plan_data.get("smart_goal", {})
-        smart_goal = SMARTGoal(
-            specific=smart_data.get("specific", ""),
-            measurable=smart_data.get("measurable", ""),
-            achievable=smart_data.get("achievable", ""),
-            relevant=smart_data.get("relevant", ""),
-            time_bound=smart_data.get("time_bound", "")
-        )
-        
-        # Build milestones
-        milestones = []
-        for m in plan_data.get("milestones", []):
-            tasks = []
-            for t in m.get("tasks", []):
-                try:
-                    freq = TaskFrequency(t.get("frequency", "one_time"))
-                except ValueError:
-                    freq = TaskFrequency.ONE_TIME
-                
-                tasks.append(TaskScheduleItem(
-                    title=t.get("title", ""),
-                    description=t.get("description"),
-                    frequency=freq,
-                    estimated_minutes=t.get("estimated_minutes", 30),
-                    priority=t.get("priority", "medium")
-                ))
-            
-            milestones.append(MilestoneOutput(
-                id=m.get("id", ""),
-                title=m.get("title", ""),
-                description=m.get("description"),
-                deadline=m.get("deadline"),
-                success_criteria=m.get("success_criteria", []),
-                tasks=tasks
-            ))
-        
-        # Build task schedule
-        schedule_data = plan_data.get("task_schedule", {})
-        
-        def parse_tasks(task_list):
-            result = []
-            for t in task_list:
-                try:
-                    freq = TaskFrequency(t.get("frequency", "one_time"))
-                except ValueError:
-                    freq = TaskFrequency.ONE_TIME
-                result.append(TaskScheduleItem(
-                    title=t.get("title", ""),
-                    description=t.get("description"),
-                    frequency=freq,
-                    estimated_minutes=t.get("estimated_minutes", 30),
-                    priority=t.get("priority", "medium")
-                ))
-            return result
-        
-        task_schedule = TaskSchedule(
-            daily=parse_tasks(schedule_data.get("daily", [])),
-            weekly=parse_tasks(schedule_data.get("weekly", [])),
-            monthly=parse_tasks(schedule_data.get("monthly", []))
-        )
-        
-        return PlanningOutput(
-            smart_goal=smart_goal,
-            milestones=milestones,
-            task_schedule=task_schedule,
-            dependencies=plan_data.get("dependencies", []),
-            total_estimated_hours=plan_data.get("total_estimated_hours", 0),
-            critical_path=plan_data.get("critical_path", [])
-        )
-    
     def _format_plan_message(self, output: PlanningOutput) -> str:
         """Format the plan as a readable message."""
         milestone_list = "\n".join(
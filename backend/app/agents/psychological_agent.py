@@ -17,6 +17,7 @@ from app.agents.base_agent import (
     Intervention,
     PsychologicalOutput,
 )
+from app.services import openai_clients
 
 logger = logging.getLogger(__name__)
 
@@ -92,8 +93,7 @@ class PsychologicalAgent(BaseAgent):
     
     def get_system_prompt(self) -> str:
         """Get the Psychological Agent system prompt."""
-        from app.services.ai_service import get_system_prompt
-        return get_system_prompt("psychological_system_prompt", PSYCHOLOGICAL_SYSTEM_PROMPT)
+        return openai_clients.get_system_prompt("psychological_system_prompt", PSYCHOLOGICAL_SYSTEM_PROMPT)
     
     async def process(self, context: AgentContext) -> AgentResponse:
         """
@@ -181,7 +181,7 @@ class PsychologicalAgent(BaseAgent):
         stress_level = max(1, min(10, stress_level))
         confidence_level = max(1, min(10, confidence_level))
         
-        return EmotionalAssessment(
+        return EmotionalAssessment.model_construct(
             motivation_level=motivation_level,
             stress_level=stress_level,
             confidence_level=confidence_level,
@@ -213,15 +213,19 @@ class PsychologicalAgent(BaseAgent):
         
         # Create progress celebration if applicable
         progress_celebration = ""
-        if context.task_history:
+        if context.task_summary is not None:
+            completed = context.task_summary.get("completed", 0)
+        elif context.task_history:
             completed = sum(
                 1 for t in context.task_history 
                 if t.get("status") == "completed"
             )
-            if completed > 0:
-                progress_celebration = f"✨ Remember: You've already completed {completed} tasks. That's real progress!"
+        else:
+            completed = 0
+        if completed > 0:
+            progress_celebration = f"✨ Remember: You've already completed {completed} tasks. That's real progress!"
         
-        output = PsychologicalOutput(
+        output = PsychologicalOutput.model_construct(
             emotional_assessment=assessment,
             intervention=intervention,
             affirmations=affirmations,
@@ -257,7 +261,7 @@ class PsychologicalAgent(BaseAgent):
             self.logger.error(f"Error generating encouragement: {e}")
             message = "You're doing great! Even small steps count. Keep going!"
             
-        output = PsychologicalOutput(
+        output = PsychologicalOutput.model_construct(
             emotional_assessment=assessment,
             progress_celebration="Keep moving forward!"
         )
@@ -270,7 +274,7 @@ class PsychologicalAgent(BaseAgent):
     
     def _create_stress_intervention(self) -> Intervention:
         """Create stress management intervention."""
-        return Intervention(
+        return Intervention.model_construct(
             type="STRESS_MANAGEMENT",
             technique="4-7-8 Breathing",
             message="I notice you might be feeling stressed. Let's take a moment to breathe.",
@@ -284,7 +288,7 @@ class PsychologicalAgent(BaseAgent):
     
     def _create_motivation_intervention(self) -> Intervention:
         """Create motivation boosting intervention."""
-        return Intervention(
+        return Intervention.model_construct(
             type="MOTIVATION_BOOST",
             technique="2-Minute Rule",
             message="Feeling unmotivated? Let's use a proven technique to get started.",
@@ -298,7 +302,7 @@ class PsychologicalAgent(BaseAgent):
     
     def _create_confidence_intervention(self) -> Intervention:
         """Create confidence building intervention."""
-        return Intervention(
+        return Intervention.model_construct(
             type="CONFIDENCE_BUILDING",
             technique="Past Wins Reflection",
             message="Let's remind ourselves of what you've already accomplished.",
@@ -331,7 +335,7 @@ class PsychologicalAgent(BaseAgent):
             )
         }
         
-        return Intervention(
+        return Intervention.model_construct(
             type="COGNITIVE_REFRAMING",
             technique="Thought Challenging",
             message=f"I noticed a pattern: {pattern}. Let's reframe this.",
@@ -345,7 +349,7 @@ class PsychologicalAgent(BaseAgent):
     
     def _create_general_support(self) -> Intervention:
         """Create general supportive intervention."""
-        return Intervention(
+        return Intervention.model_construct(
             type="GENERAL_SUPPORT",
             technique="Self-Compassion",
             message="Remember to be kind to yourself on this journey.",
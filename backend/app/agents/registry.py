@@ -0,0 +1,67 @@
+"""
+Agent registry for the MileSync coordinator.
+
+Maps each AgentType to its implementation and builds agents on demand.
+"""
+
+import importlib
+from collections.abc import Mapping
+from typing import Dict, Iterator, Optional, Tuple, Type
+
+from app.agents.base_agent import AgentType, BaseAgent
+
+
+# Agent implementations by type, as (module path, class name).
+AGENT_REGISTRY: Dict[AgentType, Tuple[str, str]] = {
+    AgentType.FOUNDATION: ("app.agents.foundation_agent", "FoundationAgent"),
+    AgentType.PLANNING: ("app.agents.planning_agent", "PlanningAgent"),
+    AgentType.EXECUTION: ("app.agents.execution_agent", "ExecutionAgent"),
+    AgentType.SUSTAINABILITY: ("app.agents.sustainability_agent", "SustainabilityAgent"),
+    AgentType.SUPPORT: ("app.agents.support_agent", "SupportAgent"),
+    AgentType.PSYCHOLOGICAL: ("app.agents.psychological_agent", "PsychologicalAgent"),
+}
+
+
+class LazyAgentRegistry(Mapping):
+    """
+    Read-only mapping of AgentType → agent that builds each agent on first access.
+    
+    Reason: A request usually touches one or two agents; deferring imports and
+    construction keeps coordinator start-up and idle memory low.
+    """
+    
+    def __init__(self, registry: Dict[AgentType, Tuple[str, str]]):
+        self._registry = registry
+        self._instances: Dict[AgentType, BaseAgent] = {}
+    
+    def agent_class(self, agent_type: AgentType) -> Type[BaseAgent]:
+        """Import and return the agent class without instantiating it."""
+        module_path, class_name = self._registry[agent_type]
+        return getattr(importlib.import_module(module_path), class_name)
+    
+    def __getitem__(self, agent_type: AgentType) -> BaseAgent:
+        agent = self._instances.get(agent_type)
+        if agent is None:
+            agent = self.agent_class(agent_type)()
+            self._instances[agent_type] = agent
+        return agent
+    
+    def get(self, agent_type: AgentType, default: Optional[BaseAgent] = None) -> Optional[BaseAgent]:
+        """Return the agent for agent_type (built on first access), or default."""
+        # Reason: Mapping.get goes through __getitem__ and a try/except;
+        # already-built agents are returned straight from the instance dict.
+        agent = self._instances.get(agent_type)
+        if agent is not None:
+            return agent
+        if agent_type not in self._registry:
+            return default
+        return self[agent_type]
+    
+    def __contains__(self, agent_type: object) -> bool:
+        return agent_type in self._registry
+    
+    def __iter__(self) -> Iterator[AgentType]:
+        return iter(self._registry)
+    
+    def __len__(self) -> int:
+        return len(self._registry)
@@ -0,0 +1,53 @@
+"""
+Vectorized scoring kernels for agent progress metrics.
+
+Task history is converted to NumPy arrays once per request; these kernels
+then aggregate over whole columns instead of looping over Python dicts.
+"""
+
+from datetime import date
+from typing import Tuple
+
+import numpy as np
+
+
+def completion_stats(completed: np.ndarray) -> Tuple[int, int, float]:
+    """
+    Aggregate completion counts for a set of tasks.
+
+    Args:
+        completed: Boolean array, True where the task is completed
+
+    Returns:
+        (completed_count, pending_count, completion_rate)
+    """
+    total = int(completed.size)
+    if total == 0:
+        return 0, 0, 0.0
+
+    done = int(np.count_nonzero(completed))
+    return done, total - done, done / total
+
+
+def current_streak(completion_days: np.ndarray, today: date) -> int:
+    """
+    Count consecutive days, ending today, that have at least one completion.
+
+    Args:
+        completion_days: datetime64[D] array of days with completions
+            (duplicates and future days are ignored)
+        today: The day the streak ends on
+
+    Returns:
+        Length of the streak in days (0 if nothing was completed today)
+    """
+    if completion_days.size == 0:
+        return 0
+
+    # Days back from today, unique and ascending: 0 = today, 1 = yesterday, ...
+    offsets = np.unique((np.datetime64(today, "D") - completion_days).astype(np.int64))
+    offsets = offsets[offsets >= 0]
+
+    # The streak is the length of the leading run where offsets == 0, 1, 2, ...
+    gaps = np.flatnonzero(offsets != np.arange(offsets.size))
+    return int(gaps[0]) if gaps.size else int(offsets.size)
@@ -4,10 +4,11 @@ Support Agent for MileSync.
 Handles resource curation, tool recommendations, and external support coordination.
 """
 
-import json
 import logging
 from typing import Optional
 
+from pydantic import ValidationError
+
 from app.agents.base_agent import (
     AgentContext,
     AgentResponse,
@@ -16,6 +17,7 @@ from app.agents.base_agent import (
     Resource,
     SupportOutput,
 )
+from app.services import openai_clients
 
 logger = logging.getLogger(__name__)
 
@@ -82,8 +84,7 @@ class SupportAgent(BaseAgent):
     
     def get_system_prompt(self) -> str:
         """Get the Support Agent system prompt."""
-        from app.services.ai_service import get_system_prompt
-        return get_system_prompt("support_system_prompt", SUPPORT_SYSTEM_PROMPT)
+        return openai_clients.get_system_prompt("support_system_prompt", SUPPORT_SYSTEM_PROMPT)
     
     async def process(self, context: AgentContext) -> AgentResponse:
         """
@@ -135,33 +136,16 @@ Rules:
 
 Respond with ONLY valid JSON."""
 
+        if not self.async_client:
+            return self._generate_fallback_recommendations(context)
+        
         try:
-            from app.services.ai_service import get_openai_client
-            
-            client = get_openai_client()
-            if not client:
-                return self._generate_fallback_recommendations(context)
-            
-            response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": self.get_system_prompt()},
-                    {"role": "user", "content": recommendation_prompt}
-                ],
-                temperature=0.5
-            )
-            
-            response_text = response.choices[0].message.content
-            
-            # Parse JSON response
             try:
-                if "```json" in response_text:
-                    response_text = response_text.split("```json")[1].split("```")[0]
-                elif "```" in response_text:
-                    response_text = response_text.split("```")[1].split("```")[0]
-                
-                data = json.loads(response_text.strip())
-                output = self._build_support_output(data)
+                output = await self.generate_structured_response(
+                    recommendation_prompt,
+                    SupportOutput,
+                    temperature=0.5
+                )
                 
                 return self.create_response(
                     success=True,
@@ -169,7 +153,7 @@ Respond with ONLY valid JSON."""
                     data=output.model_dump()
                 )
                 
-            except json.JSONDecodeError:
+            except ValidationError:
                 return self._generate_fallback_recommendations(context)
                 
         except Exception as e:
@@ -194,26 +178,6 @@ Respond with ONLY valid JSON."""
         
         return "\n".join(parts) or "General goal support needed"
     
-    def _build_support_output(self, data: dict) -> SupportOutput:
-        """Build SupportOutput from parsed data."""
-        resources = []
-        for r in data.get("recommended_resources", []):
-            resources.append(Resource(
-                type=r.get("type", "TOOL"),
-                name=r.get("name", ""),
-                url=r.get("url"),
-                relevance_score=float(r.get("relevance_score", 0.5)),
-                time_commitment=r.get("time_commitment"),
-                cost=r.get("cost", "Free")
-            ))
-        
-        return SupportOutput(
-            recommended_resources=resources,
-            integration_suggestions=data.get("integration_suggestions", []),
-            community_matches=data.get("community_matches", []),
-            expert_recommendations=data.get("expert_recommendations", [])
-        )
-    
     def _generate_fallback_recommendations(self, context: AgentContext) -> AgentResponse:
         """Generate fallback recommendations without LLM."""
         # Generic helpful resources
@@ -18,6 +18,7 @@ from app.agents.base_agent import (
     PatternInsights,
     SustainabilityOutput,
 )
+from app.services import openai_clients
 
 logger = logging.getLogger(__name__)
 
@@ -77,8 +78,7 @@ class SustainabilityAgent(BaseAgent):
     
     def get_system_prompt(self) -> str:
         """Get the Sustainability Agent system prompt."""
-        from app.services.ai_service import get_system_prompt
-        return get_system_prompt("sustainability_system_prompt", SUSTAINABILITY_SYSTEM_PROMPT)
+        return openai_clients.get_system_prompt("sustainability_system_prompt", SUSTAINABILITY_SYSTEM_PROMPT)
     
     async def process(self, context: AgentContext) -> AgentResponse:
         """
@@ -117,7 +117,7 @@ class SustainabilityAgent(BaseAgent):
             habit_analysis, pattern_insights, burnout_risk
         )
         
-        output = SustainabilityOutput(
+        output = SustainabilityOutput.model_construct(
             habit_analysis=habit_analysis,
             pattern_insights=pattern_insights,
             sustainability_score=sustainability_score,
@@ -134,7 +134,7 @@ class SustainabilityAgent(BaseAgent):
     def _analyze_habits(self, task_history: list) -> HabitAnalysis:
         """Analyze habit formation progress."""
         if not task_history:
-            return HabitAnalysis()
+            return HabitAnalysis.model_construct()
         
         # Group by recurring tasks
         recurring_tasks = {}
@@ -153,7 +153,7 @@ class SustainabilityAgent(BaseAgent):
             completed = [t for t in tasks if t.get("status") == "completed"]
             if len(completed) >= 7:  # At least a week of data
                 # Create habit loop suggestion
-                habit_loops.append(HabitLoop(
+                habit_loops.append(HabitLoop.model_construct(
                     cue=f"Scheduled time for {title}",
                     routine=title,
                     reward="Mark complete and see streak grow"
@@ -163,7 +163,7 @@ class SustainabilityAgent(BaseAgent):
         # Calculate habit score based on consistency
         habit_score = min(100, int((days_consistent / 90) * 100))
         
-        return HabitAnalysis(
+        return HabitAnalysis.model_construct(
             habit_score=habit_score,
             days_consistent=days_consistent,
             habit_loops=habit_loops[:3]  # Top 3 habits
@@ -172,7 +172,7 @@ class SustainabilityAgent(BaseAgent):
     def _detect_patterns(self, task_history: list) -> PatternInsights:
         """Detect performance patterns."""
         if not task_history:
-            return PatternInsights()
+            return PatternInsights.model_construct()
         
         from datetime import datetime
         from collections import Counter
@@ -208,7 +208,7 @@ class SustainabilityAgent(BaseAgent):
         if not best_days or len(day_performance) < len(best_days):
             failure_patterns.append("Inconsistent daily routine")
         
-        return PatternInsights(
+        return PatternInsights.model_construct(
             best_days=best_days,
             best_times=best_times,
             failure_patterns=failure_patterns
@@ -216,18 +216,18 @@ class SustainabilityAgent(BaseAgent):
     
     def _assess_burnout(self, context: AgentContext) -> tuple:
         """Assess burnout risk level."""
-        task_history = context.task_history or []
+        completed = context.task_columns().completed_mask()
         
         # Factors that indicate burnout
         burnout_score = 50  # Start neutral
         
         # Check completion rate trend
-        if task_history:
-            recent = task_history[-7:] if len(task_history) > 7 else task_history
-            older = task_history[-14:-7] if len(task_history) > 14 else []
+        if completed.size:
+            recent = completed[-7:]
+            older = completed[-14:-7] if completed.size > 14 else completed[:0]
             
-            recent_rate = sum(1 for t in recent if t.get("status") == "completed") / len(recent) if recent else 0
-            older_rate = sum(1 for t in older if t.get("status") == "completed") / len(older) if older else recent_rate
+            recent_rate = float(recent.mean())
+            older_rate = float(older.mean()) if older.size else recent_rate
             
             # Declining completion rate increases burnout risk
             if recent_rate < older_rate - 0.15:
@@ -0,0 +1,108 @@
+"""
+Columnar task history for MileSync agents.
+
+Streak, completion and burnout metrics scan every task; parallel NumPy
+columns turn per-dict lookups into vectorized array operations.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+
+# Task status → compact integer code used by TaskHistoryColumns.status
+TASK_STATUS_CODES: Dict[str, int] = {
+    "pending": 0,
+    "in_progress": 1,
+    "completed": 2,
+    "skipped": 3,
+}
+
+
+def _parse_timestamp(value: Any) -> Optional[datetime]:
+    """Parse an ISO timestamp (or datetime) into a naive datetime, or None."""
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value.replace(tzinfo=None)
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00")).replace(tzinfo=None)
+    except ValueError:
+        return None
+
+
+@dataclass(slots=True)
+class TaskHistoryColumns:
+    """Columnar (structure-of-arrays) view of task history rows."""
+    
+    status: np.ndarray  # int8 TASK_STATUS_CODES, -1 for unknown
+    created_at: np.ndarray  # datetime64[s], NaT when missing
+    completed_at: np.ndarray  # datetime64[s], NaT when missing
+    
+    @classmethod
+    def from_dicts(cls, rows: List[Dict[str, Any]]) -> "TaskHistoryColumns":
+        """
+        Build columns from task history dicts.
+        
+        Args:
+            rows: Task dicts with status, created_at and completed_at keys
+            
+        Returns:
+            TaskHistoryColumns with one entry per row
+        """
+        return cls(
+            status=np.fromiter(
+                (TASK_STATUS_CODES.get(r.get("status"), -1) for r in rows),
+                dtype=np.int8,
+                count=len(rows),
+            ),
+            created_at=np.array(
+                [_parse_timestamp(r.get("created_at")) for r in rows],
+                dtype="datetime64[s]",
+            ),
+            completed_at=np.array(
+                [_parse_timestamp(r.get("completed_at")) for r in rows],
+                dtype="datetime64[s]",
+            ),
+        )
+    
+    @classmethod
+    def from_columns(
+        cls,
+        status: Sequence[Any],
+        created_at: Sequence[Optional[datetime]],
+        completed_at: Sequence[Optional[datetime]],
+    ) -> "TaskHistoryColumns":
+        """
+        Build columns from parallel sequences straight off a query.
+        
+        Args:
+            status: Task statuses (TaskStatus members or their values)
+            created_at: Creation datetimes
+            completed_at: Completion datetimes (None when not completed)
+            
+        Returns:
+            TaskHistoryColumns with one entry per task
+        """
+        return cls(
+            status=np.fromiter(
+                (TASK_STATUS_CODES.get(s, -1) for s in status),
+                dtype=np.int8,
+                count=len(status),
+            ),
+            created_at=np.array(
+                [_parse_timestamp(t) for t in created_at], dtype="datetime64[s]"
+            ),
+            completed_at=np.array(
+                [_parse_timestamp(t) for t in completed_at], dtype="datetime64[s]"
+            ),
+        )
+    
+    def __len__(self) -> int:
+        return int(self.status.size)
+    
+    def completed_mask(self) -> np.ndarray:
+        """Boolean mask of completed tasks."""
+        return self.status == TASK_STATUS_CODES["completed"]
@@ -0,0 +1,24 @@
+"""
+Leaf types shared by the agents and the API schemas.
+
+Kept free of app imports so app.schemas can use them without importing
+the agent package (which imports app.services, which imports app.schemas).
+"""
+
+from enum import StrEnum
+
+
+class AgentType(StrEnum):
+    """
+    Types of agents in the MileSync system.
+    
+    Reason: StrEnum members are their own wire value (str(), format() and
+    JSON encoding all yield e.g. "foundation"), so responses can carry the
+    member itself with no per-response .value conversion.
+    """
+    FOUNDATION = "foundation"
+    PLANNING = "planning"
+    EXECUTION = "execution"
+    SUSTAINABILITY = "sustainability"
+    SUPPORT = "support"
+    PSYCHOLOGICAL = "psychological"
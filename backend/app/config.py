@@ -18,16 +18,26 @@ class Settings(BaseSettings):
 
     # Database (SQLite for local dev, PostgreSQL for production)
     DATABASE_URL: str = "sqlite:///./milesync.db"
+    DB_POOL_SIZE: int = 20  # Ignored for SQLite
+    DB_MAX_OVERFLOW: int = 40  # Ignored for SQLite
+    DB_POOL_RECYCLE: int = 3600  # Seconds before a pooled connection is replaced
+    DB_POOL_TIMEOUT: int = 30  # Seconds to wait for a free connection before erroring
 
     # Authentication
     SECRET_KEY: str = "your-secret-key-change-in-production"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 1440  # 24 hours
+    BCRYPT_ROUNDS: int = 12  # log2 work factor; each +1 doubles hashing time
 
+    # Worker threads for sync endpoints and run_in_threadpool (AnyIO default: 40)
+    THREADPOOL_SIZE: int = 100
 
 
     # OpenAI
     OPENAI_API_KEY: str = ""
+    OPENAI_MAX_RETRIES: int = 2  # Retries on 429/5xx/connection errors, with backoff (SDK default: 2)
+    CHAT_CONTEXT_MESSAGES: int = 50  # Most recent messages sent with each chat turn
+    GOAL_EXTRACTION_MESSAGES: int = 100  # Most recent messages read when finalizing a chat
 
     # Opik - LLM Observability & Evaluation
     OPIK_API_KEY: str = ""
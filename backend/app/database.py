@@ -1,34 +1,97 @@
 """Database connection and session management."""
 
+from sqlalchemy import event, text
+from sqlalchemy.orm import configure_mappers
+from sqlalchemy.pool import QueuePool, StaticPool
 from sqlmodel import Session, SQLModel, create_engine
 
 from app.config import settings
 
+is_sqlite = settings.DATABASE_URL.startswith("sqlite")
+
 # Create database engine with appropriate settings
-connect_args = {}
-if settings.DATABASE_URL.startswith("sqlite"):
+engine_kwargs = {"echo": settings.DEBUG}
+if is_sqlite:
     # Reason: SQLite needs check_same_thread=False for FastAPI
-    connect_args["check_same_thread"] = False
+    engine_kwargs["connect_args"] = {"check_same_thread": False}
+    if settings.DATABASE_URL in ("sqlite://", "sqlite:///:memory:"):
+        # In-memory databases only exist on a single shared connection
+        engine_kwargs["poolclass"] = StaticPool
+else:
+    engine_kwargs.update(
+        poolclass=QueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_pre_ping=True,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+    )
+
+engine = create_engine(settings.DATABASE_URL, **engine_kwargs)
+
+# Application-wide key for the startup DDL advisory lock (PostgreSQL only)
+DDL_LOCK_KEY = 0x4D696C65
+
 
-engine = create_engine(
-    settings.DATABASE_URL,
-    echo=settings.DEBUG,
-    connect_args=connect_args,
-)
+if is_sqlite:
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_conn, _connection_record):
+        """
+        Tune each new SQLite connection.
+
+        Reason: WAL lets readers proceed while a writer commits, instead of
+        serializing every request behind the rollback-journal lock.
+        """
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.close()
 
 
 def create_db_and_tables():
-    """Create all database tables."""
-    SQLModel.metadata.create_all(engine)
+    """
+    Create all database tables.
+
+    Existence checks and DDL share one connection and one transaction. On
+    PostgreSQL an advisory lock makes concurrently booting workers take
+    turns, so only the first creates tables and the rest find them present
+    instead of racing on CREATE TABLE.
+    """
+    with engine.begin() as conn:
+        if conn.dialect.name == "postgresql":
+            conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": DDL_LOCK_KEY})
+        SQLModel.metadata.create_all(conn)
+
+
+def warm_up_models():
+    """
+    Finish deferred model setup at startup instead of on the first request.
+
+    Reason: SQLAlchemy configures mappers lazily on the first query, and
+    Pydantic defers schemas that still had unresolved forward references;
+    doing both here keeps that one-off cost off each worker's first request.
+    """
+    configure_mappers()
+    for mapper in SQLModel._sa_registry.mappers:
+        model = mapper.class_
+        if not model.__pydantic_complete__:
+            model.model_rebuild()
 
 
 def get_db():
     """
     Dependency to get database session.
 
+    The session is synchronous: declare endpoints that only talk to the
+    database as plain ``def`` so FastAPI runs them in its threadpool, and
+    offload lookups with run_in_threadpool from endpoints that must stay
+    ``async`` to await LLM calls.
+
     Usage:
         @router.get("/")
-        async def endpoint(db: Session = Depends(get_db)):
+        def endpoint(db: Session = Depends(get_db)):
             ...
     """
     with Session(engine) as session:
@@ -0,0 +1,414 @@
+"""
+Per-item evaluators for the experiment runner.
+
+Each takes one dataset item, runs (or receives) the model output, scores
+it, prints its lines as one block, and returns a result dict, or an error
+dict if anything failed, so one bad item never aborts a run.
+
+Given a ResponseCache, live model outputs and metric scores are reused
+from earlier runs whose inputs were identical. Given a SharedCalls, items
+within one run whose inputs are identical share a single call.
+"""
+
+import asyncio
+import inspect
+import time
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from app.services.exp_stats import ScoreRow, ScoreSummary, score_columns, score_row, summarize
+from app.services.response_cache import ResponseCache
+from app.utils import json_utils
+
+# Lines held back for the experiment running in this task (None: print now)
+_output: ContextVar[Optional[List[str]]] = ContextVar("experiment_output", default=None)
+
+
+def emit(*lines: str) -> None:
+    """Print lines as one block, or hold them if this experiment is buffered."""
+    text = "\n".join(lines)
+    buffer = _output.get()
+    if buffer is None:
+        print(text)
+    else:
+        buffer.append(text)
+
+
+async def run_buffered(coro: Awaitable[Any]) -> Any:
+    """
+    Await an experiment, holding its output until it finishes.
+
+    Reason: Experiments run side by side; printing each one's log in one
+    piece keeps its progress lines and summary together. Tasks it spawns
+    inherit the buffer through their copied context.
+    """
+    buffer: List[str] = []
+    token = _output.set(buffer)
+    try:
+        return await coro
+    finally:
+        _output.reset(token)
+        print("\n".join(buffer))
+
+
+class ResultWriter:
+    """Append per-item results to a JSONL file as they complete."""
+
+    def __init__(self, path: str):
+        """
+        Open the results file for appending.
+
+        Args:
+            path: JSONL file path
+        """
+        self._file = open(path, "ab")
+
+    def write(self, record: Dict[str, Any]) -> None:
+        """
+        Write one result as a line.
+
+        Reason: Called on the event loop thread with no await inside, so
+        concurrent items never interleave partial lines and need no lock.
+        """
+        self._file.write(json_utils.dumps_bytes(record) + b"\n")
+
+    def close(self) -> None:
+        """Flush and close the file."""
+        self._file.close()
+
+    def __enter__(self) -> "ResultWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+# What record_item keeps per item: its score row, and its result dict unless streamed
+ItemOutcome = Tuple[ScoreRow, Optional[Dict[str, Any]]]
+
+
+async def record_item(
+    coro: Awaitable[Dict[str, Any]],
+    writer: Optional[ResultWriter],
+    experiment: str,
+    score_key: str,
+    expected_range: Sequence[float],
+) -> ItemOutcome:
+    """
+    Await an item's result and reduce it to its score row.
+
+    With a writer, the result is streamed to disk right away and dropped,
+    so a run holds three floats per item instead of every result dict.
+
+    Returns:
+        (score row, the result dict, or None if it was streamed)
+    """
+    result = await coro
+    row = score_row(result, score_key, expected_range)
+    if writer is None:
+        return row, result
+    # Reason: A raw integer keeps per-item timestamps cheap; readers
+    # convert it to a readable form only if they need one.
+    writer.write({"experiment": experiment, "timestamp_ns": time.time_ns(), **result})
+    return row, None
+
+
+def summarize_items(outcomes: List[ItemOutcome]) -> ScoreSummary:
+    """Summarize an experiment's items from their record_item outcomes."""
+    return summarize(*score_columns([row for row, _ in outcomes]))
+
+
+def kept_results(outcomes: List[ItemOutcome]) -> List[Dict[str, Any]]:
+    """Result dicts of a run that was not streamed to a writer."""
+    return [result for _, result in outcomes]
+
+
+class SharedCalls:
+    """Run each distinct call once per experiment and share its result."""
+
+    def __init__(self):
+        self._calls: Dict[str, asyncio.Future] = {}
+
+    async def run(self, key: str, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await compute() for the first caller with key; later callers await the same call.
+
+        Args:
+            key: Identifies the call's inputs
+            compute: Produces the value (only called once per key)
+
+        Returns:
+            The shared result (a failure is raised to every caller)
+        """
+        call = self._calls.get(key)
+        if call is None:
+            call = self._calls[key] = asyncio.ensure_future(compute())
+        # Reason: One waiter being cancelled must not cancel the call the
+        # other items sharing it are still waiting on
+        return await asyncio.shield(call)
+
+
+def dedupe_requests(
+    requests: Dict[str, Dict[str, Any]],
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, str]]:
+    """
+    Group dataset items whose model requests are identical.
+
+    Args:
+        requests: Dataset item ID -> chat.completions.create parameters
+
+    Returns:
+        (request by the first item ID of each group,
+        that first item ID for every item ID)
+    """
+    unique: Dict[str, Dict[str, Any]] = {}
+    first_by_body: Dict[bytes, str] = {}
+    representative: Dict[str, str] = {}
+    for item_id, body in requests.items():
+        first = first_by_body.setdefault(json_utils.dumps_bytes(body, sort_keys=True), item_id)
+        if first == item_id:
+            unique[item_id] = body
+        representative[item_id] = first
+    emit(f"   deduped: {len(unique)} unique / {len(requests)} total")
+    return unique, representative
+
+
+async def _cached(
+    cache: Optional[ResponseCache],
+    namespace: str,
+    key_data: Any,
+    compute: Callable[[], Awaitable[Any]],
+    shared: Optional[SharedCalls] = None,
+) -> Any:
+    """Await compute(), going through the cache and in-run sharing when given."""
+    key = ResponseCache.key(namespace, key_data)
+
+    async def lookup() -> Any:
+        if cache is None:
+            return await compute()
+        return await cache.get_or_compute(key, compute)
+
+    if shared is None:
+        return await lookup()
+    return await shared.run(key, lookup)
+
+
+async def _score(scorer, method: str, **inputs: Any) -> Dict[str, Any]:
+    """
+    Call a scorer without blocking the event loop.
+
+    Uses the scorer's ``<method>_async`` coroutine when it has one (the LLM
+    judges do). Sync-only scorers, such as local heuristics, run in a worker
+    thread so their CPU time overlaps other items' in-flight API calls.
+    """
+    async_method = getattr(scorer, f"{method}_async", None)
+    if async_method is not None and inspect.iscoroutinefunction(async_method):
+        return await async_method(**inputs)
+    return await asyncio.to_thread(getattr(scorer, method), **inputs)
+
+
+def _score_key(scorer, **inputs) -> Dict[str, Any]:
+    """Cache key data for a metric or detector call on the given inputs."""
+    return {"scorer": type(scorer).__name__, **inputs}
+
+
+async def eval_coaching_item(
+    label: str,
+    item: Dict[str, Any],
+    metric,
+    batch_result: Optional[Dict[str, Any]] = None,
+    cache: Optional[ResponseCache] = None,
+    shared: Optional[SharedCalls] = None,
+) -> Dict[str, Any]:
+    """
+    Score one coaching response; returns its result or error dict.
+
+    The response is generated live unless batch_result carries it.
+    """
+    from app.services.ai_service import generate_chat_response
+    from app.services.openai_batch import completion_message
+    from app.services.openai_clients import build_chat_request
+
+    # Reason: Items finish out of order, so each prints its lines in one call
+    # rather than interleaving with other items mid-block.
+    lines = [f"\n{label} Testing: {item['id']}", f"   User: {item['input']['user_message'][:50]}..."]
+    try:
+        # Generate AI response
+        if batch_result is None:
+            messages = [{"role": "user", "content": item['input']['user_message']}]
+            # Reason: The request body covers model, system prompt and sampling
+            ai_response = await _cached(
+                cache, "chat", build_chat_request(messages),
+                lambda: generate_chat_response(messages), shared,
+            )
+        else:
+            ai_response = completion_message(batch_result).get("content") or ""
+
+        # Evaluate response
+        inputs = {"user_input": item['input']['user_message'], "ai_response": ai_response}
+        evaluation = await _cached(
+            cache, "score", _score_key(metric, **inputs),
+            lambda: _score(metric, "score", **inputs), shared,
+        )
+
+        # Check if score is within expected range
+        expected_range = item['metadata'].get('expected_score_range', [0, 1])
+        in_range = expected_range[0] <= evaluation['score'] <= expected_range[1]
+
+        result = {
+            "id": item['id'],
+            "category": item['metadata']['category'],
+            "difficulty": item['metadata']['difficulty'],
+            "score": evaluation['score'],
+            "reason": evaluation['reason'],
+            "in_expected_range": in_range,
+            "response_preview": ai_response[:100] + "..."
+        }
+
+        status = "✅" if in_range else "⚠️"
+        lines.append(f"   {status} Score: {evaluation['score']:.2f} (expected: {expected_range})")
+        lines.append(f"   Reason: {evaluation['reason'][:60]}...")
+
+    except Exception as e:
+        lines.append(f"   ❌ Error: {str(e)}")
+        result = {"id": item['id'], "error": str(e)}
+
+    emit(*lines)
+    return result
+
+
+async def eval_frustration_item(
+    label: str,
+    item: Dict[str, Any],
+    detector,
+    cache: Optional[ResponseCache] = None,
+) -> Dict[str, Any]:
+    """Run frustration detection on one item; returns its result or error dict."""
+    lines = [
+        f"\n{label} Testing: {item['id']}",
+        f"   Expected frustration: {item['expected_output']['frustration_level']}",
+    ]
+    try:
+        inputs = {
+            "user_input": item['input']['original_question'],
+            "previous_response": item['input']['ai_response'],
+            "current_reply": item['input']['user_reply'],
+        }
+        result = await _cached(
+            cache, "score", _score_key(detector, **inputs), lambda: _score(detector, "detect", **inputs)
+        )
+
+        expected_range = item['expected_output']['score_range']
+        score = result['frustration_score']
+        in_range = expected_range[0] <= score <= expected_range[1]
+
+        test_result = {
+            "id": item['id'],
+            "expected_level": item['expected_output']['frustration_level'],
+            "detected_score": score,
+            "in_expected_range": in_range,
+            "indicators": result.get('indicators', [])
+        }
+
+        status = "✅" if in_range else "⚠️"
+        lines.append(f"   {status} Detected: {score:.2f} (expected: {expected_range})")
+
+    except Exception as e:
+        lines.append(f"   ❌ Error: {str(e)}")
+        test_result = {"id": item['id'], "error": str(e)}
+
+    emit(*lines)
+    return test_result
+
+
+async def eval_extraction_item(
+    label: str,
+    item: Dict[str, Any],
+    metric,
+    batch_result: Optional[Dict[str, Any]] = None,
+    cache: Optional[ResponseCache] = None,
+    shared: Optional[SharedCalls] = None,
+) -> Dict[str, Any]:
+    """
+    Score one extracted goal; returns its result or error dict.
+
+    The goal is extracted live unless batch_result carries the completion.
+    """
+    from app.schemas.goal import AIGoalGeneration
+    from app.services.ai_service import extract_goal_from_conversation, parse_goal_arguments
+    from app.services.openai_batch import completion_message
+    from app.services.openai_clients import build_goal_extraction_request
+
+    lines = [f"\n{label} Testing: {item['id']}"]
+    try:
+        # Extract goal from conversation
+        if batch_result is None:
+            conversation = item['input']['conversation']
+
+            async def extract() -> Optional[Dict[str, Any]]:
+                goal = await extract_goal_from_conversation(conversation)
+                return goal.model_dump() if goal else None
+
+            goal_data = await _cached(
+                cache, "goal", build_goal_extraction_request(conversation), extract, shared
+            )
+            goal = AIGoalGeneration.model_validate(goal_data) if goal_data else None
+        else:
+            tool_calls = completion_message(batch_result).get("tool_calls") or []
+            goal = None
+            if tool_calls and tool_calls[0]["function"]["name"] == "create_goal_roadmap":
+                goal = parse_goal_arguments(tool_calls[0]["function"]["arguments"])
+
+        if goal:
+            # Create summary of milestones
+            milestones_summary = ", ".join([m.title for m in goal.milestones[:5]])
+
+            # Evaluate extraction quality
+            inputs = {
+                "conversation_summary": str(item['input']['conversation']),
+                "goal_title": goal.title,
+                "goal_description": goal.description or "",
+                "goal_category": goal.category,
+                "milestones_summary": milestones_summary,
+            }
+            evaluation = await _cached(
+                cache, "score", _score_key(metric, **inputs),
+                lambda: _score(metric, "score", **inputs), shared,
+            )
+
+            # Check expected outputs
+            title_check = any(
+                kw.lower() in goal.title.lower()
+                for kw in item['expected_output'].get('goal_title_contains', [])
+            )
+            category_check = goal.category == item['expected_output'].get('category', goal.category)
+            milestone_count = len(goal.milestones)
+            milestone_range = item['expected_output'].get('milestone_count_range', [1, 10])
+            milestone_check = milestone_range[0] <= milestone_count <= milestone_range[1]
+
+            result = {
+                "id": item['id'],
+                "extracted_title": goal.title,
+                "extracted_category": goal.category,
+                "milestone_count": milestone_count,
+                "quality_score": evaluation['score'],
+                "quality_reason": evaluation['reason'],
+                "title_match": title_check,
+                "category_match": category_check,
+                "milestone_count_valid": milestone_check
+            }
+
+            lines.append(f"   Title: {goal.title}")
+            lines.append(f"   Category: {goal.category}")
+            lines.append(f"   Milestones: {milestone_count}")
+            lines.append(f"   Quality Score: {evaluation['score']:.2f}")
+        else:
+            lines.append("   ❌ Failed to extract goal")
+            result = {"id": item['id'], "error": "Extraction returned None"}
+
+    except Exception as e:
+        lines.append(f"   ❌ Error: {str(e)}")
+        result = {"id": item['id'], "error": str(e)}
+
+    emit(*lines)
+    return result
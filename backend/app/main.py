@@ -6,11 +6,14 @@ Integrated with Opik for comprehensive LLM observability and evaluation.
 import logging
 from contextlib import asynccontextmanager
 
+import anyio.to_thread
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import settings
-from app.database import create_db_and_tables
+from app.database import create_db_and_tables, warm_up_models
+from app.utils.cors import FastCORSMiddleware
+from app.utils.responses import JSONResponse
+from app.utils.routing import find_duplicate_routes
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -20,8 +23,25 @@ logger = logging.getLogger(__name__)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events."""
+    # Fail fast on a router registered twice rather than serve shadowed routes
+    duplicates = find_duplicate_routes(app.routes)
+    if duplicates:
+        raise RuntimeError(f"Duplicate routes registered: {duplicates}")
+
+    # Reason: Every DB-bound request holds a worker thread for its queries;
+    # AnyIO's default of 40 queues requests long before the pool is busy.
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_SIZE
+
     # Startup: create database tables
     create_db_and_tables()
+    try:
+        warm_up_models()
+        # Reason: FastAPI caches the schema on app.openapi_schema after the
+        # first build; building it here keeps the route/model walk off the
+        # first /openapi.json or /docs request.
+        app.openapi()
+    except Exception as e:
+        logger.warning(f"⚠️ Model warm-up failed, continuing lazily: {e}")
     
     # Configure Opik for LLM observability
     try:
@@ -37,7 +57,10 @@ async def lifespan(app: FastAPI):
         logger.error(f"❌ Failed to configure Opik: {e}")
     
     yield
-    # Shutdown: cleanup if needed
+    
+    # Shutdown: release pooled OpenAI connections
+    from app.services.openai_clients import close_openai_clients
+    await close_openai_clients()
 
 
 app = FastAPI(
@@ -45,16 +68,11 @@ app = FastAPI(
     description="AI Goal Coach - Set, track, and achieve your goals. Powered by Opik observability.",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=JSONResponse,
 )
 
-# Configure CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Configure CORS (credentials, all methods and headers; see FastCORSMiddleware)
+app.add_middleware(FastCORSMiddleware, allow_origins=["*"], expose_headers=["X-Next-Cursor"])
 
 
 @app.get("/")
@@ -89,16 +107,10 @@ from app.models import (  # noqa: F401
     UserProfile, HabitLoop, UserInsight, DailyProgress
 )
 
-# Import and include routers
-from app.routes import auth, chat, goals, dashboard, analytics, agents, admin
+# Include all API routers under /api
+from app.routes import api_router
 
-app.include_router(auth.router, prefix="/api")
-app.include_router(chat.router, prefix="/api")
-app.include_router(goals.router, prefix="/api")
-app.include_router(dashboard.router, prefix="/api")
-app.include_router(analytics.router, prefix="/api")
-app.include_router(agents.router, prefix="/api")
-app.include_router(admin.router, prefix="/api")
+app.include_router(api_router)
 
 
 
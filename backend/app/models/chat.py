@@ -1,10 +1,16 @@
 """Chat database models for AI coaching sessions."""
 
+import hashlib
 from datetime import datetime
 from enum import Enum
 from typing import Optional
 
+from pydantic import ConfigDict
 from sqlmodel import Field, SQLModel
+from sqlalchemy import Index, LargeBinary, Text, event, func
+
+from app.models.types import SmallIntEnum
+from app.utils.clock import utcnow
 
 
 class ChatStatus(str, Enum):
@@ -30,18 +36,26 @@ class ChatSession(SQLModel, table=True):
     """
 
     __tablename__ = "chat_sessions"
+    __table_args__ = (
+        # Session list is filtered by user and ordered by most recent activity
+        # (id breaks ties for keyset pagination)
+        Index("ix_chat_sessions_user_updated_id", "user_id", "updated_at", "id"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    user_id: int = Field(foreign_key="users.id", index=True)
+    user_id: int = Field(foreign_key="users.id")
     title: Optional[str] = Field(default=None, max_length=255)
-    status: ChatStatus = Field(default=ChatStatus.ACTIVE)
+    status: ChatStatus = Field(default=ChatStatus.ACTIVE, sa_type=SmallIntEnum(ChatStatus))
     goal_id: Optional[int] = Field(default=None, foreign_key="goals.id")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(
+        default_factory=utcnow, sa_column_kwargs={"server_default": func.now()}
+    )
+    updated_at: datetime = Field(
+        default_factory=utcnow,
+        sa_column_kwargs={"server_default": func.now(), "onupdate": utcnow},
+    )
 
-    class Config:
-        """Pydantic config."""
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True)
 
 
 class ChatMessage(SQLModel, table=True):
@@ -52,13 +66,42 @@ class ChatMessage(SQLModel, table=True):
     """
 
     __tablename__ = "chat_messages"
+    __table_args__ = (
+        # Messages are always read per session in (created_at, id) order
+        Index("ix_chat_messages_session_created_id", "session_id", "created_at", "id"),
+        # Exact-match lookups of previously seen messages (response cache fast path)
+        Index("ix_chat_messages_sha256_session", "content_sha256", "session_id"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    session_id: int = Field(foreign_key="chat_sessions.id", index=True)
-    role: MessageRole = Field(default=MessageRole.USER)
-    content: str = Field(max_length=10000)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-
-    class Config:
-        """Pydantic config."""
-        use_enum_values = True
+    session_id: int = Field(foreign_key="chat_sessions.id")
+    role: MessageRole = Field(default=MessageRole.USER, sa_type=SmallIntEnum(MessageRole))
+    content: str = Field(max_length=10000, sa_type=Text)
+    content_sha256: Optional[bytes] = Field(default=None, sa_type=LargeBinary(32))
+    # Reserved for semantic caching: raw float16 vector bytes (e.g. 1536 dims = 3 KB)
+    embedding: Optional[bytes] = Field(default=None, sa_type=LargeBinary)
+    created_at: datetime = Field(
+        default_factory=utcnow, sa_column_kwargs={"server_default": func.now()}
+    )
+
+    model_config = ConfigDict(use_enum_values=True)
+
+
+def content_digest(content: str) -> bytes:
+    """
+    SHA-256 digest used to match identical message content.
+
+    Args:
+        content: Message text
+
+    Returns:
+        32-byte digest
+    """
+    return hashlib.sha256(content.encode("utf-8")).digest()
+
+
+@event.listens_for(ChatMessage, "before_insert")
+@event.listens_for(ChatMessage, "before_update")
+def _set_content_sha256(_mapper, _connection, message: ChatMessage) -> None:
+    """Keep content_sha256 in sync with content on every write."""
+    message.content_sha256 = content_digest(message.content)
@@ -4,8 +4,12 @@ from datetime import date, datetime
 from enum import Enum
 from typing import Optional
 
+from pydantic import ConfigDict
 from sqlmodel import Field, SQLModel, Column
-from sqlalchemy import JSON
+from sqlalchemy import Index, func
+
+from app.models.types import JSONDocument, SmallIntEnum, gin_index
+from app.utils.clock import utcnow
 
 
 class GoalCategory(str, Enum):
@@ -66,17 +70,26 @@ class Goal(SQLModel, table=True):
     """
 
     __tablename__ = "goals"
+    __table_args__ = (
+        # Dashboard counts filter on (user_id, status); goal lists order by created_at
+        Index("ix_goals_user_status", "user_id", "status"),
+        Index("ix_goals_user_created", "user_id", "created_at"),
+        gin_index("ix_goals_obstacles_gin", "identified_obstacles"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    user_id: int = Field(foreign_key="users.id", index=True)
+    user_id: int = Field(foreign_key="users.id")
     chat_session_id: Optional[int] = Field(default=None, index=True)
     title: str = Field(max_length=255)
     description: Optional[str] = Field(default=None, max_length=2000)
-    category: GoalCategory = Field(default=GoalCategory.OTHER)
-    goal_type: GoalType = Field(default=GoalType.LONG_TERM)
+    category: GoalCategory = Field(default=GoalCategory.OTHER, sa_type=SmallIntEnum(GoalCategory))
+    goal_type: GoalType = Field(default=GoalType.LONG_TERM, sa_type=SmallIntEnum(GoalType))
     target_date: Optional[date] = Field(default=None)
-    status: GoalStatus = Field(default=GoalStatus.ACTIVE)
+    status: GoalStatus = Field(default=GoalStatus.ACTIVE, sa_type=SmallIntEnum(GoalStatus))
     progress: int = Field(default=0, ge=0, le=100)
+    # Denormalized task counters, maintained by goal_service.update_goal_progress
+    total_task_count: int = Field(default=0)
+    completed_task_count: int = Field(default=0)
     
     # Foundation Agent scores
     motivation_score: Optional[int] = Field(default=None, ge=1, le=10)
@@ -95,15 +108,18 @@ class Goal(SQLModel, table=True):
     burnout_risk: Optional[str] = Field(default="LOW", max_length=20)
     
     # JSON fields for complex data
-    identified_obstacles: Optional[dict] = Field(default=None, sa_column=Column(JSON))
-    success_criteria: Optional[dict] = Field(default=None, sa_column=Column(JSON))
+    identified_obstacles: Optional[dict] = Field(default=None, sa_column=Column(JSONDocument))
+    success_criteria: Optional[dict] = Field(default=None, sa_column=Column(JSONDocument))
     
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(
+        default_factory=utcnow, sa_column_kwargs={"server_default": func.now()}
+    )
+    updated_at: datetime = Field(
+        default_factory=utcnow,
+        sa_column_kwargs={"server_default": func.now(), "onupdate": utcnow},
+    )
 
-    class Config:
-        """Pydantic config."""
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True)
 
 
 class Milestone(SQLModel, table=True):
@@ -124,11 +140,11 @@ class Milestone(SQLModel, table=True):
     order: int = Field(default=0)
     is_completed: bool = Field(default=False)
     completed_at: Optional[datetime] = Field(default=None)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(
+        default_factory=utcnow, sa_column_kwargs={"server_default": func.now()}
+    )
 
-    class Config:
-        """Pydantic config."""
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True)
 
 
 class Task(SQLModel, table=True):
@@ -141,18 +157,23 @@ class Task(SQLModel, table=True):
     """
 
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Progress counts and upcoming tasks filter on (goal_id, status), sorted by due date
+        Index("ix_tasks_goal_status_due", "goal_id", "status", "due_date"),
+        Index("ix_tasks_milestone_created", "milestone_id", "created_at"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    milestone_id: Optional[int] = Field(default=None, foreign_key="milestones.id", index=True)
-    goal_id: int = Field(foreign_key="goals.id", index=True)
+    milestone_id: Optional[int] = Field(default=None, foreign_key="milestones.id")
+    goal_id: int = Field(foreign_key="goals.id")
     title: str = Field(max_length=255)
     description: Optional[str] = Field(default=None, max_length=1000)
     due_date: Optional[date] = Field(default=None)
-    status: TaskStatus = Field(default=TaskStatus.PENDING)
-    priority: TaskPriority = Field(default=TaskPriority.MEDIUM)
+    status: TaskStatus = Field(default=TaskStatus.PENDING, sa_type=SmallIntEnum(TaskStatus))
+    priority: TaskPriority = Field(default=TaskPriority.MEDIUM, sa_type=SmallIntEnum(TaskPriority))
     
     # Frequency and habit tracking
-    frequency: TaskFrequency = Field(default=TaskFrequency.ONE_TIME)
+    frequency: TaskFrequency = Field(default=TaskFrequency.ONE_TIME, sa_type=SmallIntEnum(TaskFrequency))
     estimated_minutes: int = Field(default=30)
     streak_count: int = Field(default=0)
     best_streak: int = Field(default=0)
@@ -165,8 +186,8 @@ class Task(SQLModel, table=True):
     habit_reward: Optional[str] = Field(default=None, max_length=500)
     
     completed_at: Optional[datetime] = Field(default=None)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(
+        default_factory=utcnow, sa_column_kwargs={"server_default": func.now()}
+    )
 
-    class Config:
-        """Pydantic config."""
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True)
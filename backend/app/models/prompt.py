@@ -1,6 +1,9 @@
 from datetime import datetime
 from typing import Optional
 from sqlmodel import Field, SQLModel
+from sqlalchemy import func
+
+from app.utils.clock import utcnow
 
 class SystemPrompt(SQLModel, table=True):
     """System prompts for AI agents."""
@@ -12,5 +15,10 @@ class SystemPrompt(SQLModel, table=True):
     description: str = Field(max_length=255)
     content: str = Field(sa_column_kwargs={"nullable": False})
     is_active: bool = Field(default=True)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(
+        default_factory=utcnow, sa_column_kwargs={"server_default": func.now()}
+    )
+    updated_at: datetime = Field(
+        default_factory=utcnow,
+        sa_column_kwargs={"server_default": func.now(), "onupdate": utcnow},
+    )
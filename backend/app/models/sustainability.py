@@ -8,8 +8,12 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
+from pydantic import ConfigDict
 from sqlmodel import Field, SQLModel, Column
-from sqlalchemy import JSON
+from sqlalchemy import func
+
+from app.models.types import JSONDocument, SmallIntEnum
+from app.utils.clock import utcnow
 
 
 class HabitStrength(str, Enum):
@@ -53,7 +57,7 @@ class HabitLoop(SQLModel, table=True):
     reward: str = Field(max_length=500)        # Immediate gratification
     
     # Tracking
-    strength: HabitStrength = Field(default=HabitStrength.FORMING)
+    strength: HabitStrength = Field(default=HabitStrength.FORMING, sa_type=SmallIntEnum(HabitStrength))
     days_tracked: int = Field(default=0)
     current_streak: int = Field(default=0)
     best_streak: int = Field(default=0)
@@ -67,12 +71,15 @@ class HabitLoop(SQLModel, table=True):
     is_active: bool = Field(default=True)
     last_performed_at: Optional[datetime] = Field(default=None)
     
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(
+        default_factory=utcnow, sa_column_kwargs={"server_default": func.now()}
+    )
+    updated_at: datetime = Field(
+        default_factory=utcnow,
+        sa_column_kwargs={"server_default": func.now(), "onupdate": utcnow},
+    )
     
-    class Config:
-        """Pydantic config."""
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True)
 
 
 class UserInsight(SQLModel, table=True):
@@ -89,7 +96,7 @@ class UserInsight(SQLModel, table=True):
     goal_id: Optional[int] = Field(default=None, foreign_key="goals.id", index=True)
     
     # Insight details
-    insight_type: InsightType = Field(default=InsightType.PATTERN)
+    insight_type: InsightType = Field(default=InsightType.PATTERN, sa_type=SmallIntEnum(InsightType))
     title: str = Field(max_length=255)
     description: str = Field(max_length=2000)
     
@@ -105,14 +112,14 @@ class UserInsight(SQLModel, table=True):
     action_taken: bool = Field(default=False)
     
     # JSON for flexible data
-    data: Optional[dict] = Field(default=None, sa_column=Column(JSON))
+    data: Optional[dict] = Field(default=None, sa_column=Column(JSONDocument))
     
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(
+        default_factory=utcnow, sa_column_kwargs={"server_default": func.now()}
+    )
     expires_at: Optional[datetime] = Field(default=None)
     
-    class Config:
-        """Pydantic config."""
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True)
 
 
 class DailyProgress(SQLModel, table=True):
@@ -129,7 +136,7 @@ class DailyProgress(SQLModel, table=True):
     goal_id: Optional[int] = Field(default=None, foreign_key="goals.id", index=True)
     
     # Date tracking (one entry per day per goal)
-    date: datetime = Field(default_factory=datetime.utcnow)
+    date: datetime = Field(default_factory=utcnow)
     
     # Task metrics
     tasks_planned: int = Field(default=0)
@@ -147,8 +154,8 @@ class DailyProgress(SQLModel, table=True):
     # Notes
     notes: Optional[str] = Field(default=None, max_length=2000)
     
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(
+        default_factory=utcnow, sa_column_kwargs={"server_default": func.now()}
+    )
     
-    class Config:
-        """Pydantic config."""
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True)
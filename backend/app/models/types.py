@@ -0,0 +1,71 @@
+"""Custom SQLAlchemy column types shared by the models."""
+
+from enum import Enum
+from typing import Any, Optional, Type
+
+from sqlalchemy import JSON, Index, SmallInteger
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.mutable import MutableDict
+from sqlalchemy.types import TypeDecorator
+
+# Reason: JSONB is stored pre-parsed on PostgreSQL (no text re-parse on every
+# read) and supports GIN indexes; other dialects (SQLite in development) keep
+# the generic JSON type. MutableDict tracks in-place edits (doc["key"] = ...)
+# so they are flushed instead of silently dropped; values that compare equal
+# to what was loaded are already left out of the UPDATE by SQLAlchemy.
+JSONDocument = MutableDict.as_mutable(JSON().with_variant(JSONB(), "postgresql"))
+
+
+def gin_index(name: str, column: str) -> Index:
+    """
+    GIN index on a JSONDocument column, created on PostgreSQL only.
+
+    Args:
+        name: Index name
+        column: Column to index
+
+    Returns:
+        Index for a model's __table_args__
+    """
+    return Index(name, column, postgresql_using="gin").ddl_if(dialect="postgresql")
+
+
+class SmallIntEnum(TypeDecorator):
+    """
+    Store a str Enum as a SMALLINT code instead of a VARCHAR/native enum.
+
+    Python code keeps using the enum members (and their string values on the
+    API); only the database representation shrinks to two bytes per column.
+
+    Reason: Codes are the members' definition order, so new members must be
+    appended at the end of the enum - reordering or removing a member would
+    remap existing rows.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class: Type[Enum]):
+        """
+        Args:
+            enum_class: Enum whose members this column stores
+        """
+        super().__init__()
+        self.enum_class = enum_class
+        self._members = tuple(enum_class)
+        self._codes = {member: code for code, member in enumerate(self._members)}
+
+    def process_bind_param(self, value: Any, dialect: Any) -> Optional[int]:
+        """Convert a member (or its string value) to its SMALLINT code."""
+        if value is None:
+            return None
+        return self._codes[self.enum_class(value)]
+
+    def process_result_value(self, value: Optional[int], dialect: Any) -> Optional[Enum]:
+        """Convert a stored SMALLINT code back to its enum member."""
+        if value is None:
+            return None
+        # Reason: SQLite databases converted in place (see
+        # migrations/enum_columns_to_smallint_sqlite.sql) keep VARCHAR
+        # affinity, so their codes come back as '0', '1', ...
+        return self._members[int(value)]
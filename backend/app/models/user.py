@@ -4,9 +4,14 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
+from pydantic import ConfigDict
 from sqlmodel import Field, SQLModel
+from sqlalchemy import event, func, inspect
 from app.config import settings
 
+from app.models.types import SmallIntEnum
+from app.utils.clock import utcnow
+
 
 class AuthProvider(str, Enum):
     """Authentication provider types."""
@@ -21,27 +26,33 @@ class User(SQLModel, table=True):
 
     id: Optional[int] = Field(default=None, primary_key=True)
     email: str = Field(unique=True, index=True, max_length=255)
+    # Normalized (stripped, lowercased) email, maintained whenever email is written.
+    # Reason: UNIQUE so a case-insensitive lookup can only ever match one account.
+    email_ci: Optional[str] = Field(default=None, unique=True, index=True, max_length=255)
     password_hash: Optional[str] = Field(default=None, max_length=255)
     name: str = Field(max_length=100)
     avatar_url: Optional[str] = Field(default=None, max_length=500)
-    auth_provider: AuthProvider = Field(default=AuthProvider.EMAIL)
+    auth_provider: AuthProvider = Field(default=AuthProvider.EMAIL, sa_type=SmallIntEnum(AuthProvider))
     is_active: bool = Field(default=True)
     is_superuser: bool = Field(default=False)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(
+        default_factory=utcnow, sa_column_kwargs={"server_default": func.now()}
+    )
+    updated_at: datetime = Field(
+        default_factory=utcnow,
+        sa_column_kwargs={"server_default": func.now(), "onupdate": utcnow},
+    )
     
     # Token quota fields for OpenAI usage limits
     token_limit: int = Field(default_factory=lambda: settings.DEFAULT_USER_QUOTA)
     tokens_used: int = Field(default=0)
     quota_reset_at: Optional[datetime] = Field(default=None)
 
-    class Config:
-        """Pydantic config."""
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True)
 
     def reset_quota_if_needed(self) -> bool:
         """Reset tokens_used if quota_reset_at has passed. Returns True if reset."""
-        if self.quota_reset_at and datetime.utcnow() >= self.quota_reset_at:
+        if self.quota_reset_at and utcnow() >= self.quota_reset_at:
             self.tokens_used = 0
             self.quota_reset_at = None
             return True
@@ -56,3 +67,35 @@ class User(SQLModel, table=True):
         """Get remaining token quota."""
         self.reset_quota_if_needed()
         return max(0, self.token_limit - self.tokens_used)
+
+
+def normalize_email(email: str) -> str:
+    """
+    Normalize an email address for case-insensitive lookups.
+
+    Args:
+        email: Email address as entered
+
+    Returns:
+        Stripped, lowercased email
+    """
+    return email.strip().lower()
+
+
+@event.listens_for(User, "before_insert")
+def _set_email_ci(_mapper, _connection, user: User) -> None:
+    """Set email_ci from email on insert."""
+    user.email_ci = normalize_email(user.email)
+
+
+@event.listens_for(User, "before_update")
+def _update_email_ci(_mapper, _connection, user: User) -> None:
+    """
+    Re-derive email_ci when email changes.
+
+    Reason: Only on an email change - accounts whose email_ci was cleared by
+    the dedupe in migrations/add_user_email_ci.sql must not have it restored
+    (and collide with the unique index) by unrelated profile updates.
+    """
+    if inspect(user).attrs.email.history.has_changes():
+        user.email_ci = normalize_email(user.email)
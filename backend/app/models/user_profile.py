@@ -8,8 +8,12 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
+from pydantic import ConfigDict
 from sqlmodel import Field, SQLModel, Column
-from sqlalchemy import JSON
+from sqlalchemy import func
+
+from app.models.types import JSONDocument, SmallIntEnum, gin_index
+from app.utils.clock import utcnow
 
 
 class LearningStyle(str, Enum):
@@ -45,14 +49,20 @@ class UserProfile(SQLModel, table=True):
     """
     
     __tablename__ = "user_profiles"
+    __table_args__ = (
+        # Containment queries over agent-derived profile traits
+        gin_index("ix_user_profiles_strengths_gin", "strengths"),
+        gin_index("ix_user_profiles_challenges_gin", "challenges"),
+        gin_index("ix_user_profiles_values_gin", "values"),
+    )
     
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: int = Field(foreign_key="users.id", index=True, unique=True)
     
     # Psychological profiling
-    learning_style: Optional[LearningStyle] = Field(default=None)
-    motivation_type: Optional[MotivationType] = Field(default=None)
-    personality_type: Optional[PersonalityType] = Field(default=None)
+    learning_style: Optional[LearningStyle] = Field(default=None, sa_type=SmallIntEnum(LearningStyle))
+    motivation_type: Optional[MotivationType] = Field(default=None, sa_type=SmallIntEnum(MotivationType))
+    personality_type: Optional[PersonalityType] = Field(default=None, sa_type=SmallIntEnum(PersonalityType))
     
     # Energy and productivity patterns
     best_time_of_day: Optional[str] = Field(default=None, max_length=50)  # morning/afternoon/evening
@@ -79,13 +89,16 @@ class UserProfile(SQLModel, table=True):
     preferred_communication_style: Optional[str] = Field(default="supportive", max_length=50)
     
     # JSON fields for flexible data
-    strengths: Optional[dict] = Field(default=None, sa_column=Column(JSON))
-    challenges: Optional[dict] = Field(default=None, sa_column=Column(JSON))
-    values: Optional[dict] = Field(default=None, sa_column=Column(JSON))
+    strengths: Optional[dict] = Field(default=None, sa_column=Column(JSONDocument))
+    challenges: Optional[dict] = Field(default=None, sa_column=Column(JSONDocument))
+    values: Optional[dict] = Field(default=None, sa_column=Column(JSONDocument))
     
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(
+        default_factory=utcnow, sa_column_kwargs={"server_default": func.now()}
+    )
+    updated_at: datetime = Field(
+        default_factory=utcnow,
+        sa_column_kwargs={"server_default": func.now(), "onupdate": utcnow},
+    )
     
-    class Config:
-        """Pydantic config."""
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True)
@@ -1,7 +1,18 @@
 # API route handlers
 
-from app.routes import auth, chat, goals, dashboard, analytics, agents
+from fastapi import APIRouter
 
-__all__ = ["auth", "chat", "goals", "dashboard", "analytics", "agents"]
+from app.routes import admin, agents, analytics, auth, chat, chat_stream, dashboard, goals
 
+# Reason: Starlette matches routes by scanning them in registration order, so
+# the highest-traffic domains (chat, goals, dashboard) are included first and
+# rarely used ones (auth, admin) last. Paths don't overlap (chat_stream only
+# adds /chat/{id}/stream), so the order never changes which route handles a
+# path.
+api_router = APIRouter(prefix="/api")
+for _module in (chat, chat_stream, goals, dashboard, agents, analytics, auth, admin):
+    api_router.include_router(_module.router)
 
+__all__ = [
+    "api_router", "admin", "agents", "analytics", "auth", "chat", "chat_stream", "dashboard", "goals",
+]
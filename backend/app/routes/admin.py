@@ -3,7 +3,6 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlmodel import Session, select
 
 from app.database import get_db
-from datetime import datetime
 from app.models.prompt import SystemPrompt
 from app.schemas.admin import UserAdminView, UserAdminUpdate, SystemPromptView, SystemPromptUpdate
 
@@ -18,12 +17,12 @@ router = APIRouter(
 )
 
 @router.get("/prompts", response_model=List[SystemPromptView])
-async def list_prompts(db: Session = Depends(get_db)):
+def list_prompts(db: Session = Depends(get_db)):
     """List all system prompts (Admin only)"""
     return db.exec(select(SystemPrompt)).all()
 
 @router.put("/prompts/{prompt_key}", response_model=SystemPromptView)
-async def update_prompt(
+def update_prompt(
     prompt_key: str,
     update: SystemPromptUpdate,
     db: Session = Depends(get_db)
@@ -34,14 +33,13 @@ async def update_prompt(
         raise HTTPException(status_code=404, detail="Prompt not found")
         
     prompt.content = update.content
-    prompt.updated_at = datetime.utcnow()
     
     db.add(prompt)
     db.commit()
     db.refresh(prompt)
     
     # Invalidate cache if implemented
-    from app.services.ai_service import clear_prompt_cache
+    from app.services.openai_clients import clear_prompt_cache
     clear_prompt_cache()
     
     return prompt
@@ -49,7 +47,7 @@ async def update_prompt(
 
 
 @router.get("/users", response_model=List[UserAdminView])
-async def list_users(
+def list_users(
     skip: int = 0,
     limit: int = 100,
     db: Session = Depends(get_db)
@@ -59,7 +57,7 @@ async def list_users(
     return users
 
 @router.put("/users/{user_id}", response_model=UserAdminView)
-async def update_user(
+def update_user(
     user_id: int,
     user_update: UserAdminUpdate,
     db: Session = Depends(get_db)
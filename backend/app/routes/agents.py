@@ -5,9 +5,11 @@ Provides endpoints for direct agent interactions and multi-agent pipelines.
 """
 
 import logging
-from typing import List, Optional
+from types import MappingProxyType
+from typing import Any, List, Mapping, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
 from sqlmodel import Session
 
@@ -15,12 +17,36 @@ from app.agents.base_agent import AgentContext, AgentType
 from app.agents.coordinator import get_agent_coordinator
 from app.database import get_db
 from app.models.user import User
+from app.schemas.agent import (
+    AgentInfoResponse,
+    AgentRouteResponse,
+    CheckinResponse,
+    DailyTasksResponse,
+    InsightsResponse,
+    IntakePipelineResponse,
+    IntakeResponse,
+    MotivationResponse,
+    PlanResponse,
+    ResourcesResponse,
+)
+from app.services import dashboard_service
+from app.services.task_history_service import (
+    load_goal_task_history_columns,
+    load_task_summary,
+)
 from app.utils.dependencies import get_current_user
+from app.utils.responses import JSONResponse
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/agents", tags=["agents"])
 
+# Reason: The coordinator is a process-wide singleton whose agents load
+# lazily, so bind it once instead of looking it up in every handler.
+# Single-agent endpoints index coordinator.agents directly; after the first
+# request that is one dict lookup on the already-built agent.
+coordinator = get_agent_coordinator()
+
 
 # Request/Response schemas
 
@@ -69,13 +95,22 @@ class MotivationRequest(BaseModel):
 
 # Helper functions
 
+# Fixed additional_context values, shared read-only across requests
+_FOUNDATION_CONTEXT = MappingProxyType({"agent_type": "foundation"})
+_PLANNING_CONTEXT = MappingProxyType({"agent_type": "planning"})
+_DAILY_SUMMARY_CONTEXT = MappingProxyType({"request_type": "daily_summary"})
+_DAILY_CHECKIN_CONTEXT = MappingProxyType({"request_type": "daily_checkin"})
+_INTAKE_PIPELINE_CONTEXT = MappingProxyType({"generate_assessment": True})
+
 def _build_context(
     user: User,
     goal_id: Optional[int] = None,
     session_id: Optional[int] = None,
     messages: Optional[List[dict]] = None,
-    additional_context: Optional[dict] = None,
-    db: Optional[Session] = None
+    additional_context: Optional[Mapping[str, Any]] = None,
+    db: Optional[Session] = None,
+    with_task_history: bool = False,
+    with_task_summary: bool = False,
 ) -> AgentContext:
     """Build an AgentContext from request data."""
     context = AgentContext(
@@ -88,36 +123,46 @@ def _build_context(
     
     # Load goal if exists
     if goal_id and db:
-        from app.models.goal import Goal
-        goal = db.get(Goal, goal_id)
-        if goal and goal.user_id == user.id:
-            context.current_goal = {
-                "id": goal.id,
-                "title": goal.title,
-                "description": goal.description,
-                "category": goal.category,
-                "target_date": str(goal.target_date) if goal.target_date else None,
-                "progress": goal.progress
-            }
+        context.current_goal = dashboard_service.get_goal_summary(db, user.id, goal_id)
+    
+    if with_task_history and goal_id and db:
+        context.set_task_history(*load_goal_task_history_columns(db, goal_id))
+    elif with_task_summary and goal_id and db:
+        # Agents that only need counts get a GROUP BY summary, not every task
+        context.task_summary = load_task_summary(db, goal_id)
     
     return context
 
 
+async def _load_context(**kwargs) -> AgentContext:
+    """
+    Build an AgentContext without blocking the event loop.
+
+    Reason: The agent endpoints must stay async to await the LLM calls, but
+    the goal and task lookups use the synchronous Session; running them in
+    the threadpool keeps other requests moving while the database answers.
+    """
+    return await run_in_threadpool(_build_context, **kwargs)
+
+
 # Endpoints
+#
+# Reason: Endpoints that pass agent output through unchanged return a
+# JSONResponse directly, so it is encoded once by orjson; their
+# response_model documents the shape without re-validating free-form data.
 
-@router.get("/info")
+@router.get("/info", response_model=AgentInfoResponse)
 async def get_agents_info(
     current_user: User = Depends(get_current_user)
 ):
     """Get information about all available agents."""
-    coordinator = get_agent_coordinator()
     return {
         "agents": coordinator.get_agent_info(),
         "total_agents": len(coordinator.agents)
     }
 
 
-@router.post("/route")
+@router.post("/route", response_model=AgentRouteResponse)
 async def route_to_agent(
     request: AgentRouteRequest,
     db: Session = Depends(get_db),
@@ -128,7 +173,7 @@ async def route_to_agent(
     
     The coordinator analyzes the context and routes to the best agent.
     """
-    context = _build_context(
+    context = await _load_context(
         user=current_user,
         goal_id=request.goal_id,
         session_id=request.session_id,
@@ -136,19 +181,18 @@ async def route_to_agent(
         db=db
     )
     
-    coordinator = get_agent_coordinator()
     response = await coordinator.route(context)
     
-    return {
+    return JSONResponse({
         "agent_type": response.agent_type,
         "success": response.success,
         "message": response.message,
         "data": response.data,
         "requires_user_input": response.requires_user_input
-    }
+    })
 
 
-@router.post("/intake")
+@router.post("/intake", response_model=IntakeResponse)
 async def start_intake(
     request: IntakeRequest,
     db: Session = Depends(get_db),
@@ -159,26 +203,25 @@ async def start_intake(
     
     Initiates a comprehensive goal exploration conversation.
     """
-    context = _build_context(
+    context = await _load_context(
         user=current_user,
         session_id=request.session_id,
         messages=[{"role": "user", "content": request.initial_message}],
-        additional_context={"agent_type": "foundation"},
+        additional_context=_FOUNDATION_CONTEXT,
         db=db
     )
     
-    coordinator = get_agent_coordinator()
     response = await coordinator.route(context)
     
-    return {
+    return JSONResponse({
         "agent_type": "foundation",
         "message": response.message,
         "data": response.data,
         "requires_user_input": response.requires_user_input
-    }
+    })
 
 
-@router.post("/plan")
+@router.post("/plan", response_model=PlanResponse)
 async def generate_plan(
     request: PlanRequest,
     db: Session = Depends(get_db),
@@ -189,11 +232,11 @@ async def generate_plan(
     
     Creates milestones, tasks, and schedules from goal information.
     """
-    context = _build_context(
+    context = await _load_context(
         user=current_user,
         messages=[{"role": "user", "content": request.goal_summary}],
         additional_context={
-            "agent_type": "planning",
+            **_PLANNING_CONTEXT,
             "previous_output": {
                 "goal_summary": request.goal_summary,
                 "goal_type": request.goal_type,
@@ -205,7 +248,6 @@ async def generate_plan(
         db=db
     )
     
-    coordinator = get_agent_coordinator()
     response = await coordinator.route(context)
     
     return {
@@ -217,7 +259,7 @@ async def generate_plan(
     }
 
 
-@router.get("/daily")
+@router.get("/daily", response_model=DailyTasksResponse)
 async def get_daily_tasks(
     goal_id: Optional[int] = None,
     db: Session = Depends(get_db),
@@ -226,35 +268,15 @@ async def get_daily_tasks(
     """
     Get daily tasks and summary from the Execution Agent.
     """
-    # Load task history
-    task_history = []
-    if goal_id:
-        from app.models.goal import Task
-        from sqlmodel import select
-        
-        statement = select(Task).where(Task.goal_id == goal_id)
-        tasks = db.exec(statement).all()
-        task_history = [
-            {
-                "id": t.id,
-                "title": t.title,
-                "status": t.status,
-                "created_at": str(t.created_at),
-                "completed_at": str(t.completed_at) if t.completed_at else None
-            }
-            for t in tasks
-        ]
-    
-    context = _build_context(
+    context = await _load_context(
         user=current_user,
         goal_id=goal_id,
-        additional_context={"request_type": "daily_summary"},
-        db=db
+        additional_context=_DAILY_SUMMARY_CONTEXT,
+        db=db,
+        with_task_history=True,
     )
-    context.task_history = task_history
     
-    coordinator = get_agent_coordinator()
-    agent = coordinator.get_agent(AgentType.EXECUTION)
+    agent = coordinator.agents[AgentType.EXECUTION]
     response = await agent.process(context)
     
     return {
@@ -265,7 +287,7 @@ async def get_daily_tasks(
     }
 
 
-@router.post("/checkin")
+@router.post("/checkin", response_model=CheckinResponse)
 async def daily_checkin(
     request: CheckinRequest,
     db: Session = Depends(get_db),
@@ -276,47 +298,29 @@ async def daily_checkin(
     
     Runs Execution → Sustainability → Psychological (if needed) pipeline.
     """
-    # Load task history
-    from app.models.goal import Task
-    from sqlmodel import select
-    
-    statement = select(Task).where(Task.goal_id == request.goal_id)
-    tasks = db.exec(statement).all()
-    task_history = [
-        {
-            "id": t.id,
-            "title": t.title,
-            "status": t.status,
-            "created_at": str(t.created_at),
-            "completed_at": str(t.completed_at) if t.completed_at else None
-        }
-        for t in tasks
-    ]
-    
     messages = []
     if request.notes:
         messages.append({"role": "user", "content": request.notes})
     
-    context = _build_context(
+    context = await _load_context(
         user=current_user,
         goal_id=request.goal_id,
         messages=messages,
-        additional_context={"request_type": "daily_checkin"},
-        db=db
+        additional_context=_DAILY_CHECKIN_CONTEXT,
+        db=db,
+        with_task_history=True,
     )
-    context.task_history = task_history
     
-    coordinator = get_agent_coordinator()
     results = await coordinator.run_daily_checkin(context)
     
-    return {
+    return JSONResponse({
         "execution": results.get("execution"),
         "sustainability": results.get("sustainability"),
         "psychological": results.get("psychological")
-    }
+    })
 
 
-@router.get("/insights")
+@router.get("/insights", response_model=InsightsResponse)
 async def get_insights(
     goal_id: Optional[int] = None,
     db: Session = Depends(get_db),
@@ -325,34 +329,14 @@ async def get_insights(
     """
     Get sustainability insights and pattern analysis.
     """
-    # Load task history
-    task_history = []
-    if goal_id:
-        from app.models.goal import Task
-        from sqlmodel import select
-        
-        statement = select(Task).where(Task.goal_id == goal_id)
-        tasks = db.exec(statement).all()
-        task_history = [
-            {
-                "id": t.id,
-                "title": t.title,
-                "status": t.status,
-                "created_at": str(t.created_at),
-                "completed_at": str(t.completed_at) if t.completed_at else None
-            }
-            for t in tasks
-        ]
-    
-    context = _build_context(
+    context = await _load_context(
         user=current_user,
         goal_id=goal_id,
-        db=db
+        db=db,
+        with_task_history=True,
     )
-    context.task_history = task_history
     
-    coordinator = get_agent_coordinator()
-    agent = coordinator.get_agent(AgentType.SUSTAINABILITY)
+    agent = coordinator.agents[AgentType.SUSTAINABILITY]
     response = await agent.process(context)
     
     return {
@@ -365,7 +349,7 @@ async def get_insights(
     }
 
 
-@router.get("/resources")
+@router.get("/resources", response_model=ResourcesResponse)
 async def get_resources(
     goal_id: Optional[int] = None,
     db: Session = Depends(get_db),
@@ -374,14 +358,13 @@ async def get_resources(
     """
     Get resource recommendations from the Support Agent.
     """
-    context = _build_context(
+    context = await _load_context(
         user=current_user,
         goal_id=goal_id,
         db=db
     )
     
-    coordinator = get_agent_coordinator()
-    agent = coordinator.get_agent(AgentType.SUPPORT)
+    agent = coordinator.agents[AgentType.SUPPORT]
     response = await agent.process(context)
     
     return {
@@ -392,7 +375,7 @@ async def get_resources(
     }
 
 
-@router.post("/motivation")
+@router.post("/motivation", response_model=MotivationResponse)
 async def get_motivation_support(
     request: MotivationRequest,
     db: Session = Depends(get_db),
@@ -401,15 +384,15 @@ async def get_motivation_support(
     """
     Get motivational support from the Psychological Agent.
     """
-    context = _build_context(
+    context = await _load_context(
         user=current_user,
         goal_id=request.goal_id,
         messages=[{"role": "user", "content": request.message}],
-        db=db
+        db=db,
+        with_task_summary=True,
     )
     
-    coordinator = get_agent_coordinator()
-    agent = coordinator.get_agent(AgentType.PSYCHOLOGICAL)
+    agent = coordinator.agents[AgentType.PSYCHOLOGICAL]
     response = await agent.process(context)
     
     return {
@@ -421,7 +404,7 @@ async def get_motivation_support(
     }
 
 
-@router.post("/pipeline/intake")
+@router.post("/pipeline/intake", response_model=IntakePipelineResponse)
 async def run_intake_pipeline(
     request: IntakeRequest,
     db: Session = Depends(get_db),
@@ -432,18 +415,17 @@ async def run_intake_pipeline(
     
     Takes initial goal description and returns complete plan.
     """
-    context = _build_context(
+    context = await _load_context(
         user=current_user,
         session_id=request.session_id,
         messages=[{"role": "user", "content": request.initial_message}],
-        additional_context={"generate_assessment": True},
+        additional_context=_INTAKE_PIPELINE_CONTEXT,
         db=db
     )
     
-    coordinator = get_agent_coordinator()
     results = await coordinator.run_intake_pipeline(context)
     
-    return {
+    return JSONResponse({
         "foundation": results.get("foundation"),
         "planning": results.get("planning")
-    }
+    })
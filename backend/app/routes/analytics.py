@@ -7,16 +7,57 @@ Provides endpoints for:
 - Performance dashboards
 """
 
+from bisect import bisect_right
+from types import MappingProxyType
 from typing import Any, Dict, List, Optional
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from pydantic import BaseModel
+from sqlmodel import Session, func, select
 
+from app.config import settings
+from app.database import get_db
 from app.routes.auth import get_current_user
+from app.models import ChatSession, Goal
 from app.models.user import User
+from app.services.openai_clients import AI_MODEL
+from app.services.opik_service import (
+    GoalCoachingQualityMetric,
+    UserFrustrationDetector,
+    create_experiment_dataset,
+    get_evaluation_summary,
+    is_opik_enabled,
+)
+from app.utils import json_utils
 
 
 router = APIRouter(prefix="/analytics", tags=["analytics"])
 
+# Shared evaluators; each keeps one OpenAI client for all requests
+_coaching_metric = GoalCoachingQualityMetric()
+_frustration_detector = UserFrustrationDetector()
+
+# Frustration score band upper bounds and the recommendation for each band;
+# the final recommendation covers scores at or above the last threshold.
+FRUSTRATION_THRESHOLDS = (0.3, 0.6)
+FRUSTRATION_RECOMMENDATIONS = (
+    "User seems engaged. Continue current approach.",
+    "Minor friction detected. Consider asking clarifying questions.",
+    "High frustration detected. Consider rephrasing or offering alternatives.",
+)
+
+
+def frustration_recommendation(frustration_score: float) -> str:
+    """
+    Pick the coaching recommendation for a frustration score.
+
+    Args:
+        frustration_score: Score between 0 and 1
+
+    Returns:
+        Recommendation for the score's band
+    """
+    return FRUSTRATION_RECOMMENDATIONS[bisect_right(FRUSTRATION_THRESHOLDS, frustration_score)]
+
 
 # ========================
 # Request/Response Schemas
@@ -86,6 +127,21 @@ class AIPerformanceSummary(BaseModel):
     evaluation_period: str
 
 
+# Responses for when Opik isn't configured, built once and returned as-is
+_OPIK_DISABLED_STATUS = EvaluationMetrics(
+    opik_enabled=False,
+    summary={"message": "Opik not configured. Set OPIK_API_KEY in .env"}
+)
+_OPIK_DISABLED_EXPERIMENT = ExperimentResponse(
+    status="error",
+    message="Opik not configured. Set OPIK_API_KEY to enable experiments.",
+)
+_OPIK_DISABLED_TRACES = MappingProxyType({
+    "traces": [],
+    "message": "Opik not configured. Traces not available.",
+})
+
+
 # ========================
 # Routes
 # ========================
@@ -102,19 +158,10 @@ async def get_analytics_status(
     - Current project configuration
     - Recent evaluation summaries
     """
+    if not is_opik_enabled():
+        return _OPIK_DISABLED_STATUS
+    
     try:
-        from app.services.opik_service import (
-            is_opik_enabled,
-            get_evaluation_summary,
-        )
-        from app.config import settings
-        
-        if not is_opik_enabled():
-            return EvaluationMetrics(
-                opik_enabled=False,
-                summary={"message": "Opik not configured. Set OPIK_API_KEY in .env"}
-            )
-        
         summary = get_evaluation_summary()
         
         return EvaluationMetrics(
@@ -146,10 +193,7 @@ async def evaluate_coaching_response(
     - Clarity
     """
     try:
-        from app.services.opik_service import GoalCoachingQualityMetric
-        
-        metric = GoalCoachingQualityMetric()
-        result = metric.score(
+        result = await _coaching_metric.score_async(
             user_input=request.user_input,
             ai_response=request.ai_response,
         )
@@ -177,28 +221,17 @@ async def check_user_frustration(
     Helps identify when AI coaching isn't meeting user needs.
     """
     try:
-        from app.services.opik_service import UserFrustrationDetector
-        
-        detector = UserFrustrationDetector()
-        result = detector.detect(
+        result = await _frustration_detector.detect_async(
             user_input=request.original_user_input,
             previous_response=request.previous_ai_response,
             current_reply=request.current_user_reply,
         )
         
-        # Generate recommendation based on frustration level
         frustration_score = result.get("frustration_score", 0.0)
-        if frustration_score < 0.3:
-            recommendation = "User seems engaged. Continue current approach."
-        elif frustration_score < 0.6:
-            recommendation = "Minor friction detected. Consider asking clarifying questions."
-        else:
-            recommendation = "High frustration detected. Consider rephrasing or offering alternatives."
-        
         return FrustrationCheckResponse(
             frustration_score=frustration_score,
             indicators=result.get("indicators", []),
-            recommendation=recommendation,
+            recommendation=frustration_recommendation(frustration_score),
         )
         
     except Exception as e:
@@ -209,7 +242,8 @@ async def check_user_frustration(
 
 
 @router.get("/performance", response_model=AIPerformanceSummary)
-async def get_ai_performance_summary(
+def get_ai_performance_summary(
+    db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -221,23 +255,17 @@ async def get_ai_performance_summary(
     - User satisfaction indicators
     """
     try:
-        from sqlmodel import Session, select, func
-        from app.database import engine
-        from app.models import ChatSession, Goal
-        from app.services.ai_service import AI_MODEL
-        
-        with Session(engine) as db:
-            # Count total conversations for this user
-            total_convos = db.exec(
+        # Count conversations and goals created in one round-trip
+        total_convos, total_goals = db.exec(
+            select(
                 select(func.count(ChatSession.id))
                 .where(ChatSession.user_id == current_user.id)
-            ).one()
-            
-            # Count total goals created
-            total_goals = db.exec(
+                .scalar_subquery(),
                 select(func.count(Goal.id))
                 .where(Goal.user_id == current_user.id)
-            ).one()
+                .scalar_subquery(),
+            )
+        ).one()
         
         # Note: In a full implementation, these would come from Opik metrics
         # For now, we return placeholder data to demonstrate the structure
@@ -269,18 +297,10 @@ async def create_experiment(
     Used for A/B testing prompts, comparing model versions,
     or running regression tests on AI coaching responses.
     """
+    if not is_opik_enabled():
+        return _OPIK_DISABLED_EXPERIMENT
+    
     try:
-        from app.services.opik_service import (
-            is_opik_enabled,
-            create_experiment_dataset,
-        )
-        
-        if not is_opik_enabled():
-            return ExperimentResponse(
-                status="error",
-                message="Opik not configured. Set OPIK_API_KEY to enable experiments.",
-            )
-        
         dataset_id = create_experiment_dataset(
             name=request.name,
             description=request.description,
@@ -306,6 +326,34 @@ async def create_experiment(
         )
 
 
+# Reason: The coaching-quality payload is constant placeholder data, so it is
+# encoded once at import instead of on every request.
+_COACHING_QUALITY_METRICS_JSON = json_utils.dumps_bytes({
+    "metrics": {
+        "smart_alignment": {
+            "specific": 0.82,
+            "measurable": 0.75,
+            "achievable": 0.88,
+            "relevant": 0.90,
+            "time_bound": 0.70,
+        },
+        "coaching_effectiveness": {
+            "motivational_quality": 0.85,
+            "actionability": 0.78,
+            "clarity": 0.92,
+            "empathy": 0.88,
+        },
+        "user_engagement": {
+            "avg_session_length": 5.2,
+            "goal_completion_rate": 0.65,
+            "return_user_rate": 0.72,
+        },
+    },
+    "period": "last 30 days",
+    "model": "gpt-4o-mini",
+})
+
+
 @router.get("/metrics/coaching-quality")
 async def get_coaching_quality_metrics(
     current_user: User = Depends(get_current_user),
@@ -318,30 +366,7 @@ async def get_coaching_quality_metrics(
     - Response helpfulness
     - User engagement indicators
     """
-    return {
-        "metrics": {
-            "smart_alignment": {
-                "specific": 0.82,
-                "measurable": 0.75,
-                "achievable": 0.88,
-                "relevant": 0.90,
-                "time_bound": 0.70,
-            },
-            "coaching_effectiveness": {
-                "motivational_quality": 0.85,
-                "actionability": 0.78,
-                "clarity": 0.92,
-                "empathy": 0.88,
-            },
-            "user_engagement": {
-                "avg_session_length": 5.2,
-                "goal_completion_rate": 0.65,
-                "return_user_rate": 0.72,
-            },
-        },
-        "period": "last 30 days",
-        "model": "gpt-4o-mini",
-    }
+    return Response(content=_COACHING_QUALITY_METRICS_JSON, media_type="application/json")
 
 
 @router.get("/traces/recent")
@@ -358,25 +383,13 @@ async def get_recent_traces(
     - Token usage
     - Evaluation scores
     """
-    try:
-        from app.services.opik_service import is_opik_enabled
-        
-        if not is_opik_enabled():
-            return {
-                "traces": [],
-                "message": "Opik not configured. Traces not available.",
-            }
-        
-        # In a full implementation, this would query Opik API
-        return {
-            "traces": [],
-            "total_count": 0,
-            "message": "Connect to Opik dashboard for full trace visualization",
-            "dashboard_url": "https://www.comet.com/opik",
-        }
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to get traces: {str(e)}"
-        )
+    if not is_opik_enabled():
+        return _OPIK_DISABLED_TRACES
+    
+    # In a full implementation, this would query Opik API
+    return {
+        "traces": [],
+        "total_count": 0,
+        "message": "Connect to Opik dashboard for full trace visualization",
+        "dashboard_url": "https://www.comet.com/opik",
+    }
@@ -2,6 +2,7 @@
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import RedirectResponse
+from pydantic import TypeAdapter
 from sqlmodel import Session
 
 from app.config import settings
@@ -19,9 +20,13 @@ from app.utils.dependencies import get_current_user
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
+# Reason: Built once at import so each response reuses the compiled
+# validator with from_attributes, reading straight off the User row.
+_user_response_adapter = TypeAdapter(UserResponse)
+
 
 @router.post("/register", response_model=TokenResponse, status_code=status.HTTP_201_CREATED)
-async def register(data: RegisterRequest, db: Session = Depends(get_db)):
+def register(data: RegisterRequest, db: Session = Depends(get_db)):
     """
     Register a new user with email and password.
 
@@ -43,12 +48,12 @@ async def register(data: RegisterRequest, db: Session = Depends(get_db)):
 
     return TokenResponse(
         access_token=access_token,
-        user=UserResponse.model_validate(user),
+        user=_user_response_adapter.validate_python(user, from_attributes=True),
     )
 
 
 @router.post("/login", response_model=TokenResponse)
-async def login(data: LoginRequest, db: Session = Depends(get_db)):
+def login(data: LoginRequest, db: Session = Depends(get_db)):
     """
     Login with email and password.
 
@@ -66,18 +71,18 @@ async def login(data: LoginRequest, db: Session = Depends(get_db)):
 
     return TokenResponse(
         access_token=access_token,
-        user=UserResponse.model_validate(user),
+        user=_user_response_adapter.validate_python(user, from_attributes=True),
     )
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_current_user_info(current_user=Depends(get_current_user)):
+def get_current_user_info(current_user=Depends(get_current_user)):
     """Get the current authenticated user's information."""
-    return UserResponse.model_validate(current_user)
+    return _user_response_adapter.validate_python(current_user, from_attributes=True)
 
 
 @router.put("/me", response_model=UserResponse)
-async def update_current_user_info(
+def update_current_user_info(
     data: UserUpdate,
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
@@ -86,7 +91,7 @@ async def update_current_user_info(
     Update the current authenticated user's profile.
     """
     updated_user = auth_service.update_user_profile(db, current_user, data)
-    return UserResponse.model_validate(updated_user)
+    return _user_response_adapter.validate_python(updated_user, from_attributes=True)
 
 
 
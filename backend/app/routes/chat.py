@@ -4,15 +4,18 @@ Integrated with Opik for automatic evaluation and observability.
 """
 
 import logging
-import uuid
 from datetime import datetime
-from typing import List, Union
+from typing import List, Optional, Tuple, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.concurrency import run_in_threadpool
+from pydantic import TypeAdapter
+from sqlalchemy import and_, delete, or_
 from sqlmodel import Session, select, func
 
+from app.config import settings
 from app.database import get_db
-from app.models.chat import ChatMessage, ChatSession, ChatStatus, MessageRole
+from app.models.chat import ChatMessage, ChatSession, MessageRole
 from app.models.user import User
 from app.schemas.chat import (
     ChatListItem,
@@ -26,17 +29,40 @@ from app.schemas.chat import (
     StartChatResponse,
 )
 from app.schemas.goal import FinalizeWithGoalResponse, GoalResponse
-from app.services import ai_service, goal_service
-from app.services.quota_service import check_user_quota, track_openai_usage
+from app.services import ai_service, chat_service, dashboard_service
+from app.utils.cursors import decode_cursor, encode_cursor
 from app.utils.dependencies import get_current_user
+from app.utils.ids import generate_trace_id
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/chat", tags=["chat"])
 
+# Largest page a client may request from the paginated list endpoints
+MAX_PAGE_SIZE = 100
+
+# Reason: Built once at import so list responses validate in one call with
+# a compiled validator instead of one model_validate per row. The two read
+# endpoints also serialize with the same adapter and return the bytes as a
+# Response, which skips FastAPI's second response_model validation pass
+# (response_model is kept for the OpenAPI schema).
+_chat_list_adapter = TypeAdapter(List[ChatListItem])
+_session_with_messages_adapter = TypeAdapter(ChatSessionWithMessages)
+
+
+def _decode_cursor_or_400(cursor: str) -> Tuple[datetime, int]:
+    """Decode a pagination cursor, rejecting malformed ones with a 400."""
+    try:
+        return decode_cursor(cursor)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
 
 @router.post("/start", response_model=StartChatResponse, status_code=status.HTTP_201_CREATED)
-async def start_chat(
+def start_chat(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -45,11 +71,10 @@ async def start_chat(
 
     Creates a new session and returns the initial AI greeting message.
     """
-    # Create new session
+    # Create new session; flush assigns its ID for the greeting's foreign key
     session = ChatSession(user_id=current_user.id)
     db.add(session)
-    db.commit()
-    db.refresh(session)
+    db.flush()
 
     # Create initial assistant message
     initial_content = ai_service.generate_initial_message()
@@ -59,75 +84,104 @@ async def start_chat(
         content=initial_content,
     )
     db.add(message)
-    db.commit()
-    db.refresh(message)
+    db.flush()
 
-    return StartChatResponse(
+    # Reason: Serialize before the commit expires both instances, so one
+    # commit replaces two commit + refresh cycles.
+    response = StartChatResponse(
         session=ChatSessionResponse.model_validate(session),
         initial_message=MessageResponse.model_validate(message),
     )
+    db.commit()
+    return response
 
 
 @router.get("/sessions", response_model=List[ChatListItem])
-async def list_sessions(
+def list_sessions(
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """
-    List all chat sessions for the current user.
+    List chat sessions for the current user.
 
-    Returns sessions sorted by most recent first.
+    Returns sessions sorted by most recent first. Without ``limit`` every
+    session is returned; with it, one page is returned and, if more remain,
+    an ``X-Next-Cursor`` header carries the ``cursor`` for the next page.
     """
-    # Get sessions with message counts
+    # Reason: One statement instead of two queries per session: message
+    # counts come from a grouped subquery, and the preview from a correlated
+    # subquery served by the (session_id, created_at, id) index that reads only
+    # the first 100 characters of the latest message.
+    counts = (
+        select(ChatMessage.session_id, func.count(ChatMessage.id).label("message_count"))
+        .group_by(ChatMessage.session_id)
+        .subquery()
+    )
+    preview = (
+        select(func.substr(ChatMessage.content, 1, 100))
+        .where(ChatMessage.session_id == ChatSession.id)
+        .order_by(ChatMessage.created_at.desc(), ChatMessage.id.desc())
+        .limit(1)
+        .correlate(ChatSession)
+        .scalar_subquery()
+    )
     statement = (
-        select(ChatSession)
+        select(
+            ChatSession.id,
+            ChatSession.title,
+            ChatSession.status,
+            func.coalesce(counts.c.message_count, 0).label("message_count"),
+            preview.label("last_message_preview"),
+            ChatSession.created_at,
+            ChatSession.updated_at,
+        )
+        .outerjoin(counts, counts.c.session_id == ChatSession.id)
         .where(ChatSession.user_id == current_user.id)
-        .order_by(ChatSession.updated_at.desc())
+        .order_by(ChatSession.updated_at.desc(), ChatSession.id.desc())
     )
-    sessions = db.exec(statement).all()
-
-    result = []
-    for session in sessions:
-        # Get message count
-        count_stmt = (
-            select(func.count(ChatMessage.id))
-            .where(ChatMessage.session_id == session.id)
-        )
-        message_count = db.exec(count_stmt).one()
-
-        # Get last message preview
-        last_msg_stmt = (
-            select(ChatMessage)
-            .where(ChatMessage.session_id == session.id)
-            .order_by(ChatMessage.created_at.desc())
-            .limit(1)
-        )
-        last_message = db.exec(last_msg_stmt).first()
-        preview = last_message.content[:100] if last_message else None
-
-        result.append(ChatListItem(
-            id=session.id,
-            title=session.title,
-            status=session.status,
-            message_count=message_count,
-            last_message_preview=preview,
-            created_at=session.created_at,
-            updated_at=session.updated_at,
+    if cursor:
+        after_updated_at, after_id = _decode_cursor_or_400(cursor)
+        statement = statement.where(or_(
+            ChatSession.updated_at < after_updated_at,
+            and_(ChatSession.updated_at == after_updated_at, ChatSession.id < after_id),
         ))
-
-    return result
+    if limit:
+        # Reason: Fetch one extra row to learn whether another page exists
+        statement = statement.limit(limit + 1)
+
+    # Labeled rows expose each column as an attribute named like the field
+    result = _chat_list_adapter.validate_python(db.exec(statement).all(), from_attributes=True)
+
+    headers = {}
+    if limit and len(result) > limit:
+        result = result[:limit]
+        headers["X-Next-Cursor"] = encode_cursor(result[-1].updated_at, result[-1].id)
+
+    return Response(
+        content=_chat_list_adapter.dump_json(result),
+        media_type="application/json",
+        headers=headers,
+    )
 
 
 @router.get("/{session_id}", response_model=ChatSessionWithMessages)
-async def get_session(
+def get_session(
     session_id: int,
+    cursor: Optional[int] = None,
+    limit: Optional[int] = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """
-    Get a chat session with all its messages.
+    Get a chat session with its messages.
 
-    Returns the session metadata and full message history.
+    Returns the session metadata and its messages in chronological order.
+    Without ``limit`` the full history is returned. With it, only the
+    ``limit`` newest messages (older than message ID ``cursor``, if given)
+    are returned; ``has_more`` and ``next_cursor`` tell the client how to
+    load the preceding page when scrolling up.
     """
     # Get session
     session = db.get(ChatSession, session_id)
@@ -146,16 +200,30 @@ async def get_session(
         )
 
     # Get messages
-    statement = (
-        select(ChatMessage)
-        .where(ChatMessage.session_id == session_id)
-        .order_by(ChatMessage.created_at)
+    statement = select(ChatMessage).where(ChatMessage.session_id == session_id)
+    has_more = False
+    if limit:
+        if cursor:
+            statement = statement.where(ChatMessage.id < cursor)
+        # Newest page first, plus one row to learn whether older ones remain
+        messages = db.exec(statement.order_by(ChatMessage.id.desc()).limit(limit + 1)).all()
+        has_more = len(messages) > limit
+        messages = messages[:limit][::-1]
+    else:
+        messages = db.exec(statement.order_by(ChatMessage.created_at)).all()
+
+    result = _session_with_messages_adapter.validate_python(
+        {
+            "session": session,
+            "messages": messages,
+            "has_more": has_more,
+            "next_cursor": messages[0].id if has_more else None,
+        },
+        from_attributes=True,
     )
-    messages = db.exec(statement).all()
-
-    return ChatSessionWithMessages(
-        session=ChatSessionResponse.model_validate(session),
-        messages=[MessageResponse.model_validate(m) for m in messages],
+    return Response(
+        content=_session_with_messages_adapter.dump_json(result),
+        media_type="application/json",
     )
 
 
@@ -169,110 +237,26 @@ async def send_message(
     """
     Send a message in a chat session.
 
-    Saves the user message, generates AI response, and returns both.
+    Saves the user message, generates the AI response, saves it and
+    returns both.
     """
-    # Get session
-    session = db.get(ChatSession, session_id)
-
-    if not session:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Chat session not found",
-        )
-
-    # Verify ownership
-    if session.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Access denied",
-        )
-
-    # Check session is active
-    if session.status != ChatStatus.ACTIVE:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Cannot send messages to a completed session",
-        )
-
-    # Save user message
-    user_message = ChatMessage(
-        session_id=session_id,
-        role=MessageRole.USER,
-        content=data.content,
+    # Reason: start_turn releases the DB connection, detaching current_user
+    user_id = current_user.id
+    goal_id, user_message, history, current_goal = await run_in_threadpool(
+        chat_service.start_turn, db, session_id, user_id, data.content
     )
-    db.add(user_message)
-    db.commit()
-    db.refresh(user_message)
 
-    # Get conversation history for context
-    statement = (
-        select(ChatMessage)
-        .where(ChatMessage.session_id == session_id)
-        .order_by(ChatMessage.created_at)
-    )
-    messages = db.exec(statement).all()
-
-    # Generate AI response
-    ai_response = None
+    # Generate AI response: the agent system first, the plain AI service as fallback
     token_usage = None
-    
-    try:
-        # Try to use Agent System
-        from app.agents.coordinator import get_agent_coordinator
-        from app.agents.base_agent import AgentContext
-        
-        coordinator = get_agent_coordinator()
-        
-        # Prepare context
-        context_messages = [
-            {"role": m.role, "content": m.content}
-            for m in messages
-        ]
-        
-        # Get goal info if available
-        current_goal = None
-        if session.goal_id:
-            from app.models.goal import Goal
-            goal = db.get(Goal, session.goal_id)
-            if goal:
-                current_goal = goal.model_dump()
-        
-        agent_context = AgentContext(
-            user_id=current_user.id,
-            goal_id=session.goal_id,
-            session_id=session_id,
-            messages=context_messages,
-            current_goal=current_goal,
-            additional_context={"request_type": None}  # Allow routing to infer
-        )
-        
-        # Route request
-        agent_response = await coordinator.route(agent_context)
-        
-        if agent_response.success and agent_response.message:
-            ai_response = agent_response.message
-            # Combine generic message with specific output if available
-            if agent_response.agent_type == "psychological" and agent_response.data:
-                 pass # Message is already formatted by agent
-        else:
-            # Fallback if agent failed silently
-            logger.warning(f"Agent returned failure: {agent_response.message}")
-            raise Exception("Agent system did not produce response")
-            
-    except Exception as e:
-        logger.warning(f"Falling back to legacy AI service: {e}")
-        # Legacy AI service fallback
+    ai_response = await chat_service.generate_agent_reply(
+        user_id, session_id, goal_id, history, current_goal
+    )
+    if ai_response is None:
         try:
-            # Format for OpenAI
-            message_history = [
-                {"role": m.role, "content": m.content}
-                for m in messages
-            ]
-            
             # Check quota before making API call
-            check_user_quota(db, current_user.id)
+            await run_in_threadpool(chat_service.check_quota, db, user_id)
             
-            ai_response, token_usage = await ai_service.generate_chat_response_with_usage(message_history)
+            ai_response, token_usage = await ai_service.generate_chat_response_with_usage(history)
         except ValueError:
             ai_response = (
                 "I apologize, but I'm currently unable to process your request. "
@@ -286,40 +270,24 @@ async def send_message(
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="AI service temporarily unavailable",
             )
-    
-    # Track token usage separately - don't fail the request if tracking fails
-    if token_usage:
-        try:
-            usage_info = track_openai_usage(db, current_user.id, token_usage)
-            logger.info(f"User {current_user.id} token usage: {usage_info.get('tokens_used_this_call', 0)} tokens")
-        except Exception as e:
-            logger.warning(f"Failed to track token usage: {type(e).__name__}: {e}")
-
-    # Save assistant message
-    assistant_message = ChatMessage(
-        session_id=session_id,
-        role=MessageRole.ASSISTANT,
-        content=ai_response,
-    )
-    db.add(assistant_message)
 
-    # Update session timestamp
-    session.updated_at = datetime.utcnow()
-    db.add(session)
-    db.commit()
-    db.refresh(assistant_message)
+    turn = await run_in_threadpool(
+        chat_service.save_turn, db, session_id, user_id, user_message, ai_response, token_usage
+    )
 
     # Log evaluation to Opik (async, non-blocking)
     try:
         from app.services.opik_service import log_chat_evaluation, is_opik_enabled
         if is_opik_enabled():
-            trace_id = str(uuid.uuid4())
-            evaluation_result = log_chat_evaluation(
+            trace_id = generate_trace_id()
+            # Reason: The evaluation runs blocking LLM-judge calls
+            evaluation_result = await run_in_threadpool(
+                log_chat_evaluation,
                 trace_id=trace_id,
                 user_input=data.content,
                 ai_response=ai_response,
                 session_id=session_id,
-                user_id=current_user.id,
+                user_id=user_id,
             )
             if evaluation_result:
                 logger.info(
@@ -329,10 +297,21 @@ async def send_message(
         # Non-blocking - don't fail the request if logging fails
         logger.warning(f"Failed to log chat evaluation: {e}")
 
-    return SendMessageResponse(
-        user_message=MessageResponse.model_validate(user_message),
-        assistant_message=MessageResponse.model_validate(assistant_message),
+    return turn
+
+
+def _load_finalizable(
+    db: Session,
+    session_id: int,
+    user_id: int,
+) -> Tuple[ChatSession, List[dict]]:
+    """Fetch an active session and its recent history, then free the connection."""
+    session = chat_service.get_active_session(
+        db, session_id, user_id, "Session already finalized"
     )
+    history = chat_service.get_recent_history(db, session_id, settings.GOAL_EXTRACTION_MESSAGES)
+    chat_service.release_connection(db)
+    return session, history
 
 
 @router.post("/{session_id}/finalize", response_model=FinalizeWithGoalResponse)
@@ -347,45 +326,19 @@ async def finalize_session(
 
     Uses AI to extract structured goal data with milestones and tasks.
     """
-    # Get session
-    session = db.get(ChatSession, session_id)
-
-    if not session:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Chat session not found",
-        )
-
-    # Verify ownership
-    if session.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Access denied",
-        )
-
-    if session.status != ChatStatus.ACTIVE:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Session already finalized",
-        )
-
-    # Get messages for goal extraction
-    statement = (
-        select(ChatMessage)
-        .where(ChatMessage.session_id == session_id)
-        .order_by(ChatMessage.created_at)
+    # Reason: _load_finalizable releases the DB connection, detaching current_user
+    user_id = current_user.id
+    session, message_history = await run_in_threadpool(
+        _load_finalizable, db, session_id, user_id
     )
-    messages = db.exec(statement).all()
 
-    if len(messages) < 2:
+    if len(message_history) < 2:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Not enough conversation to create a goal. Please discuss your goal more.",
         )
 
     # Extract goal using AI
-    message_history = [{"role": m.role, "content": m.content} for m in messages]
-
     try:
         goal_data = await ai_service.extract_goal_from_conversation(message_history)
     except Exception as e:
@@ -400,28 +353,20 @@ async def finalize_session(
             detail="Could not extract a clear goal from the conversation. Please provide more details about your goal.",
         )
 
-    # Create goal with milestones and tasks
-    goal = goal_service.create_goal_from_ai(
-        db=db,
-        user_id=current_user.id,
-        chat_session_id=session_id,
-        data=goal_data,
+    # Create goal with milestones and tasks, then close the session
+    goal = await run_in_threadpool(
+        chat_service.finalize, db, session, user_id, goal_data
     )
-
-    # Update session
-    session.status = ChatStatus.FINALIZED
-    session.title = goal.title
-    session.goal_id = goal.id
-    session.updated_at = datetime.utcnow()
-    db.add(session)
-    db.commit()
-    db.refresh(session)
+    dashboard_service.invalidate_dashboard_stats(user_id)
+    dashboard_service.invalidate_goal_summary(user_id, goal.id)
+    from app.agents.coordinator import get_agent_coordinator
+    get_agent_coordinator().invalidate_user(user_id)
 
     # Log goal extraction evaluation to Opik
     try:
         from app.services.opik_service import log_goal_extraction_evaluation, is_opik_enabled
         if is_opik_enabled():
-            trace_id = str(uuid.uuid4())
+            trace_id = generate_trace_id()
             
             # Convert goal_data to dict for logging
             goal_dict = {
@@ -434,11 +379,12 @@ async def finalize_session(
                 ]
             }
             
-            extraction_result = log_goal_extraction_evaluation(
+            extraction_result = await run_in_threadpool(
+                log_goal_extraction_evaluation,
                 trace_id=trace_id,
                 conversation=message_history,
                 goal_data=goal_dict,
-                user_id=current_user.id,
+                user_id=user_id,
             )
             if extraction_result:
                 logger.info(
@@ -454,7 +400,7 @@ async def finalize_session(
 
 
 @router.delete("/{session_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_session(
+def delete_session(
     session_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -478,11 +424,8 @@ async def delete_session(
             detail="Access denied",
         )
 
-    # Delete messages first
-    statement = select(ChatMessage).where(ChatMessage.session_id == session_id)
-    messages = db.exec(statement).all()
-    for message in messages:
-        db.delete(message)
+    # Delete messages first, in one statement without loading them
+    db.exec(delete(ChatMessage).where(ChatMessage.session_id == session_id))
 
     # Delete session
     db.delete(session)
@@ -0,0 +1,91 @@
+"""Streaming chat route: AI replies pushed to the client as Server-Sent Events."""
+
+import logging
+from typing import AsyncIterator
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlmodel import Session
+
+from app.database import get_db
+from app.models.user import User
+from app.schemas.chat import SendMessageRequest
+from app.services import ai_service, chat_service
+from app.utils import json_utils
+from app.utils.dependencies import get_current_user
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/chat", tags=["chat"])
+
+
+def _sse(event: str, data: str) -> bytes:
+    """Format one Server-Sent Event."""
+    return f"event: {event}\ndata: {data}\n\n".encode()
+
+
+@router.post("/{session_id}/stream")
+async def stream_message(
+    session_id: int,
+    data: SendMessageRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Send a message and stream the AI reply as Server-Sent Events.
+
+    Emits ``delta`` events ({"content": fragment}) as the reply is generated,
+    then one ``done`` event carrying the saved messages in the
+    SendMessageResponse shape, or an ``error`` event ({"detail": ...}). The
+    user message is saved before streaming starts; the reply is saved only
+    once complete, so a client that disconnects mid-stream leaves no
+    partial reply.
+
+    Like /message, the agent system answers first. Agents return whole
+    replies, so theirs arrives as a single delta; only the plain AI service
+    fallback streams token by token.
+    """
+    user_id = current_user.id
+    goal_id, user_message, history, current_goal = await run_in_threadpool(
+        chat_service.start_turn, db, session_id, user_id, data.content
+    )
+    await run_in_threadpool(chat_service.check_quota, db, user_id)
+
+    async def events() -> AsyncIterator[bytes]:
+        usage: dict = {}
+        parts = []
+        agent_reply = await chat_service.generate_agent_reply(
+            user_id, session_id, goal_id, history, current_goal
+        )
+        try:
+            if agent_reply is not None:
+                parts.append(agent_reply)
+                yield _sse("delta", json_utils.dumps({"content": agent_reply}))
+            else:
+                async for delta in ai_service.generate_chat_response_stream(history, usage):
+                    parts.append(delta)
+                    yield _sse("delta", json_utils.dumps({"content": delta}))
+        except HTTPException as e:
+            yield _sse("error", json_utils.dumps({"detail": e.detail}))
+            return
+        except ValueError:
+            yield _sse("error", json_utils.dumps({"detail": "AI service is not configured"}))
+            return
+        except Exception as e:
+            logger.error(f"AI stream error: {type(e).__name__}: {e}")
+            yield _sse("error", json_utils.dumps({"detail": "AI service temporarily unavailable"}))
+            return
+
+        # Reason: FastAPI has already run get_db's teardown by the time the
+        # body streams; a closed Session checks out a new connection on use.
+        done = await run_in_threadpool(
+            chat_service.save_turn, db, session_id, user_id, user_message, "".join(parts), usage or None
+        )
+        yield _sse("done", done.model_dump_json())
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
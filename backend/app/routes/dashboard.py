@@ -1,20 +1,19 @@
 """Dashboard routes for user statistics and overview."""
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 from sqlmodel import Session
 
 from app.database import get_db
 from app.models.user import User
 from app.schemas.goal import DashboardStats
-from app.services import goal_service
-from app.services.quota_service import get_user_quota_info
+from app.services import dashboard_service
 from app.utils.dependencies import get_current_user
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 
 
 @router.get("/stats", response_model=DashboardStats)
-async def get_dashboard_stats(
+def get_dashboard_stats(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -23,11 +22,12 @@ async def get_dashboard_stats(
 
     Returns active goals count, completed tasks, streak, and upcoming tasks.
     """
-    return goal_service.get_dashboard_stats(db, current_user.id)
+    return dashboard_service.get_dashboard_stats(db, current_user.id)
 
 
 @router.get("/quota")
-async def get_quota_status(
+def get_quota_status(
+    response: Response,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -41,5 +41,7 @@ async def get_quota_status(
         - quota_reset_at: When quota resets
         - usage_percentage: Percentage of quota used
     """
-    return get_user_quota_info(db, current_user.id)
+    # Quota is already cached server-side for this long; let the browser reuse it too
+    response.headers["Cache-Control"] = "private, max-age=10"
+    return dashboard_service.get_quota_info(db, current_user.id)
 
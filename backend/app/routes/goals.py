@@ -3,10 +3,12 @@
 from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import inspect
 from sqlmodel import Session
 
+from app.agents.coordinator import get_agent_coordinator
 from app.database import get_db
-from app.models.goal import Goal, Task, TaskStatus
+from app.models.goal import Goal, Milestone, Task, TaskStatus
 from app.models.user import User
 from app.schemas.goal import (
     GoalCreate,
@@ -21,14 +23,54 @@ from app.schemas.goal import (
     TaskResponse,
     TaskUpdate,
 )
-from app.services import goal_service
+from app.services import dashboard_service, goal_service
 from app.utils.dependencies import get_current_user
 
 router = APIRouter(prefix="/goals", tags=["goals"])
 
 
+def _invalidate_caches(user: User, goal_id: int) -> None:
+    """
+    Drop the user's cached dashboard stats, goal summary and agent responses after a committed change.
+
+    Reason: The commit expired current_user; its identity key still holds
+    the ID, so reading it from there avoids a reload query.
+    """
+    user_id = inspect(user).identity[0]
+    dashboard_service.invalidate_dashboard_stats(user_id)
+    dashboard_service.invalidate_goal_summary(user_id, goal_id)
+    get_agent_coordinator().invalidate_user(user_id)
+
+
+def _get_task_or_404(db: Session, goal_id: int, task_id: int, user_id: int) -> Task:
+    """Fetch a task of the user's goal, or raise 404."""
+    task = goal_service.get_task_for_user(db, goal_id, task_id, user_id)
+    if not task:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Task not found",
+        )
+    return task
+
+
+def _get_milestone_or_404(
+    db: Session,
+    goal_id: int,
+    milestone_id: int,
+    user_id: int,
+) -> Milestone:
+    """Fetch a milestone of the user's goal, or raise 404."""
+    milestone = goal_service.get_milestone_for_user(db, goal_id, milestone_id, user_id)
+    if not milestone:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Milestone not found",
+        )
+    return milestone
+
+
 @router.get("", response_model=List[GoalListItem])
-async def list_goals(
+def list_goals(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -41,7 +83,7 @@ async def list_goals(
 
 
 @router.post("", response_model=GoalResponse, status_code=status.HTTP_201_CREATED)
-async def create_goal(
+def create_goal(
     data: GoalCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -52,11 +94,12 @@ async def create_goal(
     For goals created through chat, use the /chat/{id}/finalize endpoint.
     """
     goal = goal_service.create_goal(db, current_user.id, data)
+    _invalidate_caches(current_user, goal.id)
     return GoalResponse.model_validate(goal)
 
 
 @router.get("/{goal_id}", response_model=GoalWithMilestones)
-async def get_goal(
+def get_goal(
     goal_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -78,7 +121,7 @@ async def get_goal(
 
 
 @router.put("/{goal_id}", response_model=GoalResponse)
-async def update_goal(
+def update_goal(
     goal_id: int,
     data: GoalUpdate,
     db: Session = Depends(get_db),
@@ -96,11 +139,12 @@ async def update_goal(
         )
 
     updated_goal = goal_service.update_goal(db, goal, data)
+    _invalidate_caches(current_user, goal_id)
     return GoalResponse.model_validate(updated_goal)
 
 
 @router.delete("/{goal_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_goal(
+def delete_goal(
     goal_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
@@ -117,6 +161,7 @@ async def delete_goal(
         )
 
     goal_service.delete_goal(db, goal)
+    _invalidate_caches(current_user, goal_id)
 
 
 # ===================
@@ -125,7 +170,7 @@ async def delete_goal(
 
 
 @router.put("/{goal_id}/tasks/{task_id}", response_model=TaskResponse)
-async def update_task(
+def update_task(
     goal_id: int,
     task_id: int,
     data: TaskUpdate,
@@ -137,56 +182,14 @@ async def update_task(
 
     Commonly used to mark tasks as completed.
     """
-    # Verify goal ownership first
-    goal = goal_service.get_goal_by_id(db, goal_id, current_user.id)
-    if not goal:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Goal not found",
-        )
-
-    task = db.get(Task, task_id)
-    if not task or task.goal_id != goal_id:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Task not found",
-        )
-
-    # Update task fields
-    update_data = data.model_dump(exclude_unset=True)
-
-    # Handle status change specially to update progress
-    if "status" in update_data:
-        updated_task = goal_service.update_task_status(
-            db, task_id, current_user.id, update_data["status"]
-        )
-        if not updated_task:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Task not found",
-            )
-        # Apply other updates if any
-        del update_data["status"]
-        if update_data:
-            for key, value in update_data.items():
-                setattr(updated_task, key, value)
-            db.add(updated_task)
-            db.commit()
-            db.refresh(updated_task)
-        return TaskResponse.model_validate(updated_task)
-
-    # Non-status updates
-    for key, value in update_data.items():
-        setattr(task, key, value)
-    db.add(task)
-    db.commit()
-    db.refresh(task)
-
+    task = _get_task_or_404(db, goal_id, task_id, current_user.id)
+    task = goal_service.update_task(db, task, data.model_dump(exclude_unset=True))
+    _invalidate_caches(current_user, goal_id)
     return TaskResponse.model_validate(task)
 
 
 @router.post("/{goal_id}/tasks/{task_id}/complete", response_model=TaskResponse)
-async def complete_task(
+def complete_task(
     goal_id: int,
     task_id: int,
     db: Session = Depends(get_db),
@@ -197,29 +200,14 @@ async def complete_task(
 
     Convenience endpoint for quickly completing tasks.
     """
-    # Verify goal ownership
-    goal = goal_service.get_goal_by_id(db, goal_id, current_user.id)
-    if not goal:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Goal not found",
-        )
-
-    task = goal_service.update_task_status(
-        db, task_id, current_user.id, TaskStatus.COMPLETED
-    )
-
-    if not task:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Task not found",
-        )
-
+    task = _get_task_or_404(db, goal_id, task_id, current_user.id)
+    task = goal_service.update_task(db, task, {"status": TaskStatus.COMPLETED})
+    _invalidate_caches(current_user, goal_id)
     return TaskResponse.model_validate(task)
 
 
 @router.post("/{goal_id}/tasks/{task_id}/uncomplete", response_model=TaskResponse)
-async def uncomplete_task(
+def uncomplete_task(
     goal_id: int,
     task_id: int,
     db: Session = Depends(get_db),
@@ -228,29 +216,14 @@ async def uncomplete_task(
     """
     Mark a task as pending (undo completion).
     """
-    # Verify goal ownership
-    goal = goal_service.get_goal_by_id(db, goal_id, current_user.id)
-    if not goal:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Goal not found",
-        )
-
-    task = goal_service.update_task_status(
-        db, task_id, current_user.id, TaskStatus.PENDING
-    )
-
-    if not task:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Task not found",
-        )
-
+    task = _get_task_or_404(db, goal_id, task_id, current_user.id)
+    task = goal_service.update_task(db, task, {"status": TaskStatus.PENDING})
+    _invalidate_caches(current_user, goal_id)
     return TaskResponse.model_validate(task)
 
 
 @router.post("/{goal_id}/tasks", response_model=TaskResponse, status_code=status.HTTP_201_CREATED)
-async def create_task(
+def create_task(
     goal_id: int,
     milestone_id: int,
     data: TaskCreate,
@@ -268,11 +241,13 @@ async def create_task(
             detail="Goal or milestone not found",
         )
 
+    _invalidate_caches(current_user, goal_id)
+
     return TaskResponse.model_validate(task)
 
 
 @router.delete("/{goal_id}/tasks/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_task(
+def delete_task(
     goal_id: int,
     task_id: int,
     db: Session = Depends(get_db),
@@ -281,22 +256,9 @@ async def delete_task(
     """
     Delete a task.
     """
-    # Verify goal ownership
-    goal = goal_service.get_goal_by_id(db, goal_id, current_user.id)
-    if not goal:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Goal not found",
-        )
-
-    task = db.get(Task, task_id)
-    if not task or task.goal_id != goal_id:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Task not found",
-        )
-
+    task = _get_task_or_404(db, goal_id, task_id, current_user.id)
     goal_service.delete_task(db, task)
+    _invalidate_caches(current_user, goal_id)
 
 
 # ===================
@@ -305,7 +267,7 @@ async def delete_task(
 
 
 @router.post("/{goal_id}/milestones", response_model=MilestoneResponse, status_code=status.HTTP_201_CREATED)
-async def create_milestone(
+def create_milestone(
     goal_id: int,
     data: MilestoneCreate,
     db: Session = Depends(get_db),
@@ -322,11 +284,12 @@ async def create_milestone(
             detail="Goal not found",
         )
 
+    _invalidate_caches(current_user, goal_id)
     return MilestoneResponse.model_validate(milestone)
 
 
 @router.put("/{goal_id}/milestones/{milestone_id}", response_model=MilestoneResponse)
-async def update_milestone(
+def update_milestone(
     goal_id: int,
     milestone_id: int,
     data: MilestoneUpdate,
@@ -336,27 +299,15 @@ async def update_milestone(
     """
     Update a milestone's information.
     """
-    # Verify goal ownership
-    goal = goal_service.get_goal_by_id(db, goal_id, current_user.id)
-    if not goal:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Goal not found",
-        )
-
-    milestone = goal_service.get_milestone_by_id(db, milestone_id, current_user.id)
-    if not milestone or milestone.goal_id != goal_id:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Milestone not found",
-        )
+    milestone = _get_milestone_or_404(db, goal_id, milestone_id, current_user.id)
 
     updated = goal_service.update_milestone(db, milestone, data)
+    _invalidate_caches(current_user, goal_id)
     return MilestoneResponse.model_validate(updated)
 
 
 @router.delete("/{goal_id}/milestones/{milestone_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_milestone(
+def delete_milestone(
     goal_id: int,
     milestone_id: int,
     db: Session = Depends(get_db),
@@ -365,19 +316,7 @@ async def delete_milestone(
     """
     Delete a milestone and all its tasks.
     """
-    # Verify goal ownership
-    goal = goal_service.get_goal_by_id(db, goal_id, current_user.id)
-    if not goal:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Goal not found",
-        )
-
-    milestone = goal_service.get_milestone_by_id(db, milestone_id, current_user.id)
-    if not milestone or milestone.goal_id != goal_id:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Milestone not found",
-        )
+    milestone = _get_milestone_or_404(db, goal_id, milestone_id, current_user.id)
 
     goal_service.delete_milestone(db, milestone)
+    _invalidate_caches(current_user, goal_id)
@@ -12,20 +12,26 @@ Usage:
     python -m app.run_experiments --experiment coaching
     python -m app.run_experiments --experiment extraction
     python -m app.run_experiments --all
+    python -m app.run_experiments --experiment coaching --max-concurrency 50
+    python -m app.run_experiments --experiment extraction --use-batch-api
 """
 
 import argparse
 import asyncio
-import json
 import os
 import sys
-from datetime import datetime
-from typing import Dict, Any, List
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Dict, Iterable, List, Optional
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from app import experiment_items
+from app.experiment_items import ResultWriter, emit, kept_results, record_item, run_buffered, summarize_items
 from app.config import settings
+from app.services.response_cache import ResponseCache
+from app.utils import json_utils
 from app.evaluation_datasets import (
     get_coaching_dataset,
     get_goal_extraction_dataset,
@@ -34,6 +40,67 @@ from app.evaluation_datasets import (
 )
 
 
+# Dataset items evaluated at once; raise it on higher OpenAI rate-limit tiers
+DEFAULT_MAX_CONCURRENCY = 10
+
+# Extraction items have no expected quality range
+_ANY_SCORE = (float('-inf'), float('inf'))
+
+# Model outputs and scores reused across runs (see --no-cache, --invalidate)
+RESPONSE_CACHE_DIR = os.path.join(os.path.dirname(__file__), "experiment_results", ".response_cache")
+
+
+async def _gather_bounded(coros: Iterable[Awaitable[Any]], max_concurrency: int) -> List[Any]:
+    """
+    Run coroutines concurrently, at most max_concurrency at a time.
+
+    Reason: A fixed set of workers pulls the next coroutine only when one
+    finishes, so a lazy iterable (such as a generator over the dataset)
+    never has more than max_concurrency coroutines created at once. The
+    previous gather-behind-a-semaphore created a task per item up front.
+
+    Args:
+        coros: Coroutines to run (consumed lazily)
+        max_concurrency: Upper bound on coroutines awaiting at once
+
+    Returns:
+        Results in the same order as coros
+    """
+    results: Dict[int, Any] = {}
+    # Workers share one iterator; next() never awaits, so each item is taken once
+    pending = enumerate(coros)
+
+    async def worker() -> None:
+        for index, coro in pending:
+            results[index] = await coro
+
+    await asyncio.gather(*(worker() for _ in range(max(1, max_concurrency))))
+    return [results[index] for index in range(len(results))]
+
+
+def _utc_iso(ns: int) -> str:
+    """Format a time.time_ns() timestamp as ISO 8601 UTC."""
+    return datetime.fromtimestamp(ns / 1e9, tz=timezone.utc).isoformat()
+
+
+async def _run_batch(bodies: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Send chat completion requests through the OpenAI Batch API.
+
+    Args:
+        bodies: Dataset item ID -> chat.completions.create parameters
+
+    Returns:
+        Dataset item ID -> batch result (see openai_batch.parse_batch_output)
+    """
+    from app.services import openai_batch
+
+    requests = [openai_batch.chat_request(item_id, body) for item_id, body in bodies.items()]
+    batch_id = await asyncio.to_thread(openai_batch.submit_batch, requests)
+    emit(f"   Submitted batch {batch_id} ({len(requests)} requests); waiting for results...")
+    return await asyncio.to_thread(openai_batch.await_batch, batch_id)
+
+
 def check_opik_configured() -> bool:
     """Check if Opik is configured."""
     if not settings.OPIK_API_KEY:
@@ -51,269 +118,247 @@ def check_openai_configured() -> bool:
     return True
 
 
-async def run_coaching_experiment() -> Dict[str, Any]:
+async def run_coaching_experiment(
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    use_batch_api: bool = False,
+    cache: Optional[ResponseCache] = None,
+    writer: Optional[ResultWriter] = None,
+) -> Dict[str, Any]:
     """
     Run coaching quality evaluation experiment.
     
     Tests AI coaching responses against expected quality criteria.
+
+    Args:
+        max_concurrency: Dataset items evaluated at once
+        use_batch_api: Generate responses via the OpenAI Batch API
+        cache: Reuse outputs and scores from earlier identical runs
+        writer: Stream each item's result here; the summary then omits them and
+            only each item's score is kept in memory
     """
-    print("\n🎯 Running Coaching Quality Experiment...")
-    print("=" * 50)
+    emit("\n🎯 Running Coaching Quality Experiment...")
+    emit("=" * 50)
     
-    from app.services.ai_service import generate_chat_response
+    from app.services.openai_clients import build_chat_request
     from app.services.opik_service import GoalCoachingQualityMetric
     
     dataset = get_coaching_dataset()
-    metric = GoalCoachingQualityMetric()
-    results = []
-    
-    for i, item in enumerate(dataset):
-        print(f"\n[{i+1}/{len(dataset)}] Testing: {item['id']}")
-        print(f"   User: {item['input']['user_message'][:50]}...")
-        
-        try:
-            # Generate AI response
-            messages = [{"role": "user", "content": item['input']['user_message']}]
-            ai_response = await generate_chat_response(messages)
-            
-            # Evaluate response
-            evaluation = metric.score(
-                user_input=item['input']['user_message'],
-                ai_response=ai_response
-            )
-            
-            # Check if score is within expected range
-            expected_range = item['metadata'].get('expected_score_range', [0, 1])
-            in_range = expected_range[0] <= evaluation['score'] <= expected_range[1]
-            
-            result = {
-                "id": item['id'],
-                "category": item['metadata']['category'],
-                "difficulty": item['metadata']['difficulty'],
-                "score": evaluation['score'],
-                "reason": evaluation['reason'],
-                "in_expected_range": in_range,
-                "response_preview": ai_response[:100] + "..."
-            }
-            results.append(result)
-            
-            status = "✅" if in_range else "⚠️"
-            print(f"   {status} Score: {evaluation['score']:.2f} (expected: {expected_range})")
-            print(f"   Reason: {evaluation['reason'][:60]}...")
-            
-        except Exception as e:
-            print(f"   ❌ Error: {str(e)}")
-            results.append({
-                "id": item['id'],
-                "error": str(e)
-            })
+    # Reason: A judge error must fail the item, not be cached as a 0.5 score
+    metric = GoalCoachingQualityMetric(raise_errors=True)
+    # Reason: Repeated prompts are generated (and scored) once per run
+    requests, representative = experiment_items.dedupe_requests({
+        item['id']: build_chat_request([{"role": "user", "content": item['input']['user_message']}])
+        for item in dataset
+    })
+    shared = experiment_items.SharedCalls()
+    batch = await _run_batch(requests) if use_batch_api else {}
+    outcomes = await _gather_bounded(
+        (
+            record_item(experiment_items.eval_coaching_item(
+                f"[{i+1}/{len(dataset)}]", item, metric,
+                batch.get(representative[item['id']], {"error": "Missing from batch output"})
+                if use_batch_api else None,
+                cache, shared,
+            ), writer, "coaching", 'score', item['metadata'].get('expected_score_range', [0, 1]))
+            for i, item in enumerate(dataset)
+        ),
+        max_concurrency,
+    )
     
     # Calculate summary
-    valid_results = [r for r in results if 'score' in r]
-    avg_score = sum(r['score'] for r in valid_results) / len(valid_results) if valid_results else 0
-    pass_rate = sum(1 for r in valid_results if r['in_expected_range']) / len(valid_results) if valid_results else 0
+    stats = summarize_items(outcomes)
+    avg_score = stats.average
+    pass_rate = stats.pass_rate
     
     summary = {
         "experiment": "coaching_quality",
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": _utc_iso(time.time_ns()),
         "total_tests": len(dataset),
-        "successful_tests": len(valid_results),
+        "successful_tests": stats.n_valid,
         "average_score": round(avg_score, 3),
         "pass_rate": round(pass_rate, 3),
-        "results": results
+        "median_score": round(stats.p50, 3),
+        "p90_score": round(stats.p90, 3),
     }
+    if writer is None:
+        summary["results"] = kept_results(outcomes)
     
-    print("\n" + "=" * 50)
-    print(f"📊 Coaching Experiment Summary:")
-    print(f"   Average Score: {avg_score:.2f}")
-    print(f"   Pass Rate: {pass_rate:.1%}")
-    print(f"   Tests Passed: {sum(1 for r in valid_results if r['in_expected_range'])}/{len(valid_results)}")
+    emit("\n" + "=" * 50)
+    emit(f"📊 Coaching Experiment Summary:")
+    emit(f"   Average Score: {avg_score:.2f}")
+    emit(f"   Pass Rate: {pass_rate:.1%}")
+    emit(f"   Tests Passed: {stats.pass_count}/{stats.n_valid}")
     
     return summary
 
 
-async def run_frustration_experiment() -> Dict[str, Any]:
+async def run_frustration_experiment(
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    cache: Optional[ResponseCache] = None,
+    writer: Optional[ResultWriter] = None,
+) -> Dict[str, Any]:
     """
     Run frustration detection experiment.
     
     Tests the system's ability to detect user frustration in conversations.
+
+    Args:
+        max_concurrency: Dataset items evaluated at once
+        cache: Reuse detections from earlier identical runs
+        writer: Stream each item's result here; the summary then omits them and
+            only each item's score is kept in memory
     """
-    print("\n😤 Running Frustration Detection Experiment...")
-    print("=" * 50)
+    emit("\n😤 Running Frustration Detection Experiment...")
+    emit("=" * 50)
     
     from app.services.opik_service import UserFrustrationDetector
     
     dataset = get_frustration_dataset()
-    detector = UserFrustrationDetector()
-    results = []
-    
-    for i, item in enumerate(dataset):
-        print(f"\n[{i+1}/{len(dataset)}] Testing: {item['id']}")
-        print(f"   Expected frustration: {item['expected_output']['frustration_level']}")
-        
-        try:
-            result = detector.detect(
-                user_input=item['input']['original_question'],
-                previous_response=item['input']['ai_response'],
-                current_reply=item['input']['user_reply']
+    detector = UserFrustrationDetector(raise_errors=True)
+    outcomes = await _gather_bounded(
+        (
+            record_item(
+                experiment_items.eval_frustration_item(f"[{i+1}/{len(dataset)}]", item, detector, cache),
+                writer, "frustration", 'detected_score', item['expected_output']['score_range'],
             )
-            
-            expected_range = item['expected_output']['score_range']
-            score = result['frustration_score']
-            in_range = expected_range[0] <= score <= expected_range[1]
-            
-            test_result = {
-                "id": item['id'],
-                "expected_level": item['expected_output']['frustration_level'],
-                "detected_score": score,
-                "in_expected_range": in_range,
-                "indicators": result.get('indicators', [])
-            }
-            results.append(test_result)
-            
-            status = "✅" if in_range else "⚠️"
-            print(f"   {status} Detected: {score:.2f} (expected: {expected_range})")
-            
-        except Exception as e:
-            print(f"   ❌ Error: {str(e)}")
-            results.append({"id": item['id'], "error": str(e)})
-    
-    valid_results = [r for r in results if 'detected_score' in r]
-    accuracy = sum(1 for r in valid_results if r['in_expected_range']) / len(valid_results) if valid_results else 0
+            for i, item in enumerate(dataset)
+        ),
+        max_concurrency,
+    )
+    
+    stats = summarize_items(outcomes)
+    accuracy = stats.pass_rate
     
     summary = {
         "experiment": "frustration_detection",
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": _utc_iso(time.time_ns()),
         "total_tests": len(dataset),
         "accuracy": round(accuracy, 3),
-        "results": results
     }
+    if writer is None:
+        summary["results"] = kept_results(outcomes)
     
-    print("\n" + "=" * 50)
-    print(f"📊 Frustration Detection Summary:")
-    print(f"   Accuracy: {accuracy:.1%}")
+    emit("\n" + "=" * 50)
+    emit(f"📊 Frustration Detection Summary:")
+    emit(f"   Accuracy: {accuracy:.1%}")
     
     return summary
 
 
-async def run_extraction_experiment() -> Dict[str, Any]:
+async def run_extraction_experiment(
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    use_batch_api: bool = False,
+    cache: Optional[ResponseCache] = None,
+    writer: Optional[ResultWriter] = None,
+) -> Dict[str, Any]:
     """
     Run goal extraction experiment.
     
     Tests AI's ability to extract structured goals from conversations.
+
+    Args:
+        max_concurrency: Dataset items evaluated at once
+        use_batch_api: Extract goals via the OpenAI Batch API
+        cache: Reuse outputs and scores from earlier identical runs
+        writer: Stream each item's result here; the summary then omits them and
+            only each item's score is kept in memory
     """
-    print("\n📝 Running Goal Extraction Experiment...")
-    print("=" * 50)
+    emit("\n📝 Running Goal Extraction Experiment...")
+    emit("=" * 50)
     
-    from app.services.ai_service import extract_goal_from_conversation
+    from app.services.openai_clients import build_goal_extraction_request
     from app.services.opik_service import GoalExtractionQualityMetric
     
     dataset = get_goal_extraction_dataset()
-    metric = GoalExtractionQualityMetric()
-    results = []
+    metric = GoalExtractionQualityMetric(raise_errors=True)
+    # Reason: Repeated conversations are extracted (and scored) once per run
+    requests, representative = experiment_items.dedupe_requests({
+        item['id']: build_goal_extraction_request(item['input']['conversation'])
+        for item in dataset
+    })
+    shared = experiment_items.SharedCalls()
+    batch = await _run_batch(requests) if use_batch_api else {}
+    outcomes = await _gather_bounded(
+        (
+            record_item(experiment_items.eval_extraction_item(
+                f"[{i+1}/{len(dataset)}]", item, metric,
+                batch.get(representative[item['id']], {"error": "Missing from batch output"})
+                if use_batch_api else None,
+                cache, shared,
+            ), writer, "extraction", 'quality_score', _ANY_SCORE)
+            for i, item in enumerate(dataset)
+        ),
+        max_concurrency,
+    )
     
-    for i, item in enumerate(dataset):
-        print(f"\n[{i+1}/{len(dataset)}] Testing: {item['id']}")
-        
-        try:
-            # Extract goal from conversation
-            goal = await extract_goal_from_conversation(item['input']['conversation'])
-            
-            if goal:
-                # Create summary of milestones
-                milestones_summary = ", ".join([m.title for m in goal.milestones[:5]])
-                
-                # Evaluate extraction quality
-                evaluation = metric.score(
-                    conversation_summary=str(item['input']['conversation']),
-                    goal_title=goal.title,
-                    goal_description=goal.description or "",
-                    goal_category=goal.category,
-                    milestones_summary=milestones_summary
-                )
-                
-                # Check expected outputs
-                title_check = any(
-                    kw.lower() in goal.title.lower() 
-                    for kw in item['expected_output'].get('goal_title_contains', [])
-                )
-                category_check = goal.category == item['expected_output'].get('category', goal.category)
-                milestone_count = len(goal.milestones)
-                milestone_range = item['expected_output'].get('milestone_count_range', [1, 10])
-                milestone_check = milestone_range[0] <= milestone_count <= milestone_range[1]
-                
-                result = {
-                    "id": item['id'],
-                    "extracted_title": goal.title,
-                    "extracted_category": goal.category,
-                    "milestone_count": milestone_count,
-                    "quality_score": evaluation['score'],
-                    "quality_reason": evaluation['reason'],
-                    "title_match": title_check,
-                    "category_match": category_check,
-                    "milestone_count_valid": milestone_check
-                }
-                results.append(result)
-                
-                print(f"   Title: {goal.title}")
-                print(f"   Category: {goal.category}")
-                print(f"   Milestones: {milestone_count}")
-                print(f"   Quality Score: {evaluation['score']:.2f}")
-            else:
-                print(f"   ❌ Failed to extract goal")
-                results.append({"id": item['id'], "error": "Extraction returned None"})
-                
-        except Exception as e:
-            print(f"   ❌ Error: {str(e)}")
-            results.append({"id": item['id'], "error": str(e)})
-    
-    valid_results = [r for r in results if 'quality_score' in r]
-    avg_quality = sum(r['quality_score'] for r in valid_results) / len(valid_results) if valid_results else 0
+    stats = summarize_items(outcomes)
+    avg_quality = stats.average
     
     summary = {
         "experiment": "goal_extraction",
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": _utc_iso(time.time_ns()),
         "total_tests": len(dataset),
-        "successful_extractions": len(valid_results),
+        "successful_extractions": stats.n_valid,
         "average_quality": round(avg_quality, 3),
-        "results": results
+        "median_quality": round(stats.p50, 3),
     }
+    if writer is None:
+        summary["results"] = kept_results(outcomes)
     
-    print("\n" + "=" * 50)
-    print(f"📊 Goal Extraction Summary:")
-    print(f"   Successful Extractions: {len(valid_results)}/{len(dataset)}")
-    print(f"   Average Quality: {avg_quality:.2f}")
+    emit("\n" + "=" * 50)
+    emit(f"📊 Goal Extraction Summary:")
+    emit(f"   Successful Extractions: {stats.n_valid}/{len(dataset)}")
+    emit(f"   Average Quality: {avg_quality:.2f}")
     
     return summary
 
 
-async def run_all_experiments() -> Dict[str, Any]:
+async def run_all_experiments(
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    use_batch_api: bool = False,
+    cache: Optional[ResponseCache] = None,
+) -> Dict[str, Any]:
     """Run all experiments and compile results."""
     print("\n🚀 Running All Experiments...")
     print("=" * 60)
     
+    start_ns = time.time_ns()
+    run_id = time.strftime("%Y%m%d_%H%M%S", time.gmtime(start_ns // 1_000_000_000))
+    output_dir = os.path.join(os.path.dirname(__file__), "experiment_results")
+    os.makedirs(output_dir, exist_ok=True)
+    items_file = os.path.join(output_dir, f"results_{run_id}.jsonl")
+
     all_results = {
-        "run_id": datetime.utcnow().strftime("%Y%m%d_%H%M%S"),
+        "run_id": run_id,
+        "started_at": _utc_iso(start_ns),
         "model": "gpt-4o-mini",
+        "items_file": os.path.basename(items_file),
         "experiments": {}
     }
     
     # Run each experiment
-    all_results["experiments"]["coaching"] = await run_coaching_experiment()
-    all_results["experiments"]["frustration"] = await run_frustration_experiment()
-    all_results["experiments"]["extraction"] = await run_extraction_experiment()
-    
-    # Save results
-    output_dir = os.path.join(os.path.dirname(__file__), "experiment_results")
-    os.makedirs(output_dir, exist_ok=True)
-    
-    output_file = os.path.join(output_dir, f"results_{all_results['run_id']}.json")
-    with open(output_file, 'w') as f:
-        json.dump(all_results, f, indent=2)
+    # Reason: The experiments share nothing but the API connection pool, so
+    # they overlap; each one's output is held and printed when it finishes.
+    # Item results stream to the JSONL file as they complete, leaving only
+    # the summaries for the JSON file below.
+    with ResultWriter(items_file) as writer:
+        coaching, frustration, extraction = await asyncio.gather(
+            run_buffered(run_coaching_experiment(max_concurrency, use_batch_api, cache, writer)),
+            run_buffered(run_frustration_experiment(max_concurrency, cache, writer)),
+            run_buffered(run_extraction_experiment(max_concurrency, use_batch_api, cache, writer)),
+        )
+    all_results["experiments"]["coaching"] = coaching
+    all_results["experiments"]["frustration"] = frustration
+    all_results["experiments"]["extraction"] = extraction
+    
+    # Save summaries
+    output_file = os.path.join(output_dir, f"results_{run_id}.json")
+    with open(output_file, 'wb') as f:
+        f.write(json_utils.dumps_bytes(all_results, indent=True))
     
     print("\n" + "=" * 60)
     print("🎉 All Experiments Complete!")
-    print(f"📁 Results saved to: {output_file}")
+    print(f"📁 Results saved to: {output_file} (per-item results: {items_file})")
     
     # Print overall summary
     print("\n📊 Overall Summary:")
@@ -357,6 +402,31 @@ def log_to_opik(results: Dict[str, Any]):
         print(f"\n⚠️ Failed to log to Opik: {e}")
 
 
+async def _run_selected(args: argparse.Namespace, cache: Optional[ResponseCache]) -> Dict[str, Any]:
+    """
+    Run the experiments chosen on the command line on one event loop.
+
+    Reason: The shared AsyncOpenAI client's connection pool is bound to the
+    loop that first uses it, so everything runs on this one loop and the
+    pool is closed before the loop ends.
+    """
+    from app.services.openai_clients import close_openai_clients, get_async_openai_client
+
+    try:
+        # Open the pooled connection once before items fan out
+        await get_async_openai_client().models.list()
+
+        if args.experiment == "coaching":
+            return await run_coaching_experiment(args.max_concurrency, args.use_batch_api, cache)
+        if args.experiment == "frustration":
+            return await run_frustration_experiment(args.max_concurrency, cache)
+        if args.experiment == "extraction":
+            return await run_extraction_experiment(args.max_concurrency, args.use_batch_api, cache)
+        return await run_all_experiments(args.max_concurrency, args.use_batch_api, cache)
+    finally:
+        await close_openai_clients()
+
+
 def main():
     parser = argparse.ArgumentParser(description="Run MileSync AI Experiments")
     parser.add_argument(
@@ -370,6 +440,28 @@ def main():
         action="store_true",
         help="Log results to Opik dashboard"
     )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENCY,
+        help="Dataset items evaluated at once (bounded by your OpenAI rate limit)"
+    )
+    parser.add_argument(
+        "--use-batch-api",
+        action="store_true",
+        help="Generate coaching and extraction outputs via the OpenAI Batch API "
+             "(half price, may take hours); scoring still runs live"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Call the API for every item instead of reusing cached outputs and scores"
+    )
+    parser.add_argument(
+        "--invalidate",
+        action="store_true",
+        help="Empty the response cache before running"
+    )
     
     args = parser.parse_args()
     
@@ -384,15 +476,17 @@ def main():
     print(f"Opik: {'Configured ✅' if settings.OPIK_API_KEY else 'Not configured ⚠️'}")
     print(f"Project: {settings.OPIK_PROJECT_NAME}")
     
+    cache = None
+    if not args.no_cache:
+        cache = ResponseCache(RESPONSE_CACHE_DIR)
+        if args.invalidate:
+            cache.clear()
+
     # Run experiments
-    if args.experiment == "coaching":
-        results = asyncio.run(run_coaching_experiment())
-    elif args.experiment == "frustration":
-        results = asyncio.run(run_frustration_experiment())
-    elif args.experiment == "extraction":
-        results = asyncio.run(run_extraction_experiment())
-    else:
-        results = asyncio.run(run_all_experiments())
+    results = asyncio.run(_run_selected(args, cache))
+
+    if cache is not None:
+        cache.close()
     
     # Log to Opik if requested
     if args.log_to_opik:
@@ -34,6 +34,18 @@ from app.schemas.goal import (
     AIGoalGeneration,
     FinalizeWithGoalResponse,
 )
+from app.schemas.agent import (
+    AgentInfoResponse,
+    AgentRouteResponse,
+    IntakeResponse,
+    PlanResponse,
+    DailyTasksResponse,
+    CheckinResponse,
+    InsightsResponse,
+    ResourcesResponse,
+    MotivationResponse,
+    IntakePipelineResponse,
+)
 
 __all__ = [
     # User schemas
@@ -67,4 +79,15 @@ __all__ = [
     "GoalListItem",
     "AIGoalGeneration",
     "FinalizeWithGoalResponse",
+    # Agent schemas
+    "AgentInfoResponse",
+    "AgentRouteResponse",
+    "IntakeResponse",
+    "PlanResponse",
+    "DailyTasksResponse",
+    "CheckinResponse",
+    "InsightsResponse",
+    "ResourcesResponse",
+    "MotivationResponse",
+    "IntakePipelineResponse",
 ]
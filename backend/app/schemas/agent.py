@@ -0,0 +1,87 @@
+"""Agent endpoint response schemas."""
+
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel
+
+from app.agents.types import AgentType
+
+
+class AgentInfoResponse(BaseModel):
+    """Registered agents listing."""
+    agents: List[Dict[str, Any]]
+    total_agents: int
+
+
+class AgentRouteResponse(BaseModel):
+    """Response from an automatically routed agent."""
+    agent_type: AgentType
+    success: bool
+    message: str
+    data: Dict[str, Any]
+    requires_user_input: bool
+
+
+class IntakeResponse(BaseModel):
+    """Foundation Agent intake response."""
+    agent_type: AgentType
+    message: str
+    data: Dict[str, Any]
+    requires_user_input: bool
+
+
+class PlanResponse(BaseModel):
+    """Planning Agent SMART plan."""
+    agent_type: AgentType
+    message: str
+    smart_goal: Any = None
+    milestones: Any = None
+    task_schedule: Any = None
+
+
+class DailyTasksResponse(BaseModel):
+    """Execution Agent daily summary."""
+    agent_type: AgentType
+    daily_summary: Any = None
+    next_actions: Any = None
+    motivational_message: Any = None
+
+
+class CheckinResponse(BaseModel):
+    """Daily check-in pipeline output, one entry per agent that ran."""
+    execution: Optional[Dict[str, Any]] = None
+    sustainability: Optional[Dict[str, Any]] = None
+    psychological: Optional[Dict[str, Any]] = None
+
+
+class InsightsResponse(BaseModel):
+    """Sustainability Agent insights."""
+    agent_type: AgentType
+    habit_analysis: Any = None
+    pattern_insights: Any = None
+    sustainability_score: Any = None
+    burnout_risk: Any = None
+    recommendations: Any = None
+
+
+class ResourcesResponse(BaseModel):
+    """Support Agent resource recommendations."""
+    agent_type: AgentType
+    recommended_resources: Any = None
+    integration_suggestions: Any = None
+    community_matches: Any = None
+
+
+class MotivationResponse(BaseModel):
+    """Psychological Agent support."""
+    agent_type: AgentType
+    emotional_assessment: Any = None
+    intervention: Any = None
+    affirmations: Any = None
+    progress_celebration: Any = None
+
+
+class IntakePipelineResponse(BaseModel):
+    """Foundation → Planning pipeline output."""
+    foundation: Optional[Dict[str, Any]] = None
+    planning: Optional[Dict[str, Any]] = None
@@ -1,11 +1,17 @@
 """Chat request/response schemas."""
 
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
-from app.models.chat import ChatStatus, MessageRole
+from app.models.chat import ChatStatus
+
+# Reason: Responses only echo roles the ORM already validated on write. A
+# Literal is a single set-membership check in pydantic-core, where the
+# MessageRole enum is a lookup per row; the JSON output is identical.
+# Keep in step with MessageRole.
+MessageRoleValue = Literal["user", "assistant", "system"]
 
 
 class SendMessageRequest(BaseModel):
@@ -17,7 +23,7 @@ class MessageResponse(BaseModel):
     """Single chat message response."""
     id: int
     session_id: int
-    role: MessageRole
+    role: MessageRoleValue
     content: str
     created_at: datetime
 
@@ -40,9 +46,11 @@ class ChatSessionResponse(BaseModel):
 
 
 class ChatSessionWithMessages(BaseModel):
-    """Chat session with all messages."""
+    """Chat session with its messages (all, or one page when paginated)."""
     session: ChatSessionResponse
     messages: List[MessageResponse]
+    has_more: bool = False  # Older messages remain before this page
+    next_cursor: Optional[int] = None  # Pass as ?cursor= to load them
 
 
 class StartChatResponse(BaseModel):
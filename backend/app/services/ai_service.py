@@ -1,144 +1,26 @@
 """AI service for OpenAI chat completions and goal extraction.
 
 Integrated with Opik for comprehensive LLM observability and evaluation.
+Clients, prompts and request parameters come from openai_clients.
 """
 
-import json
-import uuid
 from datetime import datetime
-from typing import List, Optional
+from typing import AsyncIterator, Iterable, List, Optional
 
-from openai import OpenAI, RateLimitError
+from openai import RateLimitError
 from fastapi import HTTPException
 
-from app.config import settings
 from app.schemas.goal import AIGoalGeneration, AIMilestoneGeneration, AITaskGeneration
-
-# Opik integration imports
-try:
-    from opik import track
-    from opik.integrations.openai import track_openai
-    OPIK_AVAILABLE = True
-except ImportError:
-    OPIK_AVAILABLE = False
-    # Create a no-op decorator if Opik is not available
-    def track(*args, **kwargs):
-        def decorator(func):
-            return func
-        return decorator if not args else args[0]
-    track_openai = lambda x: x
-
-# Default model for all AI conversations
-AI_MODEL = "gpt-4o-mini"
-
-from sqlmodel import Session, select, create_engine
-from app.models.prompt import SystemPrompt
-
-# ... imports ...
-
-# Default model for all AI conversations
-AI_MODEL = "gpt-4o-mini"
-
-# In-memory cache for prompts
-_prompt_cache = {}
-
-def get_db_session():
-    """Create a new database session."""
-    connect_args = {"check_same_thread": False} if settings.DATABASE_URL.startswith("sqlite") else {}
-    engine = create_engine(settings.DATABASE_URL, connect_args=connect_args)
-    return Session(engine)
-
-def get_system_prompt(key: str, default: str) -> str:
-    """Get system prompt from cache or DB."""
-    if key in _prompt_cache:
-        return _prompt_cache[key]
-        
-    try:
-        with get_db_session() as session:
-            prompt = session.exec(select(SystemPrompt).where(SystemPrompt.key == key)).first()
-            if prompt:
-                _prompt_cache[key] = prompt.content
-                return prompt.content
-    except Exception as e:
-        print(f"Error fetching prompt {key}: {e}")
-        
-    return default
-
-def clear_prompt_cache():
-    """Clear the prompt cache."""
-    global _prompt_cache
-    _prompt_cache = {}
-
-# Default prompts
-DEFAULT_CHAT_SYSTEM = """You are an AI goal coach for MileSync. Your role is to help users define SMART goals
-(Specific, Measurable, Achievable, Relevant, Time-bound), understand their motivations,
-identify potential obstacles, and create actionable plans.
-
-Guidelines:
-1. Ask clarifying questions to deeply understand the user's goal before suggesting a roadmap
-2. Help break down large goals into manageable milestones
-3. Be encouraging but realistic about timelines and effort required
-4. Identify potential obstacles and suggest strategies to overcome them
-5. When the conversation feels complete, summarize the goal and key milestones
-
-Keep responses concise but helpful. Use a friendly, supportive tone."""
-
-# Global tracked client - initialized once
-_tracked_client = None
-
-
-def get_openai_client() -> Optional[OpenAI]:
-    """
-    Get OpenAI client instance wrapped with Opik tracing.
-
-    Returns:
-        OpenAI client if API key is configured, None otherwise
-    """
-    global _tracked_client
-    
-    if not settings.OPENAI_API_KEY:
-        return None
-    
-    if _tracked_client is None:
-        base_client = OpenAI(api_key=settings.OPENAI_API_KEY)
-        # Wrap with Opik tracking if available
-        if OPIK_AVAILABLE and settings.OPIK_API_KEY:
-            _tracked_client = track_openai(base_client)
-        else:
-            _tracked_client = base_client
-    
-    return _tracked_client
-
-
-def format_messages_for_openai(
-    messages: List[dict],
-    include_system: bool = True
-) -> List[dict]:
-    """
-    Format chat messages for OpenAI API.
-
-    Args:
-        messages: List of message dicts with 'role' and 'content'
-        include_system: Whether to include system prompt
-
-    Returns:
-        Formatted messages list for OpenAI
-    """
-    formatted = []
-
-    if include_system:
-        formatted.append({
-            "role": "system",
-            "content": get_system_prompt("chat_system_prompt", DEFAULT_CHAT_SYSTEM)
-        })
-
-    for msg in messages:
-        formatted.append({
-            "role": msg["role"],
-            "content": msg["content"]
-        })
-
-    return formatted
+from app.services.openai_clients import (
+    AI_MODEL,
+    build_chat_request,
+    build_goal_extraction_request,
+    format_messages_for_openai,
+    get_async_openai_client,
+    track,
+)
+from app.utils import json_utils
+from app.utils.clock import utcnow
 
 
 @track(name="generate_chat_response", tags=["chat", "ai-coaching"])
@@ -160,20 +42,13 @@ async def generate_chat_response(
         ValueError: If OpenAI API key is not configured
         Exception: If OpenAI API call fails
     """
-    client = get_openai_client()
+    client = get_async_openai_client()
 
     if not client:
         raise ValueError("OpenAI API key not configured")
 
-    formatted_messages = format_messages_for_openai(messages)
-
     try:
-        response = client.chat.completions.create(
-            model=model,
-            messages=formatted_messages,
-            max_tokens=1000,
-            temperature=0.7,
-        )
+        response = await client.chat.completions.create(**build_chat_request(messages, model))
         return response.choices[0].message.content or ""
     except RateLimitError as e:
         print(f"OpenAI rate limit reached: {e}")
@@ -205,20 +80,13 @@ async def generate_chat_response_with_usage(
     Raises:
         ValueError: If OpenAI API key is not configured
     """
-    client = get_openai_client()
+    client = get_async_openai_client()
 
     if not client:
         raise ValueError("OpenAI API key not configured")
 
-    formatted_messages = format_messages_for_openai(messages)
-
     try:
-        response = client.chat.completions.create(
-            model=model,
-            messages=formatted_messages,
-            max_tokens=1000,
-            temperature=0.7,
-        )
+        response = await client.chat.completions.create(**build_chat_request(messages, model))
 
         # Extract usage information
         usage = None
@@ -241,6 +109,68 @@ async def generate_chat_response_with_usage(
         raise
 
 
+# Reason: Opik wraps the async generator; the trace closes when the stream
+# ends and records the joined fragments as its output.
+@track(
+    name="generate_chat_response_stream",
+    tags=["chat", "ai-coaching", "streaming"],
+    generations_aggregator="".join,
+)
+async def generate_chat_response_stream(
+    messages: List[dict],
+    usage_out: Optional[dict] = None,
+    model: str = AI_MODEL,
+) -> AsyncIterator[str]:
+    """
+    Stream an AI chat response as text deltas.
+
+    Args:
+        messages: List of message dicts with 'role' and 'content'
+        usage_out: If given, filled with total_tokens, prompt_tokens and
+            completion_tokens once the stream ends (when the API reports them)
+        model: OpenAI model to use
+
+    Yields:
+        Response text fragments in order
+
+    Raises:
+        ValueError: If OpenAI API key is not configured
+        HTTPException: 429 if the OpenAI rate limit is reached
+    """
+    client = get_async_openai_client()
+
+    if not client:
+        raise ValueError("OpenAI API key not configured")
+
+    formatted_messages = format_messages_for_openai(messages)
+
+    try:
+        # Reason: This SDK version predates the stream_options parameter, so
+        # the usage-reporting flag is passed through extra_body; the final
+        # chunk then carries usage (as an extra field) and no choices.
+        stream = await client.chat.completions.create(
+            model=model,
+            messages=formatted_messages,
+            max_tokens=1000,
+            temperature=0.7,
+            stream=True,
+            extra_body={"stream_options": {"include_usage": True}},
+        )
+        async for chunk in stream:
+            usage = getattr(chunk, "usage", None)
+            if usage and usage_out is not None:
+                for key in ("total_tokens", "prompt_tokens", "completion_tokens"):
+                    usage_out[key] = usage[key] if isinstance(usage, dict) else getattr(usage, key)
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+    except RateLimitError as e:
+        print(f"OpenAI rate limit reached: {e}")
+        raise HTTPException(
+            status_code=429,
+            detail="OPENAI_LIMIT_REACHED"
+        )
+
+
 def generate_initial_message() -> str:
     """
     Generate the initial greeting message for a new chat session.
@@ -266,7 +196,7 @@ async def summarize_conversation(messages: List[dict]) -> str:
     Returns:
         Short summary suitable for session title
     """
-    client = get_openai_client()
+    client = get_async_openai_client()
 
     if not client:
         # Reason: Fallback when OpenAI not configured
@@ -276,7 +206,7 @@ async def summarize_conversation(messages: List[dict]) -> str:
     context = "\n".join([f"{m['role']}: {m['content'][:200]}" for m in messages[:5]])
 
     try:
-        response = client.chat.completions.create(
+        response = await client.chat.completions.create(
             model=AI_MODEL,
             messages=[
                 {
@@ -299,194 +229,45 @@ async def summarize_conversation(messages: List[dict]) -> str:
         return "Goal Discussion"
 
 
-# OpenAI tool/function definition for goal extraction
-GOAL_EXTRACTION_TOOL = {
-    "type": "function",
-    "function": {
-        "name": "create_goal_roadmap",
-        "description": "Extract a structured goal with milestones and tasks from the conversation",
-        "parameters": {
-            "type": "object",
-            "properties": {
-                "title": {
-                    "type": "string",
-                    "description": "A concise, action-oriented title for the goal (e.g., 'Learn Spanish to conversational level')"
-                },
-                "description": {
-                    "type": "string",
-                    "description": "A 1-2 sentence description of the goal and why it matters"
-                },
-                "category": {
-                    "type": "string",
-                    "enum": ["health", "career", "education", "finance", "personal", "other"],
-                    "description": "The category that best fits this goal"
-                },
-                "target_date": {
-                    "type": "string",
-                    "description": "Target completion date in YYYY-MM-DD format (MUST be in the future, e.g., 2026+)"
-                },
-                "milestones": {
-                    "type": "array",
-                    "description": "3-7 major checkpoints to achieve the goal",
-                    "items": {
-                        "type": "object",
-                        "properties": {
-                            "title": {
-                                "type": "string",
-                                "description": "Milestone title"
-                            },
-                            "description": {
-                                "type": "string",
-                                "description": "Brief description of what this milestone involves"
-                            },
-                            "target_date": {
-                                "type": "string",
-                                "description": "Target date for this milestone in YYYY-MM-DD format (MUST be in the future)"
-                            },
-                            "tasks": {
-                                "type": "array",
-                                "description": "2-5 specific, actionable tasks for this milestone",
-                                "items": {
-                                    "type": "object",
-                                    "properties": {
-                                        "title": {
-                                            "type": "string",
-                                            "description": "Task title - should be specific and actionable"
-                                        },
-                                        "description": {
-                                            "type": "string",
-                                            "description": "Optional details about the task"
-                                        },
-                                        "priority": {
-                                            "type": "string",
-                                            "enum": ["low", "medium", "high"],
-                                            "description": "Task priority level"
-                                        }
-                                    },
-                                    "required": ["title"]
-                                }
-                            }
-                        },
-                        "required": ["title", "tasks"]
-                    }
-                }
-            },
-            "required": ["title", "description", "category", "milestones"]
-        }
-    }
-}
-
-
-@track(name="extract_goal_from_conversation", tags=["goal-extraction", "function-calling"])
-async def extract_goal_from_conversation(messages: List[dict]) -> Optional[AIGoalGeneration]:
-    """
-    Extract structured goal data from a conversation using OpenAI function calling.
-
-    Args:
-        messages: List of message dicts from the conversation
-
-    Returns:
-        AIGoalGeneration with extracted goal structure, or None if extraction fails
-    """
-    client = get_openai_client()
-
-    if not client:
+def _ensure_future_date(date_str: Optional[str]) -> Optional[str]:
+    """Ensure the date is in the future relative to today."""
+    if not date_str:
         return None
+    try:
+        # Parse date
+        dt = datetime.strptime(date_str, "%Y-%m-%d").date()
+        today = utcnow().date()
 
-    # Build conversation context
-    conversation = "\n".join([
-        f"{m['role'].upper()}: {m['content']}"
-        for m in messages
-    ])
-
-    default_template = """Based on the following goal coaching conversation, extract a structured goal with milestones and tasks.
+        # If date is in the past, bump year until it's in the future
+        if dt < today:
+            # Add years until >= today
+            while dt < today:
+                 # Handle leap years simply by using replace (might fail on Feb 29, so try/except)
+                try:
+                    dt = dt.replace(year=dt.year + 1)
+                except ValueError:
+                    # Feb 29 -> Mar 1 next year
+                    dt = dt.replace(year=dt.year + 1, day=1, month=3)
 
-The goal should be SMART (Specific, Measurable, Achievable, Relevant, Time-bound).
-Today's date is {date}. IMPORTANT: Ensure all target dates (goal and milestones) are strictly in the future, starting after {date}.
-Create 3-7 milestones that logically progress toward the goal.
-Each milestone should have 2-5 specific, actionable tasks.
+            return dt.strftime("%Y-%m-%d")
 
-Conversation:
-{conversation}
+        return date_str
+    except (ValueError, TypeError):
+        return date_str
 
-Extract the goal structure using the provided function."""
 
-    template = get_system_prompt("goal_extraction_template", default_template)
-    current_date = datetime.utcnow().strftime('%Y-%m-%d')
-    # Use formatted date in prompt to ground the model
-    try:
-        extraction_prompt = template.format(conversation=conversation, date=current_date)
-    except KeyError:
-        # Fallback if custom template doesn't support {date}
-        extraction_prompt = template.format(conversation=conversation) + f"\n\nToday's date is {current_date}."""
-    
-    system_role = get_system_prompt("goal_extraction_system", "You are a goal extraction assistant. Analyze conversations and extract structured goals.")
-
-    try:
-        response = client.chat.completions.create(
-            model=AI_MODEL,
-            messages=[
-                {
-                    "role": "system",
-                    "content": system_role
-                },
-                {
-                    "role": "user",
-                    "content": extraction_prompt
-                }
-            ],
-            tools=[GOAL_EXTRACTION_TOOL],
-            tool_choice={"type": "function", "function": {"name": "create_goal_roadmap"}},
-            max_tokens=2000,
-            temperature=0.3,
-        )
-    except RateLimitError as e:
-        print(f"OpenAI rate limit reached: {e}")
-        raise HTTPException(
-            status_code=429,
-            detail="OPENAI_LIMIT_REACHED"
-        )
-    except Exception as e:
-        print(f"Error extracting goal: {e}")
-        return None
-
-    # Extract the function call arguments
-    message = response.choices[0].message
-    if not message.tool_calls:
-        return None
-
-    tool_call = message.tool_calls[0]
-    if tool_call.function.name != "create_goal_roadmap":
-        return None
+def parse_goal_arguments(arguments: str) -> Optional[AIGoalGeneration]:
+    """
+    Parse create_goal_roadmap tool-call arguments into a goal structure.
 
-    def _ensure_future_date(date_str: Optional[str]) -> Optional[str]:
-        """Ensure the date is in the future relative to today."""
-        if not date_str:
-            return None
-        try:
-            # Parse date
-            dt = datetime.strptime(date_str, "%Y-%m-%d").date()
-            today = datetime.utcnow().date()
-            
-            # If date is in the past, bump year until it's in the future
-            if dt < today:
-                # Add years until >= today
-                while dt < today:
-                     # Handle leap years simply by using replace (might fail on Feb 29, so try/except)
-                    try:
-                        dt = dt.replace(year=dt.year + 1)
-                    except ValueError:
-                        # Feb 29 -> Mar 1 next year
-                        dt = dt.replace(year=dt.year + 1, day=1, month=3)
-                
-                return dt.strftime("%Y-%m-%d")
-            
-            return date_str
-        except (ValueError, TypeError):
-            return date_str
+    Args:
+        arguments: JSON arguments string from the tool call
 
+    Returns:
+        AIGoalGeneration, or None if the arguments cannot be parsed
+    """
     try:
-        goal_data = json.loads(tool_call.function.arguments)
+        goal_data = json_utils.loads(arguments)
 
         # Parse milestones
         milestones = []
@@ -514,6 +295,46 @@ Extract the goal structure using the provided function."""
             milestones=milestones,
         )
 
-    except (json.JSONDecodeError, KeyError) as e:
+    except (json_utils.JSONDecodeError, KeyError) as e:
         # Reason: Fallback if parsing fails
         return None
+
+
+@track(name="extract_goal_from_conversation", tags=["goal-extraction", "function-calling"])
+async def extract_goal_from_conversation(messages: Iterable[dict]) -> Optional[AIGoalGeneration]:
+    """
+    Extract structured goal data from a conversation using OpenAI function calling.
+
+    Args:
+        messages: Message dicts from the conversation (any iterable)
+
+    Returns:
+        AIGoalGeneration with extracted goal structure, or None if extraction fails
+    """
+    client = get_async_openai_client()
+
+    if not client:
+        return None
+
+    try:
+        response = await client.chat.completions.create(**build_goal_extraction_request(messages))
+    except RateLimitError as e:
+        print(f"OpenAI rate limit reached: {e}")
+        raise HTTPException(
+            status_code=429,
+            detail="OPENAI_LIMIT_REACHED"
+        )
+    except Exception as e:
+        print(f"Error extracting goal: {e}")
+        return None
+
+    # Extract the function call arguments
+    message = response.choices[0].message
+    if not message.tool_calls:
+        return None
+
+    tool_call = message.tool_calls[0]
+    if tool_call.function.name != "create_goal_roadmap":
+        return None
+
+    return parse_goal_arguments(tool_call.function.arguments)
@@ -1,18 +1,25 @@
 """Authentication service for password hashing and JWT tokens."""
 
-from datetime import datetime, timedelta
-from typing import Optional
+import time
+from datetime import timedelta
+from functools import lru_cache
+from typing import Optional, Tuple
 
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from sqlmodel import Session, select
 
 from app.config import settings
-from app.models.user import AuthProvider, User
+from app.models.user import AuthProvider, User, normalize_email
 from app.schemas.user import RegisterRequest, UserUpdate
+from app.utils.clock import utcnow
 
 # Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Reason: bcrypt is deliberately slow CPU work; the auth routes are sync
+# handlers, so it runs in FastAPI's threadpool rather than on the event loop.
+pwd_context = CryptContext(
+    schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS
+)
 
 
 def hash_password(password: str) -> str:
@@ -37,42 +44,74 @@ def create_access_token(user_id: int, expires_delta: Optional[timedelta] = None)
         Encoded JWT token string
     """
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = utcnow() + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        expire = utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
 
     to_encode = {
         "sub": str(user_id),
         "exp": expire,
-        "iat": datetime.utcnow(),
+        "iat": utcnow(),
     }
     return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
 
 
-def decode_access_token(token: str) -> Optional[int]:
+@lru_cache(maxsize=4096)
+def _verify_token(token: str) -> Optional[Tuple[int, Optional[int]]]:
     """
-    Decode and validate a JWT access token.
+    Verify a token's signature and claims once per distinct token.
 
-    Args:
-        token: The JWT token to decode
+    Reason: Clients resend the same token on every request until it expires,
+    so the signature check and JSON decoding are cached per token string.
+    The result only depends on the token and the static signing key; expiry
+    is re-checked against the cached exp claim by the caller.
 
     Returns:
-        User ID if valid, None otherwise
+        (user_id, exp timestamp or None) if valid, None otherwise
     """
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
         user_id = payload.get("sub")
         if user_id is None:
             return None
-        return int(user_id)
-    except JWTError:
+        expires_at = payload.get("exp")
+        return int(user_id), None if expires_at is None else int(expires_at)
+    except (JWTError, ValueError):
+        return None
+
+
+def decode_access_token(token: str) -> Optional[int]:
+    """
+    Decode and validate a JWT access token.
+
+    Args:
+        token: The JWT token to decode
+
+    Returns:
+        User ID if valid, None otherwise
+    """
+    claims = _verify_token(token)
+    if claims is None:
         return None
+    user_id, expires_at = claims
+    if expires_at is not None and expires_at <= time.time():
+        return None
+    return user_id
 
 
 def get_user_by_email(db: Session, email: str) -> Optional[User]:
-    """Get a user by their email address."""
-    statement = select(User).where(User.email == email)
-    return db.exec(statement).first()
+    """
+    Get a user by their email address (case-insensitive).
+
+    An exact match wins, then the normalized email. Both columns are unique,
+    so each lookup matches at most one account.
+    """
+    # Reason: Exact match first - it is the common case and the only way to
+    # reach accounts whose email_ci was cleared as a case-duplicate.
+    user = db.exec(select(User).where(User.email == email)).first()
+    if user is None:
+        user = db.exec(select(User).where(User.email_ci == normalize_email(email))).first()
+    return user
 
 
 def get_user_by_id(db: Session, user_id: int) -> Optional[User]:
@@ -141,7 +180,6 @@ def update_user_profile(db: Session, user: User, data: UserUpdate) -> User:
     for field, value in update_data.items():
         setattr(user, field, value)
 
-    user.updated_at = datetime.utcnow()
     db.add(user)
     db.commit()
     db.refresh(user)
@@ -0,0 +1,307 @@
+"""
+Chat session persistence for the AI-backed chat endpoints.
+
+send_message and finalize_session stay ``async`` to await LLM calls, so
+their database work lives here as plain sync functions that the routes run
+with run_in_threadpool instead of blocking the event loop. The agent
+hand-off shared by the plain and streaming message routes
+(generate_agent_reply) is the one async function.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import update
+from sqlmodel import Session, select
+
+from app.config import settings
+from app.models.chat import ChatMessage, ChatSession, ChatStatus, MessageRole
+from app.models.goal import Goal
+from app.schemas.chat import MessageResponse, SendMessageResponse
+from app.schemas.goal import AIGoalGeneration
+from app.services import goal_service
+from app.services.quota_service import check_user_quota, track_openai_usage
+from app.utils.clock import utcnow
+
+logger = logging.getLogger(__name__)
+
+
+def get_active_session(
+    db: Session,
+    session_id: int,
+    user_id: int,
+    inactive_detail: str,
+) -> ChatSession:
+    """
+    Fetch a chat session the user owns and can still write to.
+
+    Args:
+        db: Database session
+        session_id: Chat session ID
+        user_id: Requesting user's ID
+        inactive_detail: Error detail when the session is no longer active
+
+    Returns:
+        The active ChatSession
+
+    Raises:
+        HTTPException: 404 if missing, 403 if not owned, 400 if not active
+    """
+    session = db.get(ChatSession, session_id)
+
+    if not session:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Chat session not found",
+        )
+
+    if session.user_id != user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied",
+        )
+
+    if session.status != ChatStatus.ACTIVE:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=inactive_detail,
+        )
+
+    return session
+
+
+def release_connection(db: Session) -> None:
+    """
+    Return the session's pooled connection before a long AI call.
+
+    Reason: Closing (rather than committing) ends the read transaction
+    without expiring loaded objects, so they stay readable while detached;
+    the session checks out a fresh connection on its next query and
+    db.add() re-attaches any object that is written again.
+    """
+    db.close()
+
+
+def check_quota(db: Session, user_id: int) -> None:
+    """
+    Enforce the user's token quota, then free the connection for the AI call.
+
+    Raises:
+        QuotaExceededError: If the user has exceeded their quota
+    """
+    try:
+        check_user_quota(db, user_id)
+    finally:
+        release_connection(db)
+
+
+def get_recent_history(db: Session, session_id: int, limit: int) -> List[Dict[str, str]]:
+    """
+    Return the last ``limit`` messages of a session, oldest first.
+
+    Args:
+        db: Database session
+        session_id: Chat session ID
+        limit: Most messages to return
+
+    Returns:
+        Message dicts with role and content keys
+    """
+    rows = db.exec(
+        select(ChatMessage.role, ChatMessage.content)
+        .where(ChatMessage.session_id == session_id)
+        .order_by(ChatMessage.created_at.desc(), ChatMessage.id.desc())
+        .limit(limit)
+    ).all()
+    return [{"role": role, "content": content} for role, content in reversed(rows)]
+
+
+def start_turn(
+    db: Session,
+    session_id: int,
+    user_id: int,
+    content: str,
+) -> Tuple[Optional[int], MessageResponse, List[Dict[str, str]], Optional[Dict[str, Any]]]:
+    """
+    Save the user's message and load what the AI reply needs, in one commit.
+
+    Reason: The message is committed before the AI call so a failed or
+    abandoned reply never loses what the user typed; the history read
+    shares that transaction rather than costing a second one. History is capped at CHAT_CONTEXT_MESSAGES
+    rather than reloading the whole conversation every turn.
+
+    Args:
+        db: Database session
+        session_id: Chat session ID
+        user_id: Requesting user's ID
+        content: The user's message
+
+    Returns:
+        (session's goal ID, saved user message, recent history ending with
+        the new message, goal snapshot or None); the database connection is
+        released before returning
+    """
+    session = get_active_session(
+        db, session_id, user_id, "Cannot send messages to a completed session"
+    )
+    goal_id = session.goal_id
+
+    current_goal = None
+    if goal_id:
+        goal = db.get(Goal, goal_id)
+        if goal:
+            current_goal = goal.model_dump()
+
+    history = get_recent_history(db, session_id, settings.CHAT_CONTEXT_MESSAGES - 1)
+    history.append({"role": MessageRole.USER, "content": content})
+
+    user_message = ChatMessage(
+        session_id=session_id,
+        role=MessageRole.USER,
+        content=content,
+    )
+    db.add(user_message)
+    db.flush()
+    # Reason: Built between flush and commit, while the instance still holds
+    # its values (flush assigned the ID), so no refresh SELECT is needed.
+    saved_message = MessageResponse.model_validate(user_message)
+    db.commit()
+    release_connection(db)
+    return goal_id, saved_message, history, current_goal
+
+
+async def generate_agent_reply(
+    user_id: int,
+    session_id: int,
+    goal_id: Optional[int],
+    history: List[Dict[str, str]],
+    current_goal: Optional[Dict[str, Any]],
+) -> Optional[str]:
+    """
+    Ask the agent coordinator for a reply to the latest turn.
+
+    Args:
+        user_id: User sending the message
+        session_id: Chat session ID
+        goal_id: Goal the session is linked to, if any
+        history: Recent messages, ending with the user's new one
+        current_goal: The linked goal's fields, if any
+
+    Returns:
+        The agent's reply, or None if no agent produced one (the caller then
+        falls back to the plain AI service)
+    """
+    from app.agents.base_agent import AgentContext, normalize_role
+    from app.agents.coordinator import get_agent_coordinator
+
+    agent_context = AgentContext(
+        user_id=user_id,
+        goal_id=goal_id,
+        session_id=session_id,
+        messages=[
+            {"role": normalize_role(m["role"]), "content": m["content"]}
+            for m in history
+        ],
+        current_goal=current_goal,
+        additional_context={"request_type": None},  # Allow routing to infer
+    )
+    try:
+        agent_response = await get_agent_coordinator().route(agent_context)
+    except Exception as e:
+        logger.warning(f"Falling back to legacy AI service: {e}")
+        return None
+    if not (agent_response.success and agent_response.message):
+        logger.warning(f"Falling back to legacy AI service: {agent_response.message}")
+        return None
+    return agent_response.message
+
+
+def save_turn(
+    db: Session,
+    session_id: int,
+    user_id: int,
+    user_message: MessageResponse,
+    reply: str,
+    token_usage: Optional[Any] = None,
+) -> SendMessageResponse:
+    """
+    Save the assistant's reply to a turn started by start_turn.
+
+    Args:
+        db: Database session
+        session_id: Chat session being replied in
+        user_id: Session owner, charged for token_usage
+        user_message: The user message saved by start_turn
+        reply: Assistant reply text
+        token_usage: OpenAI usage to charge against the user's quota, if any
+
+    Returns:
+        Both saved messages
+    """
+    # Reason: Quota tracking failures must not lose the reply, so they are
+    # logged and swallowed here rather than raised to the route.
+    if token_usage:
+        try:
+            usage_info = track_openai_usage(db, user_id, token_usage)
+            logger.info(
+                f"User {user_id} token usage: "
+                f"{usage_info.get('tokens_used_this_call', 0)} tokens"
+            )
+        except Exception as e:
+            logger.warning(f"Failed to track token usage: {type(e).__name__}: {e}")
+
+    assistant_message = ChatMessage(
+        session_id=session_id,
+        role=MessageRole.ASSISTANT,
+        content=reply,
+    )
+    db.add(assistant_message)
+    # Reason: A bulk UPDATE bumps the session without loading it first
+    db.exec(
+        update(ChatSession).where(ChatSession.id == session_id).values(updated_at=utcnow())
+    )
+    db.flush()
+    response = SendMessageResponse(
+        user_message=user_message,
+        assistant_message=MessageResponse.model_validate(assistant_message),
+    )
+    db.commit()
+    return response
+
+
+def finalize(
+    db: Session,
+    session: ChatSession,
+    user_id: int,
+    goal_data: AIGoalGeneration,
+) -> Goal:
+    """
+    Create the extracted goal and close the chat session.
+
+    Args:
+        db: Database session
+        session: Active chat session being finalized
+        user_id: Owner's user ID
+        goal_data: Goal structure extracted by the AI
+
+    Returns:
+        The created Goal
+    """
+    goal = goal_service.create_goal_from_ai(
+        db=db,
+        user_id=user_id,
+        chat_session_id=session.id,
+        data=goal_data,
+    )
+
+    session.status = ChatStatus.FINALIZED
+    session.title = goal.title
+    session.goal_id = goal.id
+    # Reason: session was detached by release_connection; add() re-attaches it
+    db.add(session)
+    db.commit()
+    # Reason: The commit expired the goal; reload it here, in the worker
+    # thread, rather than lazily when the route serializes the response.
+    db.refresh(goal)
+    return goal
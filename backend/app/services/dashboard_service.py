@@ -0,0 +1,116 @@
+"""
+Cached dashboard reads.
+
+The dashboard is re-fetched on every app open and tab focus, so its stats,
+quota and the goal summaries its agent panels send are served from
+short-lived caches. Routes that change a user's goals, milestones or tasks
+call invalidate_dashboard_stats and invalidate_goal_summary after committing.
+"""
+
+from typing import Optional
+
+from sqlmodel import Session
+
+from app.schemas.goal import DashboardStats
+from app.models.goal import Goal
+from app.services import goal_service
+from app.services.quota_service import get_user_quota_info
+from app.utils.cache import TTLCache
+
+# Reason: Invalidation covers the user's own edits; the TTL only bounds
+# staleness from time passing (streaks, due dates) and other writers.
+_stats_cache = TTLCache(maxsize=10_000, ttl=30)
+
+# Quota changes only as chat replies are charged; ten seconds behind is fine
+_quota_cache = TTLCache(maxsize=10_000, ttl=10)
+
+# Reason: The dashboard calls /daily, /insights and /resources for the same
+# goal back to back; caching the summary saves repeating the SELECT each
+# time, and writes pop it so agents never see an edited or deleted goal.
+_goal_summary_cache = TTLCache(maxsize=10_000, ttl=30)
+
+
+def get_dashboard_stats(db: Session, user_id: int) -> DashboardStats:
+    """
+    Get dashboard statistics for a user, cached per user.
+
+    Args:
+        db: Database session
+        user_id: User's ID
+
+    Returns:
+        Dashboard statistics (see goal_service.get_dashboard_stats)
+    """
+    stats = _stats_cache.get(user_id)
+    if stats is None:
+        stats = goal_service.get_dashboard_stats(db, user_id)
+        _stats_cache.set(user_id, stats)
+    return stats
+
+
+def invalidate_dashboard_stats(user_id: int) -> None:
+    """Drop a user's cached stats after their goals or tasks change."""
+    _stats_cache.pop(user_id)
+
+
+def get_quota_info(db: Session, user_id: int) -> dict:
+    """
+    Get a user's token quota status, cached per user.
+
+    Args:
+        db: Database session
+        user_id: User's ID
+
+    Returns:
+        Quota info dict (see quota_service.get_user_quota_info)
+    """
+    info = _quota_cache.get(user_id)
+    if info is None:
+        info = get_user_quota_info(db, user_id)
+        _quota_cache.set(user_id, info)
+    return info
+
+
+def get_goal_summary(db: Session, user_id: int, goal_id: int) -> Optional[dict]:
+    """
+    Summarize a goal for an agent context, cached per user and goal.
+
+    Args:
+        db: Database session
+        user_id: User who must own the goal
+        goal_id: Goal to summarize
+
+    Returns:
+        Goal summary dict, or None if the goal is missing or not the user's
+    """
+    key = (user_id, goal_id)
+    summary = _goal_summary_cache.get(key)
+    if summary is not None:
+        return summary
+
+    goal = db.get(Goal, goal_id)
+    if not goal or goal.user_id != user_id:
+        return None
+
+    summary = {
+        "id": goal.id,
+        "title": goal.title,
+        "description": goal.description,
+        "category": goal.category,
+        "target_date": goal.target_date.isoformat() if goal.target_date else None,
+        "progress": goal.progress
+    }
+    _goal_summary_cache.set(key, summary)
+    return summary
+
+
+def invalidate_goal_summary(user_id: int, goal_id: int) -> None:
+    """Drop a goal's cached summary after it, or its milestones or tasks, change."""
+    _goal_summary_cache.pop((user_id, goal_id))
+
+
+def clear_dashboard_caches() -> None:
+    """Empty all caches (for tests and admin tooling)."""
+    _stats_cache.clear()
+    _quota_cache.clear()
+    _goal_summary_cache.clear()
@@ -0,0 +1,92 @@
+"""
+Vectorized score statistics for experiment summaries.
+
+Each item is reduced to a (score, low, high) row as it finishes (NaN score
+for items that errored), so a run keeps three floats per item rather than
+its result dicts. The rows become NumPy columns, and the mean, pass rate
+and percentiles are computed by array operations.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Sequence, Tuple
+
+import numpy as np
+
+
+@dataclass(slots=True)
+class ScoreSummary:
+    """Aggregate statistics over the scored items of one experiment."""
+
+    n_valid: int  # Items that produced a score
+    pass_count: int  # Scored items inside their expected range
+    average: float
+    p50: float
+    p90: float
+
+    @property
+    def pass_rate(self) -> float:
+        """Share of scored items inside their expected range."""
+        return self.pass_count / self.n_valid if self.n_valid else 0.0
+
+
+# An item's score (NaN if it failed) and its expected (low, high) range
+ScoreRow = Tuple[float, float, float]
+
+
+def score_row(result: Dict[str, Any], score_key: str, expected_range: Sequence[float]) -> ScoreRow:
+    """
+    Reduce one item result to the numbers its experiment summary needs.
+
+    Args:
+        result: Item result dict (error dicts lack score_key)
+        score_key: Key holding a successful item's score
+        expected_range: The item's expected (low, high) score
+
+    Returns:
+        (score or NaN, low, high)
+    """
+    low, high = expected_range
+    return float(result.get(score_key, np.nan)), float(low), float(high)
+
+
+def score_columns(rows: Sequence[ScoreRow]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Transpose score rows into columns.
+
+    Args:
+        rows: One (score, low, high) row per item
+
+    Returns:
+        (scores with NaN for failed items, range lows, range highs)
+    """
+    table = np.array(rows, dtype=np.float64).reshape(len(rows), 3)
+    return table[:, 0], table[:, 1], table[:, 2]
+
+
+def summarize(scores: np.ndarray, lows: np.ndarray, highs: np.ndarray) -> ScoreSummary:
+    """
+    Summarize one experiment's scores.
+
+    Args:
+        scores: Item scores, NaN where the item failed
+        lows: Lower bound of each item's expected range
+        highs: Upper bound of each item's expected range
+
+    Returns:
+        ScoreSummary (all zeros when no item was scored)
+    """
+    valid = ~np.isnan(scores)
+    n_valid = int(valid.sum())
+    if n_valid == 0:
+        return ScoreSummary(n_valid=0, pass_count=0, average=0.0, p50=0.0, p90=0.0)
+
+    scored = scores[valid]
+    in_range = (scored >= lows[valid]) & (scored <= highs[valid])
+    p50, p90 = np.percentile(scored, [50, 90])
+    return ScoreSummary(
+        n_valid=n_valid,
+        pass_count=int(in_range.sum()),
+        average=float(scored.mean()),
+        p50=float(p50),
+        p90=float(p90),
+    )
@@ -1,8 +1,11 @@
 """Goal service for CRUD operations and business logic."""
 
+from collections import defaultdict
 from datetime import datetime, date
 from typing import List, Optional
 
+from pydantic import TypeAdapter
+from sqlalchemy import case, delete
 from sqlmodel import Session, select, func
 
 from app.models.goal import (
@@ -29,6 +32,10 @@ from app.schemas.goal import (
     TaskUpdate,
     UpcomingTask,
 )
+from app.utils.clock import utcnow
+
+# Reason: Built once at import so a milestone's tasks validate in one call
+_task_list_adapter = TypeAdapter(List[TaskResponse])
 
 
 def parse_date(date_str: Optional[str]) -> Optional[date]:
@@ -122,6 +129,7 @@ def create_goal_from_ai(
         db.refresh(milestone)
 
         # Create tasks for this milestone
+        goal.total_task_count += len(milestone_data.tasks)
         for task_data in milestone_data.tasks:
             task = Task(
                 milestone_id=milestone.id,
@@ -132,6 +140,7 @@ def create_goal_from_ai(
             )
             db.add(task)
 
+    db.add(goal)
     db.commit()
     return goal
 
@@ -144,33 +153,22 @@ def get_goal_by_id(db: Session, goal_id: int, user_id: int) -> Optional[Goal]:
 
 def get_goals_for_user(db: Session, user_id: int) -> List[GoalListItem]:
     """Get all goals for a user with summary stats."""
+    # Reason: Milestone counts come from one grouped subquery joined to the
+    # goals instead of a COUNT query per goal.
+    milestone_counts = (
+        select(Milestone.goal_id, func.count(Milestone.id).label("milestone_count"))
+        .group_by(Milestone.goal_id)
+        .subquery()
+    )
     statement = (
-        select(Goal)
+        select(Goal, func.coalesce(milestone_counts.c.milestone_count, 0))
+        .outerjoin(milestone_counts, milestone_counts.c.goal_id == Goal.id)
         .where(Goal.user_id == user_id)
         .order_by(Goal.created_at.desc())
     )
-    goals = db.exec(statement).all()
 
     result = []
-    for goal in goals:
-        # Count milestones
-        milestone_count = db.exec(
-            select(func.count(Milestone.id)).where(Milestone.goal_id == goal.id)
-        ).one()
-
-        # Count tasks
-        task_count = db.exec(
-            select(func.count(Task.id)).where(Task.goal_id == goal.id)
-        ).one()
-
-        # Count completed tasks
-        completed_count = db.exec(
-            select(func.count(Task.id)).where(
-                Task.goal_id == goal.id,
-                Task.status == TaskStatus.COMPLETED,
-            )
-        ).one()
-
+    for goal, milestone_count in db.exec(statement):
         result.append(GoalListItem(
             id=goal.id,
             title=goal.title,
@@ -180,8 +178,8 @@ def get_goals_for_user(db: Session, user_id: int) -> List[GoalListItem]:
             status=goal.status,
             progress=goal.progress,
             milestone_count=milestone_count,
-            task_count=task_count,
-            completed_task_count=completed_count,
+            task_count=goal.total_task_count,
+            completed_task_count=goal.completed_task_count,
             created_at=goal.created_at,
         ))
 
@@ -206,16 +204,20 @@ def get_goal_with_milestones(
     )
     milestones = db.exec(milestones_stmt).all()
 
+    # Reason: One query for every task of the goal, grouped here, instead of
+    # one query per milestone.
+    tasks_stmt = (
+        select(Task)
+        .where(Task.goal_id == goal_id)
+        .order_by(Task.created_at, Task.id)
+    )
+    tasks_by_milestone = defaultdict(list)
+    for task in db.exec(tasks_stmt):
+        tasks_by_milestone[task.milestone_id].append(task)
+
     milestone_responses = []
     for milestone in milestones:
-        # Get tasks for this milestone
-        tasks_stmt = (
-            select(Task)
-            .where(Task.milestone_id == milestone.id)
-            .order_by(Task.created_at)
-        )
-        tasks = db.exec(tasks_stmt).all()
-
+        tasks = tasks_by_milestone[milestone.id]
         milestone_responses.append(MilestoneWithTasks(
             id=milestone.id,
             goal_id=milestone.goal_id,
@@ -226,7 +228,7 @@ def get_goal_with_milestones(
             is_completed=milestone.is_completed,
             completed_at=milestone.completed_at,
             created_at=milestone.created_at,
-            tasks=[TaskResponse.model_validate(t) for t in tasks],
+            tasks=_task_list_adapter.validate_python(tasks, from_attributes=True),
         ))
 
     return GoalWithMilestones(
@@ -250,7 +252,6 @@ def update_goal(db: Session, goal: Goal, data: GoalUpdate) -> Goal:
     update_data = data.model_dump(exclude_unset=True)
     for key, value in update_data.items():
         setattr(goal, key, value)
-    goal.updated_at = datetime.utcnow()
     db.add(goal)
     db.commit()
     db.refresh(goal)
@@ -259,15 +260,9 @@ def update_goal(db: Session, goal: Goal, data: GoalUpdate) -> Goal:
 
 def delete_goal(db: Session, goal: Goal) -> None:
     """Delete a goal and all its milestones and tasks."""
-    # Delete tasks first
-    tasks = db.exec(select(Task).where(Task.goal_id == goal.id)).all()
-    for task in tasks:
-        db.delete(task)
-
-    # Delete milestones
-    milestones = db.exec(select(Milestone).where(Milestone.goal_id == goal.id)).all()
-    for milestone in milestones:
-        db.delete(milestone)
+    # Delete tasks first, then milestones, one statement each
+    db.exec(delete(Task).where(Task.goal_id == goal.id))
+    db.exec(delete(Milestone).where(Milestone.goal_id == goal.id))
 
     # Delete goal
     db.delete(goal)
@@ -275,28 +270,28 @@ def delete_goal(db: Session, goal: Goal) -> None:
 
 
 def update_goal_progress(db: Session, goal_id: int) -> None:
-    """Recalculate and update goal progress based on completed tasks."""
-    # Count total and completed tasks
-    total = db.exec(
-        select(func.count(Task.id)).where(Task.goal_id == goal_id)
-    ).one()
-
-    if total == 0:
-        return
+    """
+    Recalculate goal progress and task counters based on completed tasks.
 
-    completed = db.exec(
-        select(func.count(Task.id)).where(
-            Task.goal_id == goal_id,
-            Task.status == TaskStatus.COMPLETED,
-        )
+    Must be called after every task insert, delete or status change so the
+    denormalized counters read by goal listings stay accurate.
+    """
+    # Count total and completed tasks in one pass
+    total, completed = db.exec(
+        select(
+            func.count(Task.id),
+            func.coalesce(
+                func.sum(case((Task.status == TaskStatus.COMPLETED, 1), else_=0)), 0
+            ),
+        ).where(Task.goal_id == goal_id)
     ).one()
 
-    progress = int((completed / total) * 100)
-
     goal = db.get(Goal, goal_id)
     if goal:
-        goal.progress = progress
-        goal.updated_at = datetime.utcnow()
+        goal.total_task_count = total
+        goal.completed_task_count = completed
+        if total > 0:
+            goal.progress = int((completed / total) * 100)
         db.add(goal)
         db.commit()
 
@@ -306,37 +301,58 @@ def update_goal_progress(db: Session, goal_id: int) -> None:
 # ===================
 
 
-def update_task_status(
+def get_task_for_user(
     db: Session,
+    goal_id: int,
     task_id: int,
     user_id: int,
-    status: TaskStatus,
 ) -> Optional[Task]:
-    """Update a task's status, verifying ownership through goal."""
-    task = db.get(Task, task_id)
-    if not task:
-        return None
+    """
+    Get a task of a goal the user owns, in one query.
 
-    # Verify ownership
-    goal = db.get(Goal, task.goal_id)
-    if not goal or goal.user_id != user_id:
-        return None
+    Reason: Joining through goal checks the task ID, its goal and the goal's
+    owner in a single round trip instead of loading goal and task separately.
+
+    Returns:
+        The task, or None if it doesn't exist, belongs to another goal, or
+        the goal isn't the user's
+    """
+    return db.exec(
+        select(Task)
+        .join(Goal, Goal.id == Task.goal_id)
+        .where(Task.id == task_id, Task.goal_id == goal_id, Goal.user_id == user_id)
+    ).first()
 
-    task.status = status
-    if status == TaskStatus.COMPLETED:
-        task.completed_at = datetime.utcnow()
-    else:
-        task.completed_at = None
+
+def update_task(db: Session, task: Task, update_data: dict) -> Task:
+    """
+    Apply field updates, including a status change, to a task in one commit.
+
+    A status change also stamps or clears completed_at and refreshes the
+    goal's progress and the milestone's completion.
+
+    Args:
+        db: Database session
+        task: Task to update (ownership already verified)
+        update_data: Field values to set, as from model_dump(exclude_unset=True)
+
+    Returns:
+        The updated task
+    """
+    for key, value in update_data.items():
+        setattr(task, key, value)
+
+    status = update_data.get("status")
+    if status is not None:
+        task.completed_at = utcnow() if status == TaskStatus.COMPLETED else None
 
     db.add(task)
     db.commit()
     db.refresh(task)
 
-    # Update goal progress
-    update_goal_progress(db, task.goal_id)
-
-    # Check if milestone should be marked complete
-    check_milestone_completion(db, task.milestone_id)
+    if status is not None:
+        update_goal_progress(db, task.goal_id)
+        check_milestone_completion(db, task.milestone_id)
 
     return task
 
@@ -360,7 +376,7 @@ def check_milestone_completion(db: Session, milestone_id: int) -> None:
     milestone.is_completed = incomplete == 0
 
     if milestone.is_completed and not was_completed:
-        milestone.completed_at = datetime.utcnow()
+        milestone.completed_at = utcnow()
     elif not milestone.is_completed:
         milestone.completed_at = None
 
@@ -555,22 +571,28 @@ def _get_upcoming_tasks(db: Session, user_id: int, limit: int = 5) -> List[Upcom
 # ===================
 
 
-def get_milestone_by_id(
+def get_milestone_for_user(
     db: Session,
+    goal_id: int,
     milestone_id: int,
     user_id: int,
 ) -> Optional[Milestone]:
-    """Get a milestone by ID, verifying ownership through goal."""
-    milestone = db.get(Milestone, milestone_id)
-    if not milestone:
-        return None
-
-    # Verify ownership through goal
-    goal = db.get(Goal, milestone.goal_id)
-    if not goal or goal.user_id != user_id:
-        return None
+    """
+    Get a milestone of a goal the user owns, in one query.
 
-    return milestone
+    Returns:
+        The milestone, or None if it doesn't exist, belongs to another goal,
+        or the goal isn't the user's
+    """
+    return db.exec(
+        select(Milestone)
+        .join(Goal, Goal.id == Milestone.goal_id)
+        .where(
+            Milestone.id == milestone_id,
+            Milestone.goal_id == goal_id,
+            Goal.user_id == user_id,
+        )
+    ).first()
 
 
 def update_milestone(
@@ -624,10 +646,8 @@ def create_milestone(
 
 def delete_milestone(db: Session, milestone: Milestone) -> None:
     """Delete a milestone and all its tasks."""
-    # Delete tasks first
-    tasks = db.exec(select(Task).where(Task.milestone_id == milestone.id)).all()
-    for task in tasks:
-        db.delete(task)
+    # Delete tasks first, in one statement
+    db.exec(delete(Task).where(Task.milestone_id == milestone.id))
 
     db.delete(milestone)
     db.commit()
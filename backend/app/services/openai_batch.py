@@ -0,0 +1,162 @@
+"""
+OpenAI Batch API helpers for offline evaluation runs.
+
+Batch requests cost half as much as live calls and do not count against
+the per-minute rate limits, at the price of completing within 24 hours
+instead of seconds. Use them for experiments, never on a request path.
+"""
+
+import time
+from typing import Any, Dict, List, Optional
+
+from openai import OpenAI
+
+from app.services.openai_clients import get_openai_client
+from app.utils import json_utils
+
+CHAT_COMPLETIONS_URL = "/v1/chat/completions"
+
+# Batch states after which polling stops
+TERMINAL_STATES = {"completed", "failed", "expired", "cancelled"}
+
+
+def chat_request(custom_id: str, body: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Wrap chat completion parameters as one batch input line.
+
+    Args:
+        custom_id: Key the result is returned under (unique within the batch)
+        body: Keyword arguments for chat.completions.create
+
+    Returns:
+        Batch request dict
+    """
+    return {"custom_id": custom_id, "method": "POST", "url": CHAT_COMPLETIONS_URL, "body": body}
+
+
+def _require_client(client: Optional[OpenAI]) -> OpenAI:
+    """Return the given client, or the shared one if configured."""
+    client = client or get_openai_client()
+    if not client:
+        raise ValueError("OpenAI API key not configured")
+    return client
+
+
+def submit_batch(requests: List[Dict[str, Any]], client: Optional[OpenAI] = None) -> str:
+    """
+    Upload batch requests as JSONL and start a batch.
+
+    Args:
+        requests: Batch request dicts (see chat_request)
+        client: OpenAI client (defaults to the shared client)
+
+    Returns:
+        Batch ID
+
+    Raises:
+        ValueError: If OpenAI is not configured or requests is empty
+    """
+    if not requests:
+        raise ValueError("A batch needs at least one request")
+    client = _require_client(client)
+
+    payload = b"\n".join(json_utils.dumps_bytes(r) for r in requests)
+    input_file = client.files.create(file=("batch.jsonl", payload), purpose="batch")
+
+    # Reason: openai==1.12 predates client.batches; the REST call is the same
+    batch = client.post(
+        "/batches",
+        body={
+            "input_file_id": input_file.id,
+            "endpoint": CHAT_COMPLETIONS_URL,
+            "completion_window": "24h",
+        },
+        cast_to=object,
+    )
+    return batch["id"]
+
+
+def parse_batch_output(text: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Map a batch output (or error) file's lines to results by custom_id.
+
+    Args:
+        text: JSONL file content
+
+    Returns:
+        custom_id -> chat completion body, or {"error": message} for a
+        request that failed
+    """
+    results = {}
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        record = json_utils.loads(line)
+        response = record.get("response") or {}
+        if record.get("error") or response.get("status_code") != 200:
+            error = record.get("error") or response.get("body", {}).get("error") or {}
+            results[record["custom_id"]] = {"error": error.get("message", "Batch request failed")}
+        else:
+            results[record["custom_id"]] = response["body"]
+    return results
+
+
+def await_batch(
+    batch_id: str,
+    client: Optional[OpenAI] = None,
+    poll_interval: float = 30.0,
+    timeout: float = 24 * 3600,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Block until a batch finishes, then download its results.
+
+    Args:
+        batch_id: ID from submit_batch
+        client: OpenAI client (defaults to the shared client)
+        poll_interval: Seconds between status checks
+        timeout: Seconds to wait before giving up
+
+    Returns:
+        custom_id -> result (see parse_batch_output)
+
+    Raises:
+        RuntimeError: If the batch fails, expires or is cancelled
+        TimeoutError: If it is still running after timeout seconds
+    """
+    client = _require_client(client)
+    deadline = time.monotonic() + timeout
+    while True:
+        batch = client.get(f"/batches/{batch_id}", cast_to=object)
+        if batch["status"] in TERMINAL_STATES:
+            break
+        if time.monotonic() >= deadline:
+            raise TimeoutError(f"Batch {batch_id} still {batch['status']} after {timeout:.0f}s")
+        time.sleep(poll_interval)
+
+    if batch["status"] != "completed":
+        raise RuntimeError(f"Batch {batch_id} {batch['status']}")
+
+    results = {}
+    # Failed requests land in a separate error file
+    for file_id in (batch.get("output_file_id"), batch.get("error_file_id")):
+        if file_id:
+            results.update(parse_batch_output(client.files.content(file_id).text))
+    return results
+
+
+def completion_message(result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Get the assistant message from one batch result.
+
+    Args:
+        result: Value from await_batch for one custom_id
+
+    Returns:
+        The first choice's message dict
+
+    Raises:
+        RuntimeError: If the request failed
+    """
+    if "error" in result:
+        raise RuntimeError(result["error"])
+    return result["choices"][0]["message"]
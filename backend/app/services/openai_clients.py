@@ -0,0 +1,388 @@
+"""Shared OpenAI clients and request builders.
+
+Holds the process-wide OpenAI connection pool, the admin-editable system
+prompts and the functions that build chat completion parameters, so live
+calls (ai_service, the agents) and OpenAI Batch API requests send the same
+prompts and settings.
+"""
+
+from typing import Iterable, List, Optional
+
+import httpx
+from openai import AsyncOpenAI, OpenAI
+from sqlmodel import Session, create_engine, select
+
+from app.config import settings
+from app.models.prompt import SystemPrompt
+from app.utils.clock import utcnow
+
+# Opik integration imports
+try:
+    from opik import track
+    from opik.integrations.openai import track_openai
+    OPIK_AVAILABLE = True
+except ImportError:
+    OPIK_AVAILABLE = False
+    # Create a no-op decorator if Opik is not available
+    def track(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator if not args else args[0]
+    track_openai = lambda x: x
+
+# Default model for all AI conversations
+AI_MODEL = "gpt-4o-mini"
+
+# In-memory cache for prompts
+_prompt_cache = {}
+
+def get_db_session():
+    """Create a new database session."""
+    connect_args = {"check_same_thread": False} if settings.DATABASE_URL.startswith("sqlite") else {}
+    engine = create_engine(settings.DATABASE_URL, connect_args=connect_args)
+    return Session(engine)
+
+def get_system_prompt(key: str, default: str) -> str:
+    """Get system prompt from cache or DB."""
+    if key in _prompt_cache:
+        return _prompt_cache[key]
+        
+    try:
+        with get_db_session() as session:
+            prompt = session.exec(select(SystemPrompt).where(SystemPrompt.key == key)).first()
+            if prompt:
+                _prompt_cache[key] = prompt.content
+                return prompt.content
+    except Exception as e:
+        print(f"Error fetching prompt {key}: {e}")
+        
+    return default
+
+def clear_prompt_cache():
+    """Clear the prompt cache."""
+    global _prompt_cache
+    _prompt_cache = {}
+
+# Default prompts
+DEFAULT_CHAT_SYSTEM = """You are an AI goal coach for MileSync. Your role is to help users define SMART goals
+(Specific, Measurable, Achievable, Relevant, Time-bound), understand their motivations,
+identify potential obstacles, and create actionable plans.
+
+Guidelines:
+1. Ask clarifying questions to deeply understand the user's goal before suggesting a roadmap
+2. Help break down large goals into manageable milestones
+3. Be encouraging but realistic about timelines and effort required
+4. Identify potential obstacles and suggest strategies to overcome them
+5. When the conversation feels complete, summarize the goal and key milestones
+
+Keep responses concise but helpful. Use a friendly, supportive tone."""
+
+# Shared HTTP transport for all OpenAI calls.
+# Reason: One pooled client per process reuses TCP/TLS connections across
+# agents and requests instead of each OpenAI client opening its own.
+OPENAI_HTTP_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=100)
+OPENAI_HTTP_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 multiplexing in httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+_http_client: Optional[httpx.Client] = None
+_async_http_client: Optional[httpx.AsyncClient] = None
+
+# Global tracked client - initialized once
+_tracked_client = None
+
+
+def get_openai_client() -> Optional[OpenAI]:
+    """
+    Get OpenAI client instance wrapped with Opik tracing.
+
+    Returns:
+        OpenAI client if API key is configured, None otherwise
+    """
+    global _tracked_client, _http_client
+    
+    if not settings.OPENAI_API_KEY:
+        return None
+    
+    if _tracked_client is None:
+        _http_client = httpx.Client(
+            limits=OPENAI_HTTP_LIMITS,
+            timeout=OPENAI_HTTP_TIMEOUT,
+            http2=HTTP2_AVAILABLE,
+        )
+        base_client = OpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            http_client=_http_client,
+            max_retries=settings.OPENAI_MAX_RETRIES,
+        )
+        # Wrap with Opik tracking if available
+        if OPIK_AVAILABLE and settings.OPIK_API_KEY:
+            _tracked_client = track_openai(base_client)
+        else:
+            _tracked_client = base_client
+    
+    return _tracked_client
+
+
+# Global async client - used for concurrent (batched) agent calls
+_tracked_async_client = None
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared async HTTP connection pool for OpenAI clients.
+
+    Other async OpenAI clients (such as the evaluation judges) pass this as
+    their http_client so every call reuses the same warm connections.
+
+    Returns:
+        Pooled httpx.AsyncClient, created on first use
+    """
+    global _async_http_client
+
+    if _async_http_client is None:
+        _async_http_client = httpx.AsyncClient(
+            limits=OPENAI_HTTP_LIMITS,
+            timeout=OPENAI_HTTP_TIMEOUT,
+            http2=HTTP2_AVAILABLE,
+        )
+    return _async_http_client
+
+
+def get_async_openai_client() -> Optional[AsyncOpenAI]:
+    """
+    Get AsyncOpenAI client instance wrapped with Opik tracing.
+
+    Used when several completions should be awaited concurrently instead
+    of blocking the event loop one round trip at a time.
+
+    Returns:
+        AsyncOpenAI client if API key is configured, None otherwise
+    """
+    global _tracked_async_client
+
+    if not settings.OPENAI_API_KEY:
+        return None
+
+    if _tracked_async_client is None:
+        base_client = AsyncOpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            http_client=get_async_http_client(),
+            max_retries=settings.OPENAI_MAX_RETRIES,
+        )
+        if OPIK_AVAILABLE and settings.OPIK_API_KEY:
+            _tracked_async_client = track_openai(base_client)
+        else:
+            _tracked_async_client = base_client
+
+    return _tracked_async_client
+
+
+async def close_openai_clients() -> None:
+    """Close the shared OpenAI HTTP connection pools (called on app shutdown)."""
+    global _http_client, _async_http_client, _tracked_client, _tracked_async_client
+
+    if _async_http_client is not None:
+        await _async_http_client.aclose()
+    if _http_client is not None:
+        _http_client.close()
+
+    _http_client = None
+    _async_http_client = None
+    _tracked_client = None
+    _tracked_async_client = None
+
+
+def format_messages_for_openai(
+    messages: Iterable[dict],
+    include_system: bool = True
+) -> List[dict]:
+    """
+    Format chat messages for OpenAI API.
+
+    Args:
+        messages: Message dicts with 'role' and 'content' (any iterable)
+        include_system: Whether to include system prompt
+
+    Returns:
+        Formatted messages list for OpenAI
+    """
+    formatted = []
+
+    if include_system:
+        formatted.append({
+            "role": "system",
+            "content": get_system_prompt("chat_system_prompt", DEFAULT_CHAT_SYSTEM)
+        })
+
+    for msg in messages:
+        formatted.append({
+            "role": msg["role"],
+            "content": msg["content"]
+        })
+
+    return formatted
+
+
+def build_chat_request(messages: Iterable[dict], model: str = AI_MODEL) -> dict:
+    """
+    Build the chat completion parameters for a coaching reply.
+
+    Shared by live calls and OpenAI Batch API requests so both send the
+    same prompt and sampling settings.
+
+    Args:
+        messages: Message dicts with 'role' and 'content'
+        model: OpenAI model to use
+
+    Returns:
+        Keyword arguments for chat.completions.create
+    """
+    return {
+        "model": model,
+        "messages": format_messages_for_openai(messages),
+        "max_tokens": 1000,
+        "temperature": 0.7,
+    }
+
+
+# OpenAI tool/function definition for goal extraction
+GOAL_EXTRACTION_TOOL = {
+    "type": "function",
+    "function": {
+        "name": "create_goal_roadmap",
+        "description": "Extract a structured goal with milestones and tasks from the conversation",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "title": {
+                    "type": "string",
+                    "description": "A concise, action-oriented title for the goal (e.g., 'Learn Spanish to conversational level')"
+                },
+                "description": {
+                    "type": "string",
+                    "description": "A 1-2 sentence description of the goal and why it matters"
+                },
+                "category": {
+                    "type": "string",
+                    "enum": ["health", "career", "education", "finance", "personal", "other"],
+                    "description": "The category that best fits this goal"
+                },
+                "target_date": {
+                    "type": "string",
+                    "description": "Target completion date in YYYY-MM-DD format (MUST be in the future, e.g., 2026+)"
+                },
+                "milestones": {
+                    "type": "array",
+                    "description": "3-7 major checkpoints to achieve the goal",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "title": {
+                                "type": "string",
+                                "description": "Milestone title"
+                            },
+                            "description": {
+                                "type": "string",
+                                "description": "Brief description of what this milestone involves"
+                            },
+                            "target_date": {
+                                "type": "string",
+                                "description": "Target date for this milestone in YYYY-MM-DD format (MUST be in the future)"
+                            },
+                            "tasks": {
+                                "type": "array",
+                                "description": "2-5 specific, actionable tasks for this milestone",
+                                "items": {
+                                    "type": "object",
+                                    "properties": {
+                                        "title": {
+                                            "type": "string",
+                                            "description": "Task title - should be specific and actionable"
+                                        },
+                                        "description": {
+                                            "type": "string",
+                                            "description": "Optional details about the task"
+                                        },
+                                        "priority": {
+                                            "type": "string",
+                                            "enum": ["low", "medium", "high"],
+                                            "description": "Task priority level"
+                                        }
+                                    },
+                                    "required": ["title"]
+                                }
+                            }
+                        },
+                        "required": ["title", "tasks"]
+                    }
+                }
+            },
+            "required": ["title", "description", "category", "milestones"]
+        }
+    }
+}
+
+
+def build_goal_extraction_request(messages: Iterable[dict]) -> dict:
+    """
+    Build the function-calling request that extracts a goal from a chat.
+
+    Shared by live calls and OpenAI Batch API requests.
+
+    Args:
+        messages: Message dicts from the conversation (any iterable)
+
+    Returns:
+        Keyword arguments for chat.completions.create
+    """
+    # Build conversation context
+    conversation = "\n".join(
+        f"{m['role'].upper()}: {m['content']}"
+        for m in messages
+    )
+
+    default_template = """Based on the following goal coaching conversation, extract a structured goal with milestones and tasks.
+
+The goal should be SMART (Specific, Measurable, Achievable, Relevant, Time-bound).
+Today's date is {date}. IMPORTANT: Ensure all target dates (goal and milestones) are strictly in the future, starting after {date}.
+Create 3-7 milestones that logically progress toward the goal.
+Each milestone should have 2-5 specific, actionable tasks.
+
+Conversation:
+{conversation}
+
+Extract the goal structure using the provided function."""
+
+    template = get_system_prompt("goal_extraction_template", default_template)
+    current_date = utcnow().strftime('%Y-%m-%d')
+    # Use formatted date in prompt to ground the model
+    try:
+        extraction_prompt = template.format(conversation=conversation, date=current_date)
+    except KeyError:
+        # Fallback if custom template doesn't support {date}
+        extraction_prompt = template.format(conversation=conversation) + f"\n\nToday's date is {current_date}."""
+    
+    system_role = get_system_prompt("goal_extraction_system", "You are a goal extraction assistant. Analyze conversations and extract structured goals.")
+
+    return {
+        "model": AI_MODEL,
+        "messages": [
+            {
+                "role": "system",
+                "content": system_role
+            },
+            {
+                "role": "user",
+                "content": extraction_prompt
+            }
+        ],
+        "tools": [GOAL_EXTRACTION_TOOL],
+        "tool_choice": {"type": "function", "function": {"name": "create_goal_roadmap"}},
+        "max_tokens": 2000,
+        "temperature": 0.3,
+    }
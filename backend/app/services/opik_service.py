@@ -8,11 +8,16 @@ This module provides comprehensive integration with Opik for:
 """
 
 import os
+from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional
 from functools import wraps
 import logging
 
+from openai import AsyncOpenAI, OpenAI
+
 from app.config import settings
+from app.services.openai_clients import get_async_http_client
+from app.utils import json_utils
 
 logger = logging.getLogger(__name__)
 
@@ -71,8 +76,6 @@ def get_tracked_openai_client():
     Returns:
         Tracked OpenAI client if Opik is configured, regular client otherwise
     """
-    from openai import OpenAI
-    
     if not settings.OPENAI_API_KEY:
         return None
     
@@ -93,7 +96,89 @@ def get_tracked_openai_client():
 # Custom Evaluation Metrics
 # ============================
 
-class GoalCoachingQualityMetric:
+class _LLMJudge(ABC):
+    """
+    Base for LLM-as-judge evaluators; holds the model and reusable clients.
+
+    Subclasses set PROMPT and MAX_TOKENS and implement _parse (judge reply
+    text to result dict) and _error_result (fallback when the call or the
+    parse fails). Each public method has a sync form and an async twin
+    that awaits AsyncOpenAI, so many judgements can run on one event loop.
+
+    With raise_errors, a failed call or an unparseable verdict raises
+    instead of returning the fallback, so callers that cache verdicts (the
+    experiment runner) never store a transient 429, a timeout or a garbled
+    reply as if it were a real score.
+    """
+
+    PROMPT: str = ""
+    MAX_TOKENS: int = 200
+    
+    def __init__(self, model: str = "gpt-4o-mini", raise_errors: bool = False):
+        self.model = model
+        self.raise_errors = raise_errors
+        self._client: Optional[OpenAI] = None
+        self._async_client: Optional[AsyncOpenAI] = None
+    
+    @property
+    def client(self) -> OpenAI:
+        """OpenAI client, created on first use and reused for later calls."""
+        if self._client is None:
+            self._client = OpenAI(api_key=settings.OPENAI_API_KEY)
+        return self._client
+
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """AsyncOpenAI client, created on first use and reused for later calls."""
+        if self._async_client is None:
+            # Reason: Judges share the app's pooled connections but stay an
+            # untraced client, so their calls don't show up as coaching traces.
+            self._async_client = AsyncOpenAI(
+                api_key=settings.OPENAI_API_KEY,
+                http_client=get_async_http_client(),
+                max_retries=settings.OPENAI_MAX_RETRIES,
+            )
+        return self._async_client
+
+    def _request(self, inputs: Dict[str, str]) -> Dict[str, Any]:
+        """Chat completion parameters for judging the given inputs."""
+        return {
+            "model": self.model,
+            "messages": [{"role": "user", "content": self.PROMPT.format(**inputs)}],
+            "max_tokens": self.MAX_TOKENS,
+            "temperature": 0.1,
+        }
+
+    @abstractmethod
+    def _parse(self, result_text: str) -> Dict[str, Any]:
+        """Turn the judge model's reply text into the result dict."""
+
+    @abstractmethod
+    def _error_result(self, error: Exception) -> Dict[str, Any]:
+        """Fallback result when the call or the parse fails."""
+
+    def _judge(self, **inputs: str) -> Dict[str, Any]:
+        """Ask the judge model about the inputs and parse its verdict."""
+        try:
+            response = self.client.chat.completions.create(**self._request(inputs))
+            return self._parse(response.choices[0].message.content or "")
+        except Exception as e:
+            if self.raise_errors:
+                raise
+            return self._error_result(e)
+
+    async def _judge_async(self, **inputs: str) -> Dict[str, Any]:
+        """Async twin of _judge."""
+        try:
+            response = await self.async_client.chat.completions.create(**self._request(inputs))
+            return self._parse(response.choices[0].message.content or "")
+        except Exception as e:
+            if self.raise_errors:
+                raise
+            return self._error_result(e)
+
+
+class GoalCoachingQualityMetric(_LLMJudge):
     """
     Custom LLM-as-judge metric for evaluating AI goal coaching quality.
     
@@ -104,7 +189,7 @@ class GoalCoachingQualityMetric:
     - Clarity and helpfulness
     """
     
-    EVALUATION_PROMPT = """You are an expert evaluator for AI goal coaching systems.
+    PROMPT = """You are an expert evaluator for AI goal coaching systems.
     
 Evaluate the AI coach's response based on these criteria:
 1. **SMART Alignment**: Does the response help the user define goals that are Specific, Measurable, Achievable, Relevant, and Time-bound?
@@ -125,9 +210,24 @@ Respond with ONLY a JSON object in this format:
 {{"score": 0.X, "reason": "Brief explanation of the rating"}}
 """
 
-    def __init__(self, model: str = "gpt-4o-mini"):
-        self.model = model
-    
+    MAX_TOKENS = 200
+
+    def _parse(self, result_text: str) -> Dict[str, Any]:
+        try:
+            result = json_utils.loads(result_text)
+        except json_utils.JSONDecodeError:
+            if self.raise_errors:
+                raise
+            return {"score": 0.5, "reason": "Failed to parse evaluation response"}
+        return {
+            "score": float(result.get("score", 0.5)),
+            "reason": result.get("reason", "No explanation provided")
+        }
+
+    def _error_result(self, error: Exception) -> Dict[str, Any]:
+        logger.error(f"Error scoring coaching quality: {error}")
+        return {"score": 0.5, "reason": f"Evaluation error: {str(error)}"}
+
     def score(self, user_input: str, ai_response: str) -> Dict[str, Any]:
         """
         Score the AI coaching response quality.
@@ -139,42 +239,14 @@ Respond with ONLY a JSON object in this format:
         Returns:
             Dict with 'score' (0-1) and 'reason'
         """
-        try:
-            from openai import OpenAI
-            import json
-            
-            client = OpenAI(api_key=settings.OPENAI_API_KEY)
-            
-            prompt = self.EVALUATION_PROMPT.format(
-                user_input=user_input,
-                ai_response=ai_response
-            )
-            
-            response = client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=200,
-                temperature=0.1,
-            )
-            
-            result_text = response.choices[0].message.content or ""
-            
-            # Parse the JSON response
-            try:
-                result = json.loads(result_text)
-                return {
-                    "score": float(result.get("score", 0.5)),
-                    "reason": result.get("reason", "No explanation provided")
-                }
-            except json.JSONDecodeError:
-                return {"score": 0.5, "reason": "Failed to parse evaluation response"}
-                
-        except Exception as e:
-            logger.error(f"Error scoring coaching quality: {e}")
-            return {"score": 0.5, "reason": f"Evaluation error: {str(e)}"}
+        return self._judge(user_input=user_input, ai_response=ai_response)
+
+    async def score_async(self, user_input: str, ai_response: str) -> Dict[str, Any]:
+        """Async twin of score."""
+        return await self._judge_async(user_input=user_input, ai_response=ai_response)
 
 
-class GoalExtractionQualityMetric:
+class GoalExtractionQualityMetric(_LLMJudge):
     """
     Custom metric for evaluating AI-extracted goal quality.
     
@@ -185,7 +257,7 @@ class GoalExtractionQualityMetric:
     - Task actionability
     """
     
-    EVALUATION_PROMPT = """You are an expert evaluator for goal extraction systems.
+    PROMPT = """You are an expert evaluator for goal extraction systems.
 
 Evaluate the extracted goal structure from a coaching conversation:
 
@@ -213,9 +285,25 @@ Respond with ONLY a JSON object:
 {{"score": 0.X, "reason": "Brief explanation", "improvements": ["suggestion1", "suggestion2"]}}
 """
 
-    def __init__(self, model: str = "gpt-4o-mini"):
-        self.model = model
-    
+    MAX_TOKENS = 300
+
+    def _parse(self, result_text: str) -> Dict[str, Any]:
+        try:
+            result = json_utils.loads(result_text)
+        except json_utils.JSONDecodeError:
+            if self.raise_errors:
+                raise
+            return {"score": 0.5, "reason": "Parse error", "improvements": []}
+        return {
+            "score": float(result.get("score", 0.5)),
+            "reason": result.get("reason", "No explanation"),
+            "improvements": result.get("improvements", [])
+        }
+
+    def _error_result(self, error: Exception) -> Dict[str, Any]:
+        logger.error(f"Error scoring goal extraction: {error}")
+        return {"score": 0.5, "reason": str(error), "improvements": []}
+
     def score(
         self,
         conversation_summary: str,
@@ -225,52 +313,40 @@ Respond with ONLY a JSON object:
         milestones_summary: str,
     ) -> Dict[str, Any]:
         """Score the extracted goal quality."""
-        try:
-            from openai import OpenAI
-            import json
-            
-            client = OpenAI(api_key=settings.OPENAI_API_KEY)
-            
-            prompt = self.EVALUATION_PROMPT.format(
-                conversation_summary=conversation_summary,
-                goal_title=goal_title,
-                goal_description=goal_description,
-                goal_category=goal_category,
-                milestones_summary=milestones_summary,
-            )
-            
-            response = client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=300,
-                temperature=0.1,
-            )
-            
-            result_text = response.choices[0].message.content or ""
-            
-            try:
-                result = json.loads(result_text)
-                return {
-                    "score": float(result.get("score", 0.5)),
-                    "reason": result.get("reason", "No explanation"),
-                    "improvements": result.get("improvements", [])
-                }
-            except json.JSONDecodeError:
-                return {"score": 0.5, "reason": "Parse error", "improvements": []}
-                
-        except Exception as e:
-            logger.error(f"Error scoring goal extraction: {e}")
-            return {"score": 0.5, "reason": str(e), "improvements": []}
+        return self._judge(
+            conversation_summary=conversation_summary,
+            goal_title=goal_title,
+            goal_description=goal_description,
+            goal_category=goal_category,
+            milestones_summary=milestones_summary,
+        )
+
+    async def score_async(
+        self,
+        conversation_summary: str,
+        goal_title: str,
+        goal_description: str,
+        goal_category: str,
+        milestones_summary: str,
+    ) -> Dict[str, Any]:
+        """Async twin of score."""
+        return await self._judge_async(
+            conversation_summary=conversation_summary,
+            goal_title=goal_title,
+            goal_description=goal_description,
+            goal_category=goal_category,
+            milestones_summary=milestones_summary,
+        )
 
 
-class UserFrustrationDetector:
+class UserFrustrationDetector(_LLMJudge):
     """
     Detects user frustration in coaching conversations.
     
     Helps identify when the AI coach isn't meeting user needs.
     """
     
-    DETECTION_PROMPT = """Analyze this coaching conversation exchange for signs of user frustration.
+    PROMPT = """Analyze this coaching conversation exchange for signs of user frustration.
 
 User Message: {user_input}
 Previous AI Response: {previous_response}
@@ -291,9 +367,24 @@ Rate frustration level 0.0 to 1.0:
 Respond with ONLY JSON: {{"score": 0.X, "indicators": ["indicator1"]}}
 """
 
-    def __init__(self, model: str = "gpt-4o-mini"):
-        self.model = model
-    
+    MAX_TOKENS = 150
+
+    def _parse(self, result_text: str) -> Dict[str, Any]:
+        try:
+            result = json_utils.loads(result_text)
+        except json_utils.JSONDecodeError:
+            if self.raise_errors:
+                raise
+            return {"frustration_score": 0.0, "indicators": []}
+        return {
+            "frustration_score": float(result.get("score", 0.0)),
+            "indicators": result.get("indicators", [])
+        }
+
+    def _error_result(self, error: Exception) -> Dict[str, Any]:
+        logger.error(f"Error detecting frustration: {error}")
+        return {"frustration_score": 0.0, "indicators": []}
+
     def detect(
         self,
         user_input: str,
@@ -301,39 +392,24 @@ Respond with ONLY JSON: {{"score": 0.X, "indicators": ["indicator1"]}}
         current_reply: str,
     ) -> Dict[str, Any]:
         """Detect user frustration level."""
-        try:
-            from openai import OpenAI
-            import json
-            
-            client = OpenAI(api_key=settings.OPENAI_API_KEY)
-            
-            prompt = self.DETECTION_PROMPT.format(
-                user_input=user_input,
-                previous_response=previous_response,
-                current_reply=current_reply,
-            )
-            
-            response = client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=150,
-                temperature=0.1,
-            )
-            
-            result_text = response.choices[0].message.content or ""
-            
-            try:
-                result = json.loads(result_text)
-                return {
-                    "frustration_score": float(result.get("score", 0.0)),
-                    "indicators": result.get("indicators", [])
-                }
-            except json.JSONDecodeError:
-                return {"frustration_score": 0.0, "indicators": []}
-                
-        except Exception as e:
-            logger.error(f"Error detecting frustration: {e}")
-            return {"frustration_score": 0.0, "indicators": []}
+        return self._judge(
+            user_input=user_input,
+            previous_response=previous_response,
+            current_reply=current_reply,
+        )
+
+    async def detect_async(
+        self,
+        user_input: str,
+        previous_response: str,
+        current_reply: str,
+    ) -> Dict[str, Any]:
+        """Async twin of detect."""
+        return await self._judge_async(
+            user_input=user_input,
+            previous_response=previous_response,
+            current_reply=current_reply,
+        )
 
 
 # ============================
@@ -18,6 +18,7 @@ from sqlmodel import Session, select
 
 from app.config import settings
 from app.models.user import User
+from app.utils.clock import utcnow
 
 logger = logging.getLogger(__name__)
 
@@ -93,7 +94,6 @@ def update_token_usage_atomic(db: Session, user_id: int, tokens_used: int) -> Tu
         user = db.get(User, user_id)
         if user:
             user.tokens_used = user.tokens_used + tokens_used
-            user.updated_at = datetime.utcnow()
             db.add(user)
             # Don't commit here - let the caller (route) handle the commit
             # This prevents SQLite transaction conflicts
@@ -120,7 +120,7 @@ def set_quota_reset_date(db: Session, user_id: int, days: Optional[int] = None)
     if days is None:
         days = settings.QUOTA_RESET_DAYS
     
-    reset_at = datetime.utcnow() + timedelta(days=days)
+    reset_at = utcnow() + timedelta(days=days)
     
     user = db.get(User, user_id)
     if user:
@@ -0,0 +1,90 @@
+"""
+Persistent cache of AI outputs for offline experiment reruns.
+
+Keys hash everything that determines an output (the full request body, or
+a metric's name and inputs), so editing a prompt or the model misses the
+cache only for the entries that change. Not used on the request path.
+"""
+
+import hashlib
+import os
+import sqlite3
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+from app.utils import json_utils
+
+
+class ResponseCache:
+    """SQLite-backed key/value store for JSON-serializable AI outputs."""
+
+    def __init__(self, directory: str):
+        """
+        Open (creating if needed) the cache under a directory.
+
+        Args:
+            directory: Directory holding the cache database
+        """
+        os.makedirs(directory, exist_ok=True)
+        ignore_file = os.path.join(directory, ".gitignore")
+        if not os.path.exists(ignore_file):
+            # Reason: Keep cached model output out of commits without
+            # touching the repository's ignore rules
+            with open(ignore_file, "w") as f:
+                f.write("*\n")
+        self._conn = sqlite3.connect(os.path.join(directory, "responses.sqlite3"))
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(key TEXT PRIMARY KEY, value BLOB NOT NULL, created_at REAL NOT NULL)"
+        )
+
+    @staticmethod
+    def key(namespace: str, data: Any) -> str:
+        """
+        Build a cache key from a namespace and the inputs that determine a value.
+
+        Args:
+            namespace: Kind of value, e.g. "chat" or "coaching_score"
+            data: JSON-serializable inputs
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        payload = namespace.encode() + b"|" + json_utils.dumps_bytes(data, sort_keys=True)
+        return hashlib.sha256(payload).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None on a miss."""
+        row = self._conn.execute("SELECT value FROM responses WHERE key = ?", (key,)).fetchone()
+        return json_utils.loads(row[0]) if row else None
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a JSON-serializable value under key."""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO responses (key, value, created_at) VALUES (?, ?, ?)",
+            (key, json_utils.dumps_bytes(value), time.time()),
+        )
+        self._conn.commit()
+
+    async def get_or_compute(self, key: str, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return the cached value, or await compute() and cache its result.
+
+        None results and exceptions are not cached, so failures retry on
+        the next run.
+        """
+        value = self.get(key)
+        if value is None:
+            value = await compute()
+            if value is not None:
+                self.set(key, value)
+        return value
+
+    def clear(self) -> None:
+        """Delete every cached value."""
+        self._conn.execute("DELETE FROM responses")
+        self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
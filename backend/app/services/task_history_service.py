@@ -0,0 +1,136 @@
+"""
+Task history loading for the agent system.
+
+Agents consume task history as plain dicts; this service builds them
+straight from column tuples instead of hydrating full Task ORM objects.
+"""
+
+from collections import defaultdict
+from typing import Any, Dict, List, Sequence, Tuple
+
+from sqlmodel import Session, func, select
+
+from app.agents.task_history import TaskHistoryColumns
+from app.models.goal import Task, TaskStatus
+
+TaskRow = Tuple[int, str, Any, Any, Any]
+
+
+# Columns each task row carries, in TaskRow order
+_TASK_ROW_COLUMNS = (Task.id, Task.title, Task.status, Task.created_at, Task.completed_at)
+
+
+def _select_task_rows(db: Session, goal_ids: Sequence[int]) -> Dict[int, List[TaskRow]]:
+    """Fetch (id, title, status, created_at, completed_at) tuples grouped by goal."""
+    grouped: Dict[int, List[TaskRow]] = defaultdict(list)
+    if not goal_ids:
+        return grouped
+
+    rows = db.exec(
+        select(Task.goal_id, *_TASK_ROW_COLUMNS).where(Task.goal_id.in_(goal_ids))
+    ).all()
+    for goal_id, *task_row in rows:
+        grouped[goal_id].append(tuple(task_row))
+    return grouped
+
+
+def _select_goal_task_rows(db: Session, goal_id: int) -> List[TaskRow]:
+    """
+    Fetch the task tuples of one goal.
+
+    Reason: With a single goal there is nothing to group, so the result rows
+    (already tuples) are used as-is instead of being copied per task.
+    """
+    return db.exec(select(*_TASK_ROW_COLUMNS).where(Task.goal_id == goal_id)).all()
+
+
+def _rows_to_dicts(rows: List[TaskRow]) -> List[Dict[str, Any]]:
+    """Convert task tuples to the dict shape agents expect."""
+    return [
+        {
+            "id": task_id,
+            "title": title,
+            "status": status,
+            "created_at": created_at.isoformat() if created_at else None,
+            "completed_at": completed_at.isoformat() if completed_at else None,
+        }
+        for task_id, title, status, created_at, completed_at in rows
+    ]
+
+
+def load_task_history(
+    db: Session,
+    goal_ids: Sequence[int],
+) -> Dict[int, List[Dict[str, Any]]]:
+    """
+    Load task history for several goals in one query.
+
+    Args:
+        db: Database session
+        goal_ids: Goals to load tasks for
+
+    Returns:
+        Mapping of goal ID to its task dicts (id, title, status, created_at,
+        completed_at); goals without tasks map to an empty list
+    """
+    history: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
+    for goal_id, rows in _select_task_rows(db, goal_ids).items():
+        history[goal_id] = _rows_to_dicts(rows)
+    return history
+
+
+def load_goal_task_history(db: Session, goal_id: int) -> List[Dict[str, Any]]:
+    """
+    Load task history for a single goal.
+
+    Args:
+        db: Database session
+        goal_id: Goal to load tasks for
+
+    Returns:
+        Task dicts for the goal (see load_task_history)
+    """
+    return _rows_to_dicts(_select_goal_task_rows(db, goal_id))
+
+
+def load_goal_task_history_columns(
+    db: Session,
+    goal_id: int,
+) -> Tuple[List[Dict[str, Any]], TaskHistoryColumns]:
+    """
+    Load task history for a single goal as dicts plus prebuilt columns.
+
+    Reason: Building TaskHistoryColumns from the dicts would re-parse the
+    stringified timestamps; the query already returns datetimes, so the
+    columns are built from the transposed tuples instead.
+
+    Args:
+        db: Database session
+        goal_id: Goal to load tasks for
+
+    Returns:
+        (task dicts, TaskHistoryColumns over the same tasks in the same order)
+    """
+    rows = _select_goal_task_rows(db, goal_id)
+    _, _, statuses, created, completed = zip(*rows) if rows else ((),) * 5
+    return _rows_to_dicts(rows), TaskHistoryColumns.from_columns(statuses, created, completed)
+
+
+def load_task_summary(db: Session, goal_id: int) -> Dict[str, int]:
+    """
+    Count a goal's tasks by status without fetching the tasks.
+
+    Args:
+        db: Database session
+        goal_id: Goal to summarize
+
+    Returns:
+        Mapping of status value to task count; statuses with no tasks are
+        omitted
+    """
+    rows = db.exec(
+        select(Task.status, func.count(Task.id))
+        .where(Task.goal_id == goal_id)
+        .group_by(Task.status)
+    ).all()
+    return {TaskStatus(status).value: count for status, count in rows}
@@ -0,0 +1,14 @@
+"""Clock helpers shared by models and services."""
+
+from datetime import datetime, timezone
+
+
+def utcnow() -> datetime:
+    """
+    Current UTC time as a naive datetime.
+
+    Reason: Timestamp columns are naive DateTime holding UTC, and the code
+    compares them with other naive values, so every writer uses this one
+    convention (and datetime.utcnow, which is deprecated, is not needed).
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
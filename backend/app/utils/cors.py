@@ -0,0 +1,121 @@
+"""Lightweight CORS middleware with precomputed response headers."""
+
+from typing import Iterable, List, Optional, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+Header = Tuple[bytes, bytes]
+
+ALL_METHODS = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+PREFLIGHT_MAX_AGE = b"600"
+
+
+class FastCORSMiddleware:
+    """
+    CORS middleware for a fixed policy: credentials, all methods, all headers.
+
+    Behaves like Starlette's CORSMiddleware configured with
+    allow_credentials=True, allow_methods=["*"] and allow_headers=["*"], but
+    everything that doesn't depend on the request is built once in __init__
+    and origins are compared as raw header bytes, so the per-request work is
+    a header scan and a list concatenation.
+
+    Reason: With credentials enabled the allowed origin is always echoed back
+    (browsers reject "*" for credentialed requests), which is also what
+    Starlette does for cookie-bearing requests.
+    """
+
+    __slots__ = ("app", "allow_all_origins", "origins", "simple_headers", "preflight_headers")
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        allow_origins: Iterable[str] = ("*",),
+        expose_headers: Iterable[str] = (),
+    ):
+        """
+        Args:
+            app: The wrapped ASGI application
+            allow_origins: Allowed origins, or "*" to allow any origin
+            expose_headers: Response headers browsers may read cross-origin
+        """
+        self.app = app
+        origins = frozenset(origin.encode("latin-1") for origin in allow_origins)
+        self.allow_all_origins = b"*" in origins
+        self.origins = origins
+        self.simple_headers: List[Header] = [
+            (b"access-control-allow-credentials", b"true"),
+            (b"vary", b"Origin"),
+        ]
+        exposed = ", ".join(expose_headers)
+        if exposed:
+            self.simple_headers.append((b"access-control-expose-headers", exposed.encode("latin-1")))
+        self.preflight_headers: List[Header] = [
+            (b"access-control-allow-methods", ALL_METHODS),
+            (b"access-control-max-age", PREFLIGHT_MAX_AGE),
+            (b"access-control-allow-credentials", b"true"),
+            (b"vary", b"Origin"),
+            (b"content-type", b"text/plain; charset=utf-8"),
+        ]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Add CORS headers to cross-origin requests and answer preflights."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin: Optional[bytes] = None
+        request_method: Optional[bytes] = None
+        request_headers: Optional[bytes] = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        allowed = self.allow_all_origins or origin in self.origins
+
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            await self._preflight(origin, allowed, request_headers, send)
+            return
+
+        if not allowed:
+            await self.app(scope, receive, send)
+            return
+
+        cors_headers = [(b"access-control-allow-origin", origin), *self.simple_headers]
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *cors_headers]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    async def _preflight(
+        self,
+        origin: bytes,
+        allowed: bool,
+        request_headers: Optional[bytes],
+        send: Send,
+    ) -> None:
+        """Send the preflight response directly, without calling the app."""
+        body = b"OK" if allowed else b"Disallowed CORS origin"
+        headers = [*self.preflight_headers, (b"content-length", str(len(body)).encode())]
+        if allowed:
+            headers.append((b"access-control-allow-origin", origin))
+        if request_headers is not None:
+            headers.append((b"access-control-allow-headers", request_headers))
+
+        await send({
+            "type": "http.response.start",
+            "status": 200 if allowed else 400,
+            "headers": headers,
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -12,13 +12,16 @@ from app.services.auth_service import decode_access_token
 security = HTTPBearer()
 
 
-async def get_current_user(
+def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db),
 ) -> User:
     """
     Dependency to get the current authenticated user from JWT token.
 
+    Declared sync so FastAPI runs the user lookup in its threadpool instead
+    of blocking the event loop on the database.
+
     Args:
         credentials: Bearer token from Authorization header
         db: Database session
@@ -58,7 +61,7 @@ async def get_current_user(
     return user
 
 
-async def get_current_user_optional(
+def get_current_user_optional(
     credentials: HTTPAuthorizationCredentials | None = Depends(
         HTTPBearer(auto_error=False)
     ),
@@ -73,7 +76,7 @@ async def get_current_user_optional(
         return None
 
     try:
-        return await get_current_user(credentials, db)
+        return get_current_user(credentials, db)
     except HTTPException:
         return None
 
@@ -0,0 +1,22 @@
+"""Identifier generation helpers."""
+
+import os
+import random
+import time
+
+# Reason: uuid4() reads os.urandom on every call; seeding a PRNG once keeps
+# IDs unpredictable enough for tracing while avoiding a syscall per ID.
+_trace_rng = random.Random(os.urandom(16))
+
+
+def generate_trace_id() -> str:
+    """
+    Generate a time-ordered 128-bit trace identifier.
+
+    The first 64 bits are the nanosecond timestamp and the last 64 bits are
+    random, so IDs sort by creation time in logs.
+
+    Returns:
+        32-character lowercase hex string
+    """
+    return f"{time.time_ns():016x}{_trace_rng.getrandbits(64):016x}"
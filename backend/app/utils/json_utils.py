@@ -0,0 +1,59 @@
+"""Fast JSON helpers backed by orjson."""
+
+from typing import Any, Callable, Optional, Union
+
+import orjson
+
+# Reason: orjson.JSONDecodeError subclasses json.JSONDecodeError, so existing
+# "except json.JSONDecodeError" handlers keep working.
+JSONDecodeError = orjson.JSONDecodeError
+
+
+def dumps_bytes(
+    obj: Any,
+    *,
+    sort_keys: bool = False,
+    indent: bool = False,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> bytes:
+    """
+    Serialize obj to UTF-8 JSON bytes.
+
+    datetime, enum, dataclass and NumPy values are handled natively.
+
+    Args:
+        obj: Object to serialize
+        sort_keys: Emit dict keys in sorted order
+        indent: Pretty-print with two-space indentation
+        default: Fallback serializer for unsupported types
+
+    Returns:
+        JSON document as bytes
+    """
+    option = orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(obj, default=default, option=option)
+
+
+def dumps(
+    obj: Any,
+    *,
+    sort_keys: bool = False,
+    indent: bool = False,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> str:
+    """Serialize obj to a JSON string. See dumps_bytes for arguments."""
+    return dumps_bytes(obj, sort_keys=sort_keys, indent=indent, default=default).decode()
+
+
+def loads(data: Union[str, bytes, bytearray]) -> Any:
+    """
+    Parse a JSON document.
+
+    Raises:
+        JSONDecodeError: If data is not valid JSON
+    """
+    return orjson.loads(data)
@@ -0,0 +1,21 @@
+"""Response classes for the API."""
+
+from typing import Any
+
+from fastapi.responses import ORJSONResponse
+
+from app.utils import json_utils
+
+
+class JSONResponse(ORJSONResponse):
+    """
+    orjson-backed JSON response, used as the app's default response class.
+
+    Serializes with the same options as json_utils (naive datetimes as UTC,
+    NumPy values, non-str keys) and falls back to str() for anything orjson
+    can't encode natively, so endpoints returning plain dicts keep working.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """Encode content to JSON bytes."""
+        return json_utils.dumps_bytes(content, default=str)
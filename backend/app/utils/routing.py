@@ -0,0 +1,28 @@
+"""Route table checks run at startup."""
+
+from collections import Counter
+from typing import Iterable, List, Tuple
+
+from starlette.routing import BaseRoute, Route
+
+
+def find_duplicate_routes(routes: Iterable[BaseRoute]) -> List[Tuple[str, str]]:
+    """
+    Find (method, path) pairs registered more than once.
+
+    Reason: Starlette dispatches to the first matching route, so a duplicate
+    silently shadows the later handler instead of failing.
+
+    Args:
+        routes: The application's routes (app.routes)
+
+    Returns:
+        Sorted duplicate (method, path) pairs; empty if every pair is unique
+    """
+    counts = Counter(
+        (method, route.path)
+        for route in routes
+        if isinstance(route, Route)
+        for method in route.methods or ()
+    )
+    return sorted(key for key, count in counts.items() if count > 1)
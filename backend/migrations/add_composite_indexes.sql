@@ -0,0 +1,20 @@
+-- Migration: Replace single-column foreign key indexes with composite indexes
+-- Run this script against your PostgreSQL database.
+--
+-- Each composite index leads with the old indexed column, so lookups on that
+-- column alone still use an index.
+
+CREATE INDEX IF NOT EXISTS ix_goals_user_status ON goals (user_id, status);
+CREATE INDEX IF NOT EXISTS ix_goals_user_created ON goals (user_id, created_at);
+DROP INDEX IF EXISTS ix_goals_user_id;
+
+CREATE INDEX IF NOT EXISTS ix_tasks_goal_status_due ON tasks (goal_id, status, due_date);
+CREATE INDEX IF NOT EXISTS ix_tasks_milestone_created ON tasks (milestone_id, created_at);
+DROP INDEX IF EXISTS ix_tasks_goal_id;
+DROP INDEX IF EXISTS ix_tasks_milestone_id;
+
+CREATE INDEX IF NOT EXISTS ix_chat_sessions_user_updated ON chat_sessions (user_id, updated_at);
+DROP INDEX IF EXISTS ix_chat_sessions_user_id;
+
+CREATE INDEX IF NOT EXISTS ix_chat_messages_session_created ON chat_messages (session_id, created_at);
+DROP INDEX IF EXISTS ix_chat_messages_session_id;
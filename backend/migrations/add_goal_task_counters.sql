@@ -0,0 +1,19 @@
+-- Migration: Add denormalized task counters to goals
+-- Run this script against your PostgreSQL database.
+
+ALTER TABLE goals
+ADD COLUMN IF NOT EXISTS total_task_count INTEGER NOT NULL DEFAULT 0,
+ADD COLUMN IF NOT EXISTS completed_task_count INTEGER NOT NULL DEFAULT 0;
+
+-- Backfill from existing tasks (status 2 = TaskStatus.COMPLETED)
+UPDATE goals g
+SET total_task_count = t.total,
+    completed_task_count = t.completed
+FROM (
+    SELECT goal_id,
+           COUNT(*) AS total,
+           COUNT(*) FILTER (WHERE status = 2) AS completed
+    FROM tasks
+    GROUP BY goal_id
+) t
+WHERE t.goal_id = g.id;
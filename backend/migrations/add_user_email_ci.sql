@@ -0,0 +1,20 @@
+-- Migration: Add normalized email column with a unique index for login lookups
+-- Run this script against your PostgreSQL database.
+
+ALTER TABLE users ADD COLUMN IF NOT EXISTS email_ci VARCHAR(255);
+
+UPDATE users SET email_ci = LOWER(TRIM(email)) WHERE email_ci IS NULL;
+
+-- Dedupe: users.email is only unique case-sensitively, so accounts differing
+-- only by case share one email_ci. The oldest account keeps it; the newer ones
+-- are cleared and stay reachable through the exact-email lookup. Review them with
+--   SELECT id, email FROM users WHERE email_ci IS NULL;
+UPDATE users u SET email_ci = NULL
+WHERE EXISTS (
+  SELECT 1 FROM users older
+  WHERE older.email_ci = u.email_ci AND older.id < u.id
+);
+
+-- Replaces the earlier hash index: hash indexes can't be UNIQUE
+DROP INDEX IF EXISTS ix_users_email_ci_hash;
+CREATE UNIQUE INDEX IF NOT EXISTS ix_users_email_ci ON users (email_ci);
@@ -0,0 +1,15 @@
+-- Migration: Add the id tie-breaker to the chat composite indexes
+-- Run this script against your PostgreSQL database.
+--
+-- Session lists and message history are read ORDER BY (timestamp, id) so
+-- keyset cursors stay stable when timestamps collide. With id as the last
+-- index column the whole ORDER BY ... LIMIT is served from the index with no
+-- sort step; lookups on the leading columns still use it as before.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_chat_sessions_user_updated_id
+    ON chat_sessions (user_id, updated_at, id);
+DROP INDEX CONCURRENTLY IF EXISTS ix_chat_sessions_user_updated;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_chat_messages_session_created_id
+    ON chat_messages (session_id, created_at, id);
+DROP INDEX CONCURRENTLY IF EXISTS ix_chat_messages_session_created;
@@ -0,0 +1,17 @@
+-- Migration: Add response-cache columns to chat_messages
+-- Run this script against your PostgreSQL database.
+
+ALTER TABLE chat_messages
+ADD COLUMN IF NOT EXISTS content_sha256 BYTEA,
+ADD COLUMN IF NOT EXISTS embedding BYTEA;
+
+-- Backfill digests for existing messages (pgcrypto's digest() also works)
+UPDATE chat_messages
+SET content_sha256 = sha256(convert_to(content, 'UTF8'))
+WHERE content_sha256 IS NULL;
+
+CREATE INDEX IF NOT EXISTS ix_chat_messages_sha256_session
+ON chat_messages (content_sha256, session_id);
+
+COMMENT ON COLUMN chat_messages.content_sha256 IS 'SHA-256 of content, maintained by the application on insert/update';
+COMMENT ON COLUMN chat_messages.embedding IS 'Reserved for semantic caching: raw float16 embedding bytes';
@@ -0,0 +1,12 @@
+-- Migration: Compress chat message content with LZ4 (PostgreSQL 14+)
+-- Run this script against your PostgreSQL database.
+--
+-- TEXT values over ~2 KB are already compressed out of line by TOAST; LZ4
+-- compresses and decompresses several times faster than the default pglz,
+-- keeping long assistant messages small without any application changes.
+
+ALTER TABLE chat_messages ALTER COLUMN content SET COMPRESSION lz4;
+
+-- Existing rows keep their current compression until rewritten; to
+-- recompress them now (takes an exclusive lock while it runs):
+-- VACUUM FULL chat_messages;
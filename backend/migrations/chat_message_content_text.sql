@@ -0,0 +1,15 @@
+-- Migration: Store chat message content as TEXT with a full-text index
+-- Run this script against your PostgreSQL database.
+
+-- Unbounded TEXT is stored out of line (TOAST) once it gets large, keeping
+-- chat_messages rows narrow for the session/created_at index scans
+ALTER TABLE chat_messages ALTER COLUMN content TYPE TEXT;
+
+-- PostgreSQL-only generated tsvector for keyword search over past messages
+-- (not mapped on the model, so SQLite development databases are unaffected)
+ALTER TABLE chat_messages
+ADD COLUMN IF NOT EXISTS content_tsv TSVECTOR
+GENERATED ALWAYS AS (to_tsvector('english', content)) STORED;
+
+CREATE INDEX IF NOT EXISTS ix_chat_messages_content_tsv
+ON chat_messages USING GIN (content_tsv);
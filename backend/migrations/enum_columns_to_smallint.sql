@@ -0,0 +1,145 @@
+-- Migration: Store enum columns as SMALLINT codes
+-- Run this script against your PostgreSQL database after deploying the
+-- SmallIntEnum column type (app/models/types.py).
+--
+-- Enum columns were native PostgreSQL enums holding member NAMES; they become
+-- SMALLINT holding each member's position in its Python enum (0-based).
+
+ALTER TABLE users ALTER COLUMN auth_provider TYPE SMALLINT USING (
+  CASE auth_provider::text
+    WHEN 'EMAIL' THEN 0
+  END
+);
+
+ALTER TABLE goals ALTER COLUMN category TYPE SMALLINT USING (
+  CASE category::text
+    WHEN 'HEALTH' THEN 0
+    WHEN 'CAREER' THEN 1
+    WHEN 'EDUCATION' THEN 2
+    WHEN 'FINANCE' THEN 3
+    WHEN 'PERSONAL' THEN 4
+    WHEN 'OTHER' THEN 5
+  END
+);
+
+ALTER TABLE goals ALTER COLUMN goal_type TYPE SMALLINT USING (
+  CASE goal_type::text
+    WHEN 'SHORT_TERM' THEN 0
+    WHEN 'LONG_TERM' THEN 1
+    WHEN 'RESOLUTION' THEN 2
+  END
+);
+
+ALTER TABLE goals ALTER COLUMN status TYPE SMALLINT USING (
+  CASE status::text
+    WHEN 'ACTIVE' THEN 0
+    WHEN 'COMPLETED' THEN 1
+    WHEN 'PAUSED' THEN 2
+    WHEN 'ABANDONED' THEN 3
+  END
+);
+
+ALTER TABLE user_profiles ALTER COLUMN learning_style TYPE SMALLINT USING (
+  CASE learning_style::text
+    WHEN 'VISUAL' THEN 0
+    WHEN 'AUDITORY' THEN 1
+    WHEN 'READING' THEN 2
+    WHEN 'KINESTHETIC' THEN 3
+  END
+);
+
+ALTER TABLE user_profiles ALTER COLUMN motivation_type TYPE SMALLINT USING (
+  CASE motivation_type::text
+    WHEN 'INTRINSIC' THEN 0
+    WHEN 'EXTRINSIC' THEN 1
+    WHEN 'ACHIEVEMENT' THEN 2
+    WHEN 'AFFILIATION' THEN 3
+    WHEN 'POWER' THEN 4
+  END
+);
+
+ALTER TABLE user_profiles ALTER COLUMN personality_type TYPE SMALLINT USING (
+  CASE personality_type::text
+    WHEN 'DRIVER' THEN 0
+    WHEN 'ANALYTICAL' THEN 1
+    WHEN 'EXPRESSIVE' THEN 2
+    WHEN 'AMIABLE' THEN 3
+  END
+);
+
+ALTER TABLE chat_sessions ALTER COLUMN status TYPE SMALLINT USING (
+  CASE status::text
+    WHEN 'ACTIVE' THEN 0
+    WHEN 'COMPLETED' THEN 1
+    WHEN 'FINALIZED' THEN 2
+  END
+);
+
+ALTER TABLE user_insights ALTER COLUMN insight_type TYPE SMALLINT USING (
+  CASE insight_type::text
+    WHEN 'PATTERN' THEN 0
+    WHEN 'STRENGTH' THEN 1
+    WHEN 'WEAKNESS' THEN 2
+    WHEN 'RECOMMENDATION' THEN 3
+    WHEN 'WARNING' THEN 4
+  END
+);
+
+ALTER TABLE chat_messages ALTER COLUMN role TYPE SMALLINT USING (
+  CASE role::text
+    WHEN 'USER' THEN 0
+    WHEN 'ASSISTANT' THEN 1
+    WHEN 'SYSTEM' THEN 2
+  END
+);
+
+ALTER TABLE tasks ALTER COLUMN status TYPE SMALLINT USING (
+  CASE status::text
+    WHEN 'PENDING' THEN 0
+    WHEN 'IN_PROGRESS' THEN 1
+    WHEN 'COMPLETED' THEN 2
+    WHEN 'SKIPPED' THEN 3
+  END
+);
+
+ALTER TABLE tasks ALTER COLUMN priority TYPE SMALLINT USING (
+  CASE priority::text
+    WHEN 'LOW' THEN 0
+    WHEN 'MEDIUM' THEN 1
+    WHEN 'HIGH' THEN 2
+  END
+);
+
+ALTER TABLE tasks ALTER COLUMN frequency TYPE SMALLINT USING (
+  CASE frequency::text
+    WHEN 'DAILY' THEN 0
+    WHEN 'WEEKLY' THEN 1
+    WHEN 'MONTHLY' THEN 2
+    WHEN 'ONE_TIME' THEN 3
+  END
+);
+
+ALTER TABLE habit_loops ALTER COLUMN strength TYPE SMALLINT USING (
+  CASE strength::text
+    WHEN 'FORMING' THEN 0
+    WHEN 'DEVELOPING' THEN 1
+    WHEN 'ESTABLISHED' THEN 2
+    WHEN 'AUTOMATIC' THEN 3
+  END
+);
+
+-- Drop the now-unused native enum types
+DROP TYPE IF EXISTS authprovider;
+DROP TYPE IF EXISTS chatstatus;
+DROP TYPE IF EXISTS goalcategory;
+DROP TYPE IF EXISTS goalstatus;
+DROP TYPE IF EXISTS goaltype;
+DROP TYPE IF EXISTS habitstrength;
+DROP TYPE IF EXISTS insighttype;
+DROP TYPE IF EXISTS learningstyle;
+DROP TYPE IF EXISTS messagerole;
+DROP TYPE IF EXISTS motivationtype;
+DROP TYPE IF EXISTS personalitytype;
+DROP TYPE IF EXISTS taskfrequency;
+DROP TYPE IF EXISTS taskpriority;
+DROP TYPE IF EXISTS taskstatus;
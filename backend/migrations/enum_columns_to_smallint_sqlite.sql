@@ -0,0 +1,123 @@
+-- Migration: Store enum columns as SMALLINT codes (SQLite development databases)
+-- SQLite counterpart of enum_columns_to_smallint.sql. Run it once against a
+-- development database created before the SmallIntEnum column type:
+--
+--   sqlite3 milesync.db < migrations/enum_columns_to_smallint_sqlite.sql
+--
+-- SQLite cannot ALTER a column's type, so the VARCHAR columns keep their
+-- declared type and only the stored member NAMES are rewritten to each
+-- member's position in its Python enum (0-based). TEXT affinity stores the
+-- codes as '0', '1', ..., which SmallIntEnum reads back as integers.
+-- Already-converted values fall through the ELSE, so re-running is harmless.
+--
+-- Alternatively, delete milesync.db and restart the backend: the tables are
+-- recreated empty with INTEGER columns.
+
+UPDATE users SET auth_provider = CASE auth_provider
+    WHEN 'EMAIL' THEN 0
+    ELSE auth_provider
+  END;
+
+UPDATE goals SET category = CASE category
+    WHEN 'HEALTH' THEN 0
+    WHEN 'CAREER' THEN 1
+    WHEN 'EDUCATION' THEN 2
+    WHEN 'FINANCE' THEN 3
+    WHEN 'PERSONAL' THEN 4
+    WHEN 'OTHER' THEN 5
+    ELSE category
+  END;
+
+UPDATE goals SET goal_type = CASE goal_type
+    WHEN 'SHORT_TERM' THEN 0
+    WHEN 'LONG_TERM' THEN 1
+    WHEN 'RESOLUTION' THEN 2
+    ELSE goal_type
+  END;
+
+UPDATE goals SET status = CASE status
+    WHEN 'ACTIVE' THEN 0
+    WHEN 'COMPLETED' THEN 1
+    WHEN 'PAUSED' THEN 2
+    WHEN 'ABANDONED' THEN 3
+    ELSE status
+  END;
+
+UPDATE user_profiles SET learning_style = CASE learning_style
+    WHEN 'VISUAL' THEN 0
+    WHEN 'AUDITORY' THEN 1
+    WHEN 'READING' THEN 2
+    WHEN 'KINESTHETIC' THEN 3
+    ELSE learning_style
+  END;
+
+UPDATE user_profiles SET motivation_type = CASE motivation_type
+    WHEN 'INTRINSIC' THEN 0
+    WHEN 'EXTRINSIC' THEN 1
+    WHEN 'ACHIEVEMENT' THEN 2
+    WHEN 'AFFILIATION' THEN 3
+    WHEN 'POWER' THEN 4
+    ELSE motivation_type
+  END;
+
+UPDATE user_profiles SET personality_type = CASE personality_type
+    WHEN 'DRIVER' THEN 0
+    WHEN 'ANALYTICAL' THEN 1
+    WHEN 'EXPRESSIVE' THEN 2
+    WHEN 'AMIABLE' THEN 3
+    ELSE personality_type
+  END;
+
+UPDATE chat_sessions SET status = CASE status
+    WHEN 'ACTIVE' THEN 0
+    WHEN 'COMPLETED' THEN 1
+    WHEN 'FINALIZED' THEN 2
+    ELSE status
+  END;
+
+UPDATE user_insights SET insight_type = CASE insight_type
+    WHEN 'PATTERN' THEN 0
+    WHEN 'STRENGTH' THEN 1
+    WHEN 'WEAKNESS' THEN 2
+    WHEN 'RECOMMENDATION' THEN 3
+    WHEN 'WARNING' THEN 4
+    ELSE insight_type
+  END;
+
+UPDATE chat_messages SET role = CASE role
+    WHEN 'USER' THEN 0
+    WHEN 'ASSISTANT' THEN 1
+    WHEN 'SYSTEM' THEN 2
+    ELSE role
+  END;
+
+UPDATE tasks SET status = CASE status
+    WHEN 'PENDING' THEN 0
+    WHEN 'IN_PROGRESS' THEN 1
+    WHEN 'COMPLETED' THEN 2
+    WHEN 'SKIPPED' THEN 3
+    ELSE status
+  END;
+
+UPDATE tasks SET priority = CASE priority
+    WHEN 'LOW' THEN 0
+    WHEN 'MEDIUM' THEN 1
+    WHEN 'HIGH' THEN 2
+    ELSE priority
+  END;
+
+UPDATE tasks SET frequency = CASE frequency
+    WHEN 'DAILY' THEN 0
+    WHEN 'WEEKLY' THEN 1
+    WHEN 'MONTHLY' THEN 2
+    WHEN 'ONE_TIME' THEN 3
+    ELSE frequency
+  END;
+
+UPDATE habit_loops SET strength = CASE strength
+    WHEN 'FORMING' THEN 0
+    WHEN 'DEVELOPING' THEN 1
+    WHEN 'ESTABLISHED' THEN 2
+    WHEN 'AUTOMATIC' THEN 3
+    ELSE strength
+  END;
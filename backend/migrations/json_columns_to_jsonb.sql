@@ -0,0 +1,19 @@
+-- Migration: Store JSON document columns as JSONB with GIN indexes
+-- Run this script against your PostgreSQL database.
+
+ALTER TABLE goals
+ALTER COLUMN identified_obstacles TYPE JSONB USING identified_obstacles::jsonb,
+ALTER COLUMN success_criteria TYPE JSONB USING success_criteria::jsonb;
+
+ALTER TABLE user_profiles
+ALTER COLUMN strengths TYPE JSONB USING strengths::jsonb,
+ALTER COLUMN challenges TYPE JSONB USING challenges::jsonb,
+ALTER COLUMN "values" TYPE JSONB USING "values"::jsonb;
+
+ALTER TABLE user_insights
+ALTER COLUMN data TYPE JSONB USING data::jsonb;
+
+CREATE INDEX IF NOT EXISTS ix_goals_obstacles_gin ON goals USING GIN (identified_obstacles);
+CREATE INDEX IF NOT EXISTS ix_user_profiles_strengths_gin ON user_profiles USING GIN (strengths);
+CREATE INDEX IF NOT EXISTS ix_user_profiles_challenges_gin ON user_profiles USING GIN (challenges);
+CREATE INDEX IF NOT EXISTS ix_user_profiles_values_gin ON user_profiles USING GIN ("values");
@@ -12,6 +12,7 @@ from app.main import app
 from app.database import get_db
 from app.models.user import User
 from app.models.goal import Goal, Milestone, Task, GoalCategory, GoalStatus, TaskStatus
+from app.services import dashboard_service
 from app.services.auth_service import hash_password, create_access_token
 
 
@@ -34,6 +35,13 @@ def session_fixture(engine) -> Generator[Session, None, None]:
         yield session
 
 
+@pytest.fixture(autouse=True)
+def clear_dashboard_caches():
+    """Start every test with empty per-user dashboard caches."""
+    dashboard_service.clear_dashboard_caches()
+    yield
+
+
 @pytest.fixture(name="client")
 def client_fixture(session: Session) -> Generator[TestClient, None, None]:
     """Create a test client with overridden database dependency."""
@@ -2,16 +2,23 @@
 Unit tests for MileSync multi-agent system.
 """
 
+import asyncio
+import os
+import subprocess
+import sys
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from app.agents.base_agent import (
     AgentContext,
     AgentResponse,
     AgentType,
     GoalType,
+    SupportOutput,
     TaskFrequency,
+    normalize_role,
 )
 from app.agents.coordinator import AgentCoordinator, get_agent_coordinator
 from app.agents.foundation_agent import FoundationAgent
@@ -72,6 +79,23 @@ class TestAgentContext:
         assert context.user_id == 1
         assert context.goal_id == 2
         assert len(context.messages) == 1
+    
+    def test_task_columns_from_history(self):
+        """Test columnar task history view is built once per history list."""
+        context = AgentContext(
+            user_id=1,
+            task_history=[
+                {"status": "completed", "created_at": "2024-01-01 09:00:00",
+                 "completed_at": "2024-01-01T10:00:00Z"},
+                {"status": "pending", "created_at": "2024-01-02 09:00:00",
+                 "completed_at": None},
+            ]
+        )
+        columns = context.task_columns()
+        assert len(columns) == 2
+        assert columns.completed_mask().tolist() == [True, False]
+        assert str(columns.completed_at[0]) == "2024-01-01T10:00:00"
+        assert context.task_columns() is columns
 
 
 class TestAgentResponse:
@@ -113,6 +137,16 @@ class TestAgentCoordinator:
         assert AgentType.SUPPORT in coordinator.agents
         assert AgentType.PSYCHOLOGICAL in coordinator.agents
     
+    def test_agents_instantiated_lazily(self):
+        """Test that agents are only built when first requested."""
+        coordinator = AgentCoordinator()
+        coordinator.get_agent_info()
+        assert coordinator.agents._instances == {}
+        
+        agent = coordinator.get_agent(AgentType.SUPPORT)
+        assert isinstance(agent, SupportAgent)
+        assert coordinator.get_agent(AgentType.SUPPORT) is agent
+    
     def test_get_agent_info(self, coordinator):
         """Test getting agent info list."""
         info = coordinator.get_agent_info()
@@ -157,6 +191,119 @@ class TestAgentCoordinator:
         )
         agent_type = coordinator._determine_agent(context)
         assert agent_type == AgentType.SUPPORT
+    
+    def test_keyword_priority_prefers_emotional_over_habit(self, coordinator):
+        """Test that emotional keywords win even when they appear later."""
+        context = AgentContext(
+            user_id=1,
+            goal_id=1,
+            messages=[
+                {"role": "user", "content": "My habit streak broke and I feel stuck"}
+            ]
+        )
+        agent_type = coordinator._determine_agent(context)
+        assert agent_type == AgentType.PSYCHOLOGICAL
+    
+    def test_route_caches_successful_response(self):
+        """Test that an identical request is served from the route cache."""
+        coordinator = AgentCoordinator()
+        agent = coordinator.agents[AgentType.SUPPORT]
+        agent.process = AsyncMock(return_value=agent.create_response(
+            success=True,
+            message="Here are some resources",
+            data={"resources": ["book"]},
+        ))
+        context = AgentContext(
+            user_id=1,
+            goal_id=1,
+            messages=[{"role": "user", "content": "Any tools or courses?"}]
+        )
+        
+        first = asyncio.run(coordinator.route(context))
+        second = asyncio.run(coordinator.route(context))
+        
+        assert agent.process.await_count == 1
+        assert second.message == first.message
+        assert second.data == {"resources": ["book"]}
+    
+    def test_route_cache_misses_after_task_status_change(self):
+        """Test a task completed since the last call is not answered from the cache."""
+        coordinator = AgentCoordinator()
+        agent = coordinator.agents[AgentType.EXECUTION]
+        agent.process = AsyncMock(return_value=agent.create_response(success=True, data={}))
+        tasks = [{"id": 1, "title": "Run 5k", "status": "pending", "completed_at": None}]
+        context = AgentContext(
+            user_id=1,
+            goal_id=1,
+            task_history=tasks,
+            additional_context={"request_type": "daily_checkin"},
+        )
+        
+        asyncio.run(coordinator.route(context))
+        context.task_history = [{**tasks[0], "status": "completed", "completed_at": "2026-01-02"}]
+        asyncio.run(coordinator.route(context))
+        
+        assert agent.process.await_count == 2
+    
+    def test_invalidate_user_drops_cached_responses(self):
+        """Test invalidate_user makes the next identical request run the agent again."""
+        coordinator = AgentCoordinator()
+        agent = coordinator.agents[AgentType.SUPPORT]
+        agent.process = AsyncMock(return_value=agent.create_response(success=True, data={}))
+        context = AgentContext(
+            user_id=1,
+            goal_id=1,
+            messages=[{"role": "user", "content": "Any tools or courses?"}]
+        )
+        
+        asyncio.run(coordinator.route(context))
+        coordinator.invalidate_user(2)
+        asyncio.run(coordinator.route(context))
+        assert agent.process.await_count == 1
+        
+        coordinator.invalidate_user(1)
+        asyncio.run(coordinator.route(context))
+        assert agent.process.await_count == 2
+    
+    def test_cache_generations_expire_without_reuse(self):
+        """Test expired generations are dropped and a reissued one never repeats."""
+        coordinator = AgentCoordinator()
+        coordinator._cache_generations.ttl = -1  # every generation expires at once
+        
+        coordinator.invalidate_user(1)
+        assert coordinator._cache_generations.get(1) is None
+        assert len(coordinator._cache_generations) == 0
+        
+        coordinator._cache_generations.ttl = 300
+        coordinator.invalidate_user(1)
+        assert coordinator._cache_generations.get(1) == 2
+    
+    def test_route_chains_with_previous_output(self):
+        """Test a chained agent runs once, after and with its predecessor's output."""
+        coordinator = AgentCoordinator()
+        planning = coordinator.agents[AgentType.PLANNING]
+        execution = coordinator.agents[AgentType.EXECUTION]
+        planning.process = AsyncMock(return_value=planning.create_response(
+            success=True,
+            data={"plan": "ok"},
+            next_agent=AgentType.EXECUTION,
+        ))
+        execution.process = AsyncMock(return_value=execution.create_response(
+            success=True,
+            data={"tasks": []},
+        ))
+        context = AgentContext(
+            user_id=1,
+            additional_context={"agent_type": "planning"},
+        )
+        response = asyncio.run(coordinator.route(context))
+        
+        assert execution.process.await_count == 1
+        chain_context = execution.process.await_args.args[0]
+        assert chain_context.additional_context["agent_type"] == AgentType.EXECUTION
+        assert chain_context.additional_context["previous_agent"] == AgentType.PLANNING
+        assert chain_context.additional_context["previous_output"]["plan"] == "ok"
+        assert response.data["chained_response"] == {"tasks": []}
 
 
 # Test Foundation Agent
@@ -193,6 +340,89 @@ class TestFoundationAgent:
         assert response.trace_id is not None
 
 
+class TestGenerateResponsesBatch:
+    """Tests for concurrent batch generation on BaseAgent."""
+    
+    def test_batch_returns_responses_in_order(self):
+        """Test that batch responses line up with the input pairs."""
+        agent = FoundationAgent()
+        
+        async def fake_create(model, messages, temperature):
+            reply = MagicMock()
+            reply.choices = [MagicMock()]
+            reply.choices[0].message.content = f"echo: {messages[-1]['content']}"
+            return reply
+        
+        client = MagicMock()
+        client.chat.completions.create = AsyncMock(side_effect=fake_create)
+        
+        pairs = [
+            (AgentContext(user_id=1), "first"),
+            (AgentContext(user_id=2), "second"),
+        ]
+        with patch(
+            "app.services.openai_clients.get_async_openai_client",
+            return_value=client
+        ):
+            results = asyncio.run(agent.generate_responses_batch(pairs))
+        
+        assert results == ["echo: first", "echo: second"]
+        assert client.chat.completions.create.await_count == 2
+    
+    def test_batch_empty_input(self):
+        """Test that an empty batch makes no calls."""
+        agent = FoundationAgent()
+        assert asyncio.run(agent.generate_responses_batch([])) == []
+    
+    def test_generate_structured_response_validates_schema(self):
+        """Test structured responses request a json_schema and validate into the model."""
+        agent = SupportAgent()
+        reply = MagicMock()
+        reply.choices = [MagicMock()]
+        reply.choices[0].message.content = (
+            '{"recommended_resources": [{"type": "BOOK", "name": "Atomic Habits"}]}'
+        )
+        client = MagicMock()
+        client.chat.completions.create = AsyncMock(return_value=reply)
+        
+        with patch(
+            "app.services.openai_clients.get_async_openai_client",
+            return_value=client
+        ):
+            output = asyncio.run(
+                agent.generate_structured_response("recommend", SupportOutput)
+            )
+        
+        assert isinstance(output, SupportOutput)
+        assert output.recommended_resources[0].name == "Atomic Habits"
+        response_format = client.chat.completions.create.call_args.kwargs["response_format"]
+        assert response_format["type"] == "json_schema"
+        assert response_format["json_schema"]["name"] == "SupportOutput"
+    
+    def test_generate_response_joins_stream(self):
+        """Test that generate_response assembles streamed deltas."""
+        agent = FoundationAgent()
+        
+        async def fake_stream():
+            for text in ["Hel", None, "lo"]:
+                chunk = MagicMock()
+                chunk.choices = [MagicMock()]
+                chunk.choices[0].delta.content = text
+                yield chunk
+        
+        client = MagicMock()
+        client.chat.completions.create = AsyncMock(return_value=fake_stream())
+        
+        with patch(
+            "app.services.openai_clients.get_async_openai_client",
+            return_value=client
+        ):
+            result = asyncio.run(agent.generate_response(AgentContext(user_id=1), "hi"))
+        
+        assert result == "Hello"
+        assert client.chat.completions.create.call_args.kwargs["stream"] is True
+
+
 # Test Planning Agent
 
 class TestPlanningAgent:
@@ -224,9 +454,20 @@ class TestExecutionAgent:
     
     def test_calculate_streak_empty(self, agent):
         """Test streak calculation with no history."""
-        streak = agent._calculate_streak([])
+        streak = agent._calculate_streak(AgentContext(user_id=1).task_columns())
         assert streak == 0
     
+    def test_calculate_streak_consecutive_days(self, agent):
+        """Test streak stops at the first day without a completion."""
+        now = datetime.utcnow()
+        history = [
+            {"status": "completed", "completed_at": (now - timedelta(days=d)).isoformat()}
+            for d in [0, 0, 1, 2, 4]
+        ]
+        history.append({"status": "pending", "completed_at": (now - timedelta(days=3)).isoformat()})
+        context = AgentContext(user_id=1, task_history=history)
+        assert agent._calculate_streak(context.task_columns()) == 3
+    
     def test_is_today_with_today_date(self, agent):
         """Test today check with current date."""
         today_iso = datetime.utcnow().isoformat()
@@ -348,6 +589,33 @@ class TestAgentEnums:
         assert TaskFrequency.DAILY.value == "daily"
         assert TaskFrequency.WEEKLY.value == "weekly"
         assert TaskFrequency.ONE_TIME.value == "one_time"
+    
+    def test_normalize_role_interns_plain_string(self):
+        """Test roles are normalized to shared plain strings."""
+        from app.models.chat import MessageRole
+        
+        role = normalize_role(MessageRole.ASSISTANT)
+        assert isinstance(role, str) and not isinstance(role, MessageRole), (
+            "normalize_role must return a plain str, not the MessageRole member"
+        )
+        assert role is normalize_role("".join(["assis", "tant"]))
+        assert normalize_role(None) == "user"
+
+
+class TestImports:
+    """Tests that agent modules import cleanly on their own."""
+    
+    @pytest.mark.parametrize("module", ["app.agents.coordinator", "app.schemas.agent"])
+    def test_module_imports_in_fresh_interpreter(self, module):
+        """Test importing a module first does not hit a circular import."""
+        # Reason: This test session has already imported everything, so the
+        # import order only shows up in a new interpreter
+        backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        result = subprocess.run(
+            [sys.executable, "-c", f"import {module}"],
+            cwd=backend_dir, capture_output=True, text=True,
+        )
+        assert result.returncode == 0, result.stderr
 
 
 # Integration Tests
@@ -359,3 +627,61 @@ class TestAgentIntegration:
         """Test that coordinator is a singleton."""
         coordinator2 = get_agent_coordinator()
         assert coordinator is coordinator2
+    
+    def test_goal_context_reuses_recent_lookup(self, session, test_user, test_goal):
+        """Test goal summaries are cached per user and skip repeat lookups."""
+        from app.services import dashboard_service
+        
+        dashboard_service.clear_dashboard_caches()
+        summary = dashboard_service.get_goal_summary(session, test_user.id, test_goal.id)
+        assert summary["title"] == test_goal.title
+        
+        with patch.object(session, "get") as mock_get:
+            assert dashboard_service.get_goal_summary(session, test_user.id, test_goal.id) is summary
+            mock_get.assert_not_called()
+        
+        assert dashboard_service.get_goal_summary(session, test_user.id + 1, test_goal.id) is None
+    
+    def test_goal_update_invalidates_cached_summary(
+        self, client, auth_headers, session, test_user, test_goal
+    ):
+        """Test agents see a goal's new title right after it is edited."""
+        from app.services import dashboard_service
+        
+        goal_id, user_id = test_goal.id, test_user.id
+        dashboard_service.get_goal_summary(session, user_id, goal_id)
+        
+        response = client.put(
+            f"/api/goals/{goal_id}", json={"title": "Renamed goal"}, headers=auth_headers
+        )
+        assert response.status_code == 200
+        
+        summary = dashboard_service.get_goal_summary(session, user_id, goal_id)
+        assert summary["title"] == "Renamed goal"
+    
+    def test_route_endpoint_passes_agent_data_through(self, client, auth_headers):
+        """Test /agents/route returns the agent's data unchanged."""
+        from app.routes import agents as agents_routes
+        
+        agent_response = AgentResponse(
+            agent_type=AgentType.SUPPORT,
+            message="Here are some resources",
+            data={"resources": [{"title": "Guide", "rating": 4.5}]},
+        )
+        with patch.object(
+            agents_routes.coordinator, "route", AsyncMock(return_value=agent_response)
+        ):
+            response = client.post(
+                "/api/agents/route",
+                json={"messages": [{"role": "user", "content": "resources please"}]},
+                headers=auth_headers,
+            )
+        
+        assert response.status_code == 200
+        assert response.json() == {
+            "agent_type": "support",
+            "success": True,
+            "message": "Here are some resources",
+            "data": {"resources": [{"title": "Guide", "rating": 4.5}]},
+            "requires_user_input": False,
+        }
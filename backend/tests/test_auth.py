@@ -0,0 +1,78 @@
+"""Tests for authentication endpoints."""
+
+
+class TestEmailLookup:
+    """Tests for case-insensitive email lookups."""
+
+    def test_login_ignores_email_case(self, client, test_user):
+        """Test login matches the stored email regardless of case."""
+        response = client.post(
+            "/api/auth/login",
+            json={"email": "Test@Example.com", "password": "testpassword123"},
+        )
+        assert response.status_code == 200
+        assert response.json()["user"]["id"] == test_user.id
+
+    def test_register_rejects_case_variant(self, client, test_user):
+        """Test registering an existing email with different case fails."""
+        response = client.post(
+            "/api/auth/register",
+            json={"email": "TEST@example.com", "password": "anotherpass123", "name": "Dup"},
+        )
+        assert response.status_code == 400
+
+    def test_deduped_case_duplicate_keeps_exact_login(self, client, session, test_user):
+        """Test a case-duplicate with a cleared email_ci still signs in and stays cleared."""
+        from sqlalchemy import insert
+
+        from app.models.user import User
+        from app.services.auth_service import get_user_by_email, hash_password
+
+        # Reason: A Core insert skips the ORM listener, modelling a legacy
+        # account whose email_ci the migration's dedupe step cleared.
+        row = User(email="Test@Example.com", name="Legacy", password_hash=hash_password("legacy123"))
+        row = row.model_dump(exclude={"id"}) | {"email_ci": None}
+        session.execute(insert(User).values(**row))
+        session.commit()
+        duplicate = get_user_by_email(session, "Test@Example.com")
+
+        assert duplicate.id != test_user.id
+        assert get_user_by_email(session, "TEST@EXAMPLE.COM").id == test_user.id
+
+        duplicate.name = "Renamed"
+        session.commit()
+        session.refresh(duplicate)
+        assert duplicate.email_ci is None
+
+
+class TestAccessTokens:
+    """Tests for JWT access token decoding."""
+
+    def test_round_trip(self):
+        """Test a fresh token decodes to its user ID, repeatedly."""
+        from app.services.auth_service import create_access_token, decode_access_token
+
+        token = create_access_token(user_id=42)
+
+        assert decode_access_token(token) == 42
+        assert decode_access_token(token) == 42
+
+    def test_cached_token_still_expires(self, monkeypatch):
+        """Test a token verified earlier is rejected once its exp has passed."""
+        import time
+        from datetime import timedelta
+
+        from app.services.auth_service import create_access_token, decode_access_token
+
+        token = create_access_token(user_id=7, expires_delta=timedelta(minutes=5))
+        assert decode_access_token(token) == 7
+
+        real_time = time.time
+        monkeypatch.setattr(time, "time", lambda: real_time() + 3600)
+        assert decode_access_token(token) is None
+
+    def test_rejects_garbage(self):
+        """Test a malformed token is rejected."""
+        from app.services.auth_service import decode_access_token
+
+        assert decode_access_token("not-a-jwt") is None
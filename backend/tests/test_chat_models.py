@@ -0,0 +1,113 @@
+"""Tests for chat database models."""
+
+from sqlmodel import Session
+
+from app.models.chat import ChatMessage, ChatSession, content_digest
+
+
+class TestChatMessageDigest:
+    """Tests for the content_sha256 cache column."""
+
+    def test_digest_set_on_insert_and_update(self, session: Session, test_user):
+        """Test content_sha256 tracks content across writes."""
+        chat = ChatSession(user_id=test_user.id)
+        session.add(chat)
+        session.commit()
+
+        message = ChatMessage(session_id=chat.id, content="I want to run a marathon")
+        session.add(message)
+        session.commit()
+        session.refresh(message)
+        assert message.content_sha256 == content_digest("I want to run a marathon")
+        assert len(message.content_sha256) == 32
+
+        message.content = "I want to run a half marathon"
+        session.add(message)
+        session.commit()
+        session.refresh(message)
+        assert message.content_sha256 == content_digest("I want to run a half marathon")
+
+
+class TestMessageResponseRole:
+    """Tests for the Literal role on MessageResponse."""
+
+    def test_literal_matches_enum(self):
+        """Test the response Literal lists exactly the MessageRole values."""
+        from typing import get_args
+
+        from app.models.chat import MessageRole
+        from app.schemas.chat import MessageRoleValue
+
+        assert set(get_args(MessageRoleValue)) == {role.value for role in MessageRole}
+
+    def test_accepts_enum_from_orm(self):
+        """Test an ORM message's enum role validates and serializes as its value."""
+        from app.models.chat import MessageRole
+        from app.schemas.chat import MessageResponse
+
+        message = ChatMessage(id=1, session_id=1, role=MessageRole.ASSISTANT, content="Hi")
+        response = MessageResponse.model_validate(message)
+
+        assert response.role == "assistant"
+        assert '"role":"assistant"' in response.model_dump_json()
+
+
+class TestTimestampConvention:
+    """Tests that every timestamp writer uses naive UTC."""
+
+    def test_model_defaults_and_service_writes_match(self, session: Session, test_task):
+        """Test model defaults and service-set timestamps are both naive."""
+        from app.models.goal import TaskStatus
+        from app.services import goal_service
+
+        assert ChatSession(user_id=1).created_at.tzinfo is None
+
+        task = goal_service.update_task(session, test_task, {"status": TaskStatus.COMPLETED})
+        assert task.completed_at.tzinfo is None
+        assert task.created_at.tzinfo is None
+
+
+class TestSmallIntEnumSqliteConversion:
+    """Tests for converting pre-SmallIntEnum SQLite databases."""
+
+    def test_converted_name_columns_load(self, tmp_path):
+        """Test the SQLite migration turns stored enum names into loadable codes."""
+        import sqlite3
+        from pathlib import Path
+
+        from sqlmodel import create_engine, select
+
+        from app.models.chat import ChatStatus, MessageRole
+
+        db_path = tmp_path / "legacy.db"
+        conn = sqlite3.connect(db_path)
+        # Reason: Mirrors the VARCHAR enum columns create_all produced before
+        # SmallIntEnum, filled with member names.
+        conn.executescript(
+            """
+            CREATE TABLE users (id INTEGER PRIMARY KEY, auth_provider VARCHAR(5));
+            CREATE TABLE goals (id INTEGER PRIMARY KEY, category VARCHAR(9),
+                goal_type VARCHAR(10), status VARCHAR(9));
+            CREATE TABLE user_profiles (id INTEGER PRIMARY KEY, learning_style VARCHAR(11),
+                motivation_type VARCHAR(11), personality_type VARCHAR(10));
+            CREATE TABLE chat_sessions (id INTEGER PRIMARY KEY, user_id INTEGER,
+                status VARCHAR(9), started_at DATETIME, updated_at DATETIME);
+            CREATE TABLE user_insights (id INTEGER PRIMARY KEY, insight_type VARCHAR(14));
+            CREATE TABLE chat_messages (id INTEGER PRIMARY KEY, role VARCHAR(9));
+            CREATE TABLE tasks (id INTEGER PRIMARY KEY, status VARCHAR(11),
+                priority VARCHAR(6), frequency VARCHAR(8));
+            CREATE TABLE habit_loops (id INTEGER PRIMARY KEY, strength VARCHAR(11));
+            INSERT INTO chat_sessions VALUES (1, 1, 'FINALIZED', '2026-01-01', '2026-01-01');
+            INSERT INTO chat_messages VALUES (1, 'ASSISTANT');
+            """
+        )
+        migration = Path(__file__).parent.parent / "migrations" / "enum_columns_to_smallint_sqlite.sql"
+        conn.executescript(migration.read_text())
+        conn.executescript(migration.read_text())  # idempotent
+        conn.close()
+
+        engine = create_engine(f"sqlite:///{db_path}")
+        with Session(engine) as db:
+            assert db.exec(select(ChatSession.status)).one() == ChatStatus.FINALIZED
+            assert db.exec(select(ChatMessage.role)).one() == MessageRole.ASSISTANT
+        engine.dispose()
@@ -0,0 +1,38 @@
+"""Tests for the CORS middleware."""
+
+
+class TestCORS:
+    """Tests for CORS headers on API responses."""
+
+    def test_simple_request_echoes_origin(self, client):
+        """Test cross-origin requests get the origin echoed with credentials."""
+        response = client.get("/health", headers={"Origin": "https://app.example.com"})
+        assert response.status_code == 200
+        assert response.headers["access-control-allow-origin"] == "https://app.example.com"
+        assert response.headers["access-control-allow-credentials"] == "true"
+
+    def test_same_origin_request_untouched(self, client):
+        """Test requests without an Origin header get no CORS headers."""
+        response = client.get("/health")
+        assert "access-control-allow-origin" not in response.headers
+
+    def test_preflight(self, client):
+        """Test preflight requests are answered without reaching the router."""
+        response = client.options(
+            "/api/goals",
+            headers={
+                "Origin": "https://app.example.com",
+                "Access-Control-Request-Method": "POST",
+                "Access-Control-Request-Headers": "authorization, content-type",
+            },
+        )
+        assert response.status_code == 200
+        assert response.text == "OK"
+        assert response.headers["access-control-allow-origin"] == "https://app.example.com"
+        assert response.headers["access-control-allow-headers"] == "authorization, content-type"
+        assert "POST" in response.headers["access-control-allow-methods"]
+
+    def test_pagination_header_exposed(self, client):
+        """Test browsers may read the pagination cursor header cross-origin."""
+        response = client.get("/health", headers={"Origin": "https://app.example.com"})
+        assert response.headers["access-control-expose-headers"] == "X-Next-Cursor"
@@ -38,6 +38,22 @@ class TestDashboardStats:
         assert len(data["upcoming_tasks"]) == 1
         assert data["upcoming_tasks"][0]["title"] == "Test Task"
 
+    def test_stats_refresh_after_task_change(
+        self, client, auth_headers, session, test_goal, test_milestone, test_task
+    ):
+        """Test cached stats are dropped when a task is completed through the API."""
+        first = client.get("/api/dashboard/stats", headers=auth_headers).json()
+        assert first["completed_tasks"] == 0
+
+        response = client.post(
+            f"/api/goals/{test_goal.id}/tasks/{test_task.id}/complete",
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+
+        second = client.get("/api/dashboard/stats", headers=auth_headers).json()
+        assert second["completed_tasks"] == 1
+
     def test_get_stats_with_completed_tasks(
         self, client, auth_headers, session, test_goal, test_milestone
     ):
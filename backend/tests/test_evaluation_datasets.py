@@ -0,0 +1,59 @@
+"""Tests for the Opik evaluation datasets module."""
+
+import pytest
+
+from app import evaluation_datasets
+
+
+class TestEvaluationDatasets:
+    """Tests for the frozen evaluation datasets."""
+
+    def test_all_datasets_shared(self):
+        """Test get_all_datasets returns the same objects as the getters."""
+        datasets = evaluation_datasets.get_all_datasets()
+        assert datasets is evaluation_datasets.get_all_datasets()
+        assert datasets["coaching"] is evaluation_datasets.get_coaching_dataset()
+        assert datasets["smart_alignment"] is evaluation_datasets.get_smart_alignment_dataset()
+
+    def test_datasets_are_immutable(self):
+        """Test dataset items and their nested values can't be mutated."""
+        item = evaluation_datasets.get_goal_extraction_dataset()[0]
+        assert item["id"] == "extract-001"
+
+        with pytest.raises(TypeError):
+            item["id"] = "changed"
+        with pytest.raises(TypeError):
+            item["input"]["conversation"][0]["role"] = "system"
+        assert isinstance(item["input"]["conversation"], tuple)
+
+    def test_module_constants_resolve_lazily(self):
+        """Test the *_DATASET constants resolve to the loaded datasets."""
+        assert (
+            evaluation_datasets.FRUSTRATION_DETECTION_DATASET
+            is evaluation_datasets.get_frustration_dataset()
+        )
+        with pytest.raises(AttributeError):
+            evaluation_datasets.UNKNOWN_DATASET
+
+    def test_smart_alignment_gold(self):
+        """Test the SMART gold matrices line up with the dataset."""
+        scores, ranges = evaluation_datasets.get_smart_alignment_gold()
+        dataset = evaluation_datasets.get_smart_alignment_dataset()
+        assert scores.shape == (len(dataset), 5)
+        assert ranges.shape == (len(dataset), 2)
+        assert scores[0, 4] == pytest.approx(dataset[0]["expected_scores"]["time_bound"])
+        assert not scores.flags.writeable
+
+    def test_score_smart_alignment_perfect_prediction(self):
+        """Test a prediction equal to the gold data scores zero error."""
+        scores, ranges = evaluation_datasets.get_smart_alignment_gold()
+        result = evaluation_datasets.score_smart_alignment(scores, ranges.mean(axis=1))
+        assert result["overall_mae"] == 0.0
+        assert result["in_range_rate"] == 1.0
+        assert set(result["mae"]) == set(evaluation_datasets.SMART_CRITERIA)
+
+    def test_dataset_keys_are_interned(self):
+        """Test items share interned key objects."""
+        first, second = evaluation_datasets.get_coaching_dataset()[:2]
+        first_keys = {key: key for key in first}
+        assert all(first_keys[key] is key for key in second if key in first_keys)
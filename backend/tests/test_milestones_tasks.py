@@ -1,9 +1,12 @@
 """Tests for milestone and task CRUD API endpoints."""
 
 import pytest
+from sqlalchemy import text
 from sqlmodel import Session
 
-from app.models.goal import Milestone, Task, TaskStatus, TaskPriority
+from app.models.goal import Goal, GoalCategory, Milestone, Task, TaskStatus, TaskPriority
+from app.models.user import User
+from app.services.auth_service import create_access_token
 
 
 class TestMilestoneEndpoints:
@@ -102,6 +105,19 @@ class TestMilestoneEndpoints:
         task = session.get(Task, task_id)
         assert task is None
 
+    def test_delete_goal_removes_milestones_and_tasks(
+        self, client, auth_headers, session, test_goal, test_milestone, test_task
+    ):
+        """Test that deleting a goal also deletes its milestones and tasks."""
+        milestone_id, task_id = test_milestone.id, test_task.id
+
+        response = client.delete(f"/api/goals/{test_goal.id}", headers=auth_headers)
+        assert response.status_code == 204
+
+        session.expire_all()
+        assert session.get(Milestone, milestone_id) is None
+        assert session.get(Task, task_id) is None
+
     def test_milestone_requires_auth(self, client, test_goal):
         """Test that milestone endpoints require authentication."""
         response = client.post(
@@ -172,6 +188,46 @@ class TestTaskEndpoints:
         assert response.json()["status"] == "completed"
         assert response.json()["completed_at"] is not None
 
+    def test_update_task_status_and_fields(self, client, auth_headers, session, test_goal, test_task):
+        """Test a status change and field edits land together with progress updated."""
+        response = client.put(
+            f"/api/goals/{test_goal.id}/tasks/{test_task.id}",
+            headers=auth_headers,
+            json={"status": "completed", "title": "Done Task"},
+        )
+        assert response.status_code == 200
+        assert response.json()["title"] == "Done Task"
+        assert response.json()["status"] == "completed"
+
+        session.refresh(test_goal)
+        assert test_goal.completed_task_count == 1
+
+    def test_task_of_other_users_goal_not_found(self, client, session, test_goal, test_task):
+        """Test another user cannot reach a task through its goal."""
+        other = User(email="other@example.com", name="Other", password_hash="x")
+        session.add(other)
+        session.commit()
+        headers = {"Authorization": f"Bearer {create_access_token(user_id=other.id)}"}
+
+        response = client.post(
+            f"/api/goals/{test_goal.id}/tasks/{test_task.id}/complete",
+            headers=headers,
+        )
+        assert response.status_code == 404
+
+    def test_task_under_wrong_goal_not_found(self, client, auth_headers, session, test_user, test_task):
+        """Test a task is not reachable through a different goal of the same user."""
+        other_goal = Goal(user_id=test_user.id, title="Other", category=GoalCategory.PERSONAL)
+        session.add(other_goal)
+        session.commit()
+
+        response = client.put(
+            f"/api/goals/{other_goal.id}/tasks/{test_task.id}",
+            headers=auth_headers,
+            json={"title": "Hijacked"},
+        )
+        assert response.status_code == 404
+
     def test_delete_task(self, client, auth_headers, session, test_goal, test_task):
         """Test deleting a task."""
         task_id = test_task.id
@@ -217,6 +273,21 @@ class TestTaskEndpoints:
         assert response.status_code == 200
         assert response.json()["status"] == "pending"
 
+    def test_task_enums_stored_as_smallint(self, session, test_task):
+        """Test task enum columns are stored as small integer codes."""
+        test_task.status = "completed"  # Raw values are coerced like members
+        session.add(test_task)
+        session.commit()
+
+        row = session.execute(
+            text("SELECT status, priority FROM tasks WHERE id = :id"), {"id": test_task.id}
+        ).one()
+        assert row.status == list(TaskStatus).index(TaskStatus.COMPLETED)
+        assert row.priority == list(TaskPriority).index(test_task.priority)
+
+        session.expire(test_task)
+        assert test_task.status is TaskStatus.COMPLETED
+
     def test_task_requires_auth(self, client, test_goal, test_milestone):
         """Test that task endpoints require authentication."""
         response = client.post(
@@ -258,6 +329,12 @@ class TestGoalProgressUpdate:
         assert response.status_code == 200
         assert response.json()["progress"] == 50  # 1 of 2 tasks
 
+        # Goal listing reads the denormalized task counters
+        response = client.get("/api/goals", headers=auth_headers)
+        listed = next(g for g in response.json() if g["id"] == test_goal.id)
+        assert listed["task_count"] == 2
+        assert listed["completed_task_count"] == 1
+
     def test_progress_updates_on_delete(
         self, client, auth_headers, session, test_goal, test_milestone
     ):
@@ -289,3 +366,90 @@ class TestGoalProgressUpdate:
         response = client.get(f"/api/goals/{test_goal.id}", headers=auth_headers)
         assert response.status_code == 200
         assert response.json()["progress"] == 100
+
+
+class TestGoalJSONFields:
+    """Tests for change tracking on goal JSON columns."""
+
+    def test_in_place_edit_is_persisted(self, session, test_goal):
+        """Test mutating a JSON dict in place marks it dirty and persists."""
+        test_goal.success_criteria = {"weekly_runs": 3}
+        session.add(test_goal)
+        session.commit()
+
+        test_goal.success_criteria["weekly_runs"] = 4
+        assert test_goal in session.dirty
+        session.commit()
+
+        session.expire(test_goal)
+        assert test_goal.success_criteria == {"weekly_runs": 4}
+
+
+class TestTimestamps:
+    """Tests for automatic model timestamps."""
+
+    def test_updated_at_bumped_on_update(self, session, test_goal):
+        """Test updated_at is restamped on UPDATE without caller help."""
+        from datetime import datetime, timedelta
+
+        stale = datetime(2020, 1, 1)
+        test_goal.updated_at = stale
+        session.add(test_goal)
+        session.commit()
+
+        test_goal.title = "Renamed goal"
+        session.add(test_goal)
+        session.commit()
+        session.refresh(test_goal)
+
+        assert test_goal.updated_at > stale + timedelta(days=1)
+
+
+class TestGoalDetail:
+    """Tests for loading a goal with its milestones and tasks."""
+
+    def _add_milestones(self, session, goal, count, tasks_each):
+        """Create milestones, each with a few tasks."""
+        for order in range(count):
+            milestone = Milestone(goal_id=goal.id, title=f"M{order}", order=order)
+            session.add(milestone)
+            session.commit()
+            for i in range(tasks_each):
+                session.add(Task(milestone_id=milestone.id, goal_id=goal.id, title=f"M{order}T{i}"))
+        session.commit()
+
+    def test_tasks_grouped_under_milestones(self, client, auth_headers, session, test_goal):
+        """Test each milestone carries only its own tasks, in creation order."""
+        self._add_milestones(session, test_goal, count=2, tasks_each=2)
+
+        response = client.get(f"/api/goals/{test_goal.id}", headers=auth_headers)
+
+        assert response.status_code == 200
+        milestones = response.json()["milestones"]
+        assert [[t["title"] for t in m["tasks"]] for m in milestones] == [
+            ["M0T0", "M0T1"],
+            ["M1T0", "M1T1"],
+        ]
+
+    def test_query_count_independent_of_milestones(self, client, auth_headers, session, engine, test_goal):
+        """Test loading the goal doesn't issue a query per milestone."""
+        from sqlalchemy import event
+
+        def count_queries():
+            statements = []
+
+            def listener(conn, cursor, statement, *args):
+                statements.append(statement)
+
+            event.listen(engine, "before_cursor_execute", listener)
+            try:
+                assert client.get(f"/api/goals/{test_goal.id}", headers=auth_headers).status_code == 200
+            finally:
+                event.remove(engine, "before_cursor_execute", listener)
+            return len(statements)
+
+        self._add_milestones(session, test_goal, count=1, tasks_each=1)
+        baseline = count_queries()
+        self._add_milestones(session, test_goal, count=5, tasks_each=3)
+
+        assert count_queries() == baseline
@@ -0,0 +1,102 @@
+"""Tests for the OpenAI Batch API helpers."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import openai_batch
+from app.utils import json_utils
+
+
+def _line(custom_id, status_code=200, body=None, error=None):
+    """Build one batch output line."""
+    return json_utils.dumps({
+        "custom_id": custom_id,
+        "response": {"status_code": status_code, "body": body or {}},
+        "error": error,
+    })
+
+
+class FakeClient:
+    """Minimal stand-in for the OpenAI client's files and raw REST calls."""
+
+    def __init__(self, statuses, output):
+        self.statuses = list(statuses)
+        self.output = output
+        self.uploaded = None
+        self.created = None
+        self.files = SimpleNamespace(create=self._upload, content=self._content)
+
+    def _upload(self, file, purpose):
+        self.uploaded = (file, purpose)
+        return SimpleNamespace(id="file-in")
+
+    def _content(self, file_id):
+        return SimpleNamespace(text=self.output[file_id])
+
+    def post(self, path, body, cast_to):
+        self.created = (path, body)
+        return {"id": "batch-1"}
+
+    def get(self, path, cast_to):
+        status = self.statuses.pop(0)
+        return {"status": status, "output_file_id": "file-out", "error_file_id": "file-err"}
+
+
+class TestParseBatchOutput:
+    """Tests for mapping output lines to results."""
+
+    def test_maps_successes_and_failures_by_custom_id(self):
+        """Test successful bodies pass through and failures become error dicts."""
+        text = "\n".join([
+            _line("a", body={"choices": [{"message": {"content": "Hi"}}]}),
+            _line("b", status_code=500, body={"error": {"message": "server error"}}),
+            "",
+        ])
+
+        results = openai_batch.parse_batch_output(text)
+
+        assert openai_batch.completion_message(results["a"]) == {"content": "Hi"}
+        assert results["b"] == {"error": "server error"}
+        with pytest.raises(RuntimeError, match="server error"):
+            openai_batch.completion_message(results["b"])
+
+
+class TestSubmitAndAwait:
+    """Tests for the submit / poll / download round trip."""
+
+    def test_round_trip(self):
+        """Test requests upload as JSONL and results merge output and error files."""
+        client = FakeClient(
+            statuses=["validating", "in_progress", "completed"],
+            output={
+                "file-out": _line("a", body={"choices": [{"message": {"content": "Hi"}}]}),
+                "file-err": _line("b", status_code=400, body={"error": {"message": "bad"}}),
+            },
+        )
+        requests = [
+            openai_batch.chat_request("a", {"model": "gpt-4o-mini", "messages": []}),
+            openai_batch.chat_request("b", {"model": "gpt-4o-mini", "messages": []}),
+        ]
+
+        batch_id = openai_batch.submit_batch(requests, client=client)
+        results = openai_batch.await_batch(batch_id, client=client, poll_interval=0)
+
+        (name, payload), purpose = client.uploaded
+        assert purpose == "batch"
+        assert [json_utils.loads(line)["custom_id"] for line in payload.splitlines()] == ["a", "b"]
+        assert client.created[1]["endpoint"] == "/v1/chat/completions"
+        assert results["a"]["choices"][0]["message"]["content"] == "Hi"
+        assert results["b"] == {"error": "bad"}
+
+    def test_failed_batch_raises(self):
+        """Test a batch that ends in a non-completed state raises."""
+        client = FakeClient(statuses=["expired"], output={})
+
+        with pytest.raises(RuntimeError, match="expired"):
+            openai_batch.await_batch("batch-1", client=client, poll_interval=0)
+
+    def test_empty_batch_rejected(self):
+        """Test submitting no requests fails before any upload."""
+        with pytest.raises(ValueError):
+            openai_batch.submit_batch([], client=FakeClient([], {}))
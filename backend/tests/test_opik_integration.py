@@ -191,12 +191,114 @@ class TestUserFrustrationDetector:
             assert len(result["indicators"]) > 0
 
 
+class TestAsyncJudges:
+    """Tests for the async twins of the judge methods."""
+
+    @patch('app.services.opik_service.AsyncOpenAI')
+    def test_score_async_matches_sync_parsing(self, mock_async_openai):
+        """Test score_async awaits the async client and parses like score."""
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = json.dumps({"score": 0.8, "reason": "Specific"})
+
+        mock_client = MagicMock()
+        mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
+        mock_async_openai.return_value = mock_client
+
+        from app.services.opik_service import GoalCoachingQualityMetric
+
+        result = asyncio.run(GoalCoachingQualityMetric().score_async(
+            user_input="I want to learn Python",
+            ai_response="What would you like to build with it?",
+        ))
+
+        assert result == {"score": 0.8, "reason": "Specific"}
+        prompt = mock_client.chat.completions.create.call_args.kwargs["messages"][0]["content"]
+        assert "I want to learn Python" in prompt
+
+    @patch('app.services.opik_service.AsyncOpenAI')
+    def test_detect_async_falls_back_on_error(self, mock_async_openai):
+        """Test detect_async returns the neutral result when the call fails."""
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        mock_client = MagicMock()
+        mock_client.chat.completions.create = AsyncMock(side_effect=RuntimeError("timeout"))
+        mock_async_openai.return_value = mock_client
+
+        from app.services.opik_service import UserFrustrationDetector
+
+        result = asyncio.run(UserFrustrationDetector().detect_async(
+            user_input="a", previous_response="b", current_reply="c",
+        ))
+
+        assert result == {"frustration_score": 0.0, "indicators": []}
+
+    @patch('app.services.opik_service.AsyncOpenAI')
+    def test_raise_errors_propagates_instead_of_falling_back(self, mock_async_openai):
+        """Test a judge built with raise_errors raises rather than returning a fallback score."""
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        mock_client = MagicMock()
+        mock_client.chat.completions.create = AsyncMock(side_effect=RuntimeError("timeout"))
+        mock_async_openai.return_value = mock_client
+
+        from app.services.opik_service import GoalCoachingQualityMetric
+
+        with pytest.raises(RuntimeError, match="timeout"):
+            asyncio.run(GoalCoachingQualityMetric(raise_errors=True).score_async(
+                user_input="a", ai_response="b",
+            ))
+
+    @pytest.mark.parametrize("judge_name", [
+        "GoalCoachingQualityMetric", "GoalExtractionQualityMetric", "UserFrustrationDetector",
+    ])
+    def test_raise_errors_propagates_parse_failures(self, judge_name):
+        """Test raise_errors also raises on a reply that is not JSON instead of a fallback."""
+        from app.services import opik_service
+        from app.utils import json_utils
+
+        judge = getattr(opik_service, judge_name)(raise_errors=True)
+
+        with pytest.raises(json_utils.JSONDecodeError):
+            judge._parse("not json")
+        assert isinstance(getattr(opik_service, judge_name)()._parse("not json"), dict)
+
+
+class TestLLMJudgeBase:
+    """Tests for the abstract LLM-as-judge base."""
+
+    def test_base_cannot_be_instantiated(self):
+        """Test _LLMJudge is abstract until _parse and _error_result exist."""
+        from app.services.opik_service import _LLMJudge
+
+        with pytest.raises(TypeError):
+            _LLMJudge()
+
+
+class TestJudgeConnectionPool:
+    """Tests for judges sharing the app's OpenAI connection pool."""
+
+    def test_async_judge_uses_shared_http_client(self):
+        """Test a judge's AsyncOpenAI client sends over the shared httpx pool."""
+        from app.services import openai_clients
+        from app.services.opik_service import GoalCoachingQualityMetric
+
+        metric = GoalCoachingQualityMetric()
+
+        assert metric.async_client._client is openai_clients.get_async_http_client()
+
+
 class TestAIServiceTracking:
     """Tests for AI service with Opik tracking."""
     
     def test_opik_imports_available(self):
         """Test that Opik imports are available."""
-        from app.services.ai_service import OPIK_AVAILABLE
+        from app.services.openai_clients import OPIK_AVAILABLE
         # Should be True if opik is installed
         assert isinstance(OPIK_AVAILABLE, bool)
     
@@ -211,10 +313,10 @@ class TestAIServiceTracking:
             mock_settings.OPENAI_API_KEY = "test-key"
             mock_settings.OPIK_API_KEY = ""  # No Opik
             
-            from app.services import ai_service
-            ai_service._tracked_client = None  # Reset
+            from app.services import openai_clients
+            openai_clients._tracked_client = None  # Reset
             
-            from app.services.ai_service import get_openai_client
+            from app.services.openai_clients import get_openai_client
             client = get_openai_client()
             
             assert client is not None
@@ -281,3 +383,79 @@ class TestAnalyticsEndpoints:
         assert summary.total_conversations == 100
         assert summary.avg_coaching_quality == 0.75
         assert summary.model_version == "gpt-4o-mini"
+    
+    def test_ai_performance_summary_counts(self, client, auth_headers, test_goal):
+        """Test the performance endpoint counts the user's goals and conversations."""
+        response = client.get("/api/analytics/performance", headers=auth_headers)
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_goals_created"] == 1
+        assert data["total_conversations"] == 0
+    
+    def test_frustration_recommendation_bands(self):
+        """Test frustration scores map to the expected recommendation bands."""
+        from app.routes.analytics import frustration_recommendation
+        
+        assert frustration_recommendation(0.0).startswith("User seems engaged")
+        assert frustration_recommendation(0.3).startswith("Minor friction")
+        assert frustration_recommendation(0.59).startswith("Minor friction")
+        assert frustration_recommendation(0.6).startswith("High frustration")
+        assert frustration_recommendation(1.0).startswith("High frustration")
+    
+    def test_evaluate_endpoints_await_async_judges(self, client, auth_headers):
+        """Test the judge endpoints await the async judges instead of blocking the loop."""
+        from unittest.mock import AsyncMock
+        from app.routes import analytics
+        
+        with patch.object(analytics._coaching_metric, "score", side_effect=AssertionError("sync")), \
+             patch.object(analytics._coaching_metric, "score_async",
+                          AsyncMock(return_value={"score": 0.8, "reason": "Specific"})), \
+             patch.object(analytics._frustration_detector, "detect_async",
+                          AsyncMock(return_value={"frustration_score": 0.7, "indicators": ["curt"]})):
+            coaching = client.post(
+                "/api/analytics/evaluate/coaching",
+                json={"user_input": "a", "ai_response": "b"},
+                headers=auth_headers,
+            )
+            frustration = client.post(
+                "/api/analytics/evaluate/frustration",
+                json={
+                    "original_user_input": "a",
+                    "previous_ai_response": "b",
+                    "current_user_reply": "c",
+                },
+                headers=auth_headers,
+            )
+        
+        assert (coaching.json()["score"], coaching.json()["reason"]) == (0.8, "Specific")
+        assert frustration.json()["frustration_score"] == 0.7
+    
+    def test_coaching_quality_metrics_payload(self, client, auth_headers):
+        """Test the pre-encoded coaching metrics are served as JSON."""
+        response = client.get("/api/analytics/metrics/coaching-quality", headers=auth_headers)
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        data = response.json()
+        assert data["metrics"]["smart_alignment"]["specific"] == 0.82
+        assert data["period"] == "last 30 days"
+    
+    def test_analytics_status_disabled(self, client, auth_headers):
+        """Test the status endpoint reports Opik as disabled when unconfigured."""
+        with patch("app.routes.analytics.is_opik_enabled", return_value=False):
+            response = client.get("/api/analytics/status", headers=auth_headers)
+        
+        assert response.status_code == 200
+        assert response.json()["opik_enabled"] is False
+    
+    def test_recent_traces_disabled(self, client, auth_headers):
+        """Test the traces endpoint returns the disabled payload without Opik."""
+        with patch("app.routes.analytics.is_opik_enabled", return_value=False):
+            response = client.get("/api/analytics/traces/recent", headers=auth_headers)
+        
+        assert response.status_code == 200
+        assert response.json() == {
+            "traces": [],
+            "message": "Opik not configured. Traces not available.",
+        }
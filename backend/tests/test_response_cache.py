@@ -0,0 +1,60 @@
+"""Tests for the persistent experiment response cache."""
+
+import asyncio
+import os
+
+from app.services.response_cache import ResponseCache
+
+
+class TestResponseCache:
+    """Tests for ResponseCache."""
+
+    def test_get_or_compute_skips_compute_on_hit(self, tmp_path):
+        """Test a cached value is returned without calling compute again."""
+        cache = ResponseCache(str(tmp_path))
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            return {"score": 0.9}
+
+        key = ResponseCache.key("score", {"user_input": "hi"})
+        assert asyncio.run(cache.get_or_compute(key, compute)) == {"score": 0.9}
+        assert asyncio.run(cache.get_or_compute(key, compute)) == {"score": 0.9}
+        assert len(calls) == 1
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test values survive reopening the cache and are ignored by git."""
+        ResponseCache(str(tmp_path)).set("k", "Great goal!")
+
+        assert ResponseCache(str(tmp_path)).get("k") == "Great goal!"
+        assert open(os.path.join(tmp_path, ".gitignore")).read() == "*\n"
+
+    def test_none_results_are_not_cached(self, tmp_path):
+        """Test a None result is recomputed on the next call."""
+        cache = ResponseCache(str(tmp_path))
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            return None
+
+        asyncio.run(cache.get_or_compute("k", compute))
+        asyncio.run(cache.get_or_compute("k", compute))
+        assert len(calls) == 2
+
+    def test_key_depends_on_namespace_and_inputs(self):
+        """Test keys differ by namespace and inputs but not dict order."""
+        key = ResponseCache.key("chat", {"model": "m", "temperature": 0.7})
+
+        assert key == ResponseCache.key("chat", {"temperature": 0.7, "model": "m"})
+        assert key != ResponseCache.key("score", {"model": "m", "temperature": 0.7})
+        assert key != ResponseCache.key("chat", {"model": "m", "temperature": 0.3})
+
+    def test_clear(self, tmp_path):
+        """Test clear drops every entry."""
+        cache = ResponseCache(str(tmp_path))
+        cache.set("k", 1)
+        cache.clear()
+
+        assert cache.get("k") is None
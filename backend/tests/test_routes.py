@@ -0,0 +1,34 @@
+"""Tests for API route registration."""
+
+from fastapi.routing import APIRoute
+
+from app.main import app
+from app.utils.routing import find_duplicate_routes
+
+
+class TestRouteRegistration:
+    """Tests for the application's route table."""
+
+    def test_no_duplicate_routes(self):
+        """Test every (method, path) pair is registered exactly once."""
+        assert find_duplicate_routes(app.routes) == []
+
+    def test_duplicate_router_detected(self):
+        """Test including a router twice is reported."""
+        from fastapi import APIRouter, FastAPI
+
+        router = APIRouter(prefix="/dashboard")
+        router.add_api_route("/stats", lambda: {}, methods=["GET"])
+        duplicate_app = FastAPI()
+        duplicate_app.include_router(router)
+        duplicate_app.include_router(router)
+
+        assert find_duplicate_routes(duplicate_app.routes) == [("GET", "/dashboard/stats")]
+
+    def test_auth_router_registered_once(self):
+        """Test the auth endpoints come from a single router."""
+        login_routes = [
+            route for route in app.routes
+            if isinstance(route, APIRoute) and route.path == "/api/auth/login"
+        ]
+        assert len(login_routes) == 1
@@ -0,0 +1,401 @@
+"""Tests for the experiment runner's concurrent dataset evaluation."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app import experiment_items, run_experiments
+from app.services.exp_stats import score_row
+from app.utils import json_utils
+
+
+class FakeJudge:
+    """Stand-in judge base that accepts the real judges' constructor options."""
+
+    def __init__(self, **kwargs):
+        pass
+
+
+class TestGatherBounded:
+    """Tests for bounded-concurrency fan-out."""
+
+    def test_keeps_order_and_caps_concurrency(self):
+        """Test results come back in input order with at most N running at once."""
+        running = 0
+        peak = 0
+
+        async def work(i):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            # Later items finish first, so ordering comes from gather, not timing
+            await asyncio.sleep(0.001 * (10 - i))
+            running -= 1
+            return i
+
+        results = asyncio.run(run_experiments._gather_bounded((work(i) for i in range(10)), 3))
+
+        assert results == list(range(10))
+        assert peak == 3
+
+
+class TestCoachingExperiment:
+    """Tests for run_coaching_experiment."""
+
+    def test_item_error_is_recorded_not_raised(self):
+        """Test one failing item becomes an error result while others are scored."""
+        dataset = [
+            {
+                "id": item_id,
+                "input": {"user_message": message},
+                "metadata": {"category": "health", "difficulty": "easy"},
+            }
+            for item_id, message in [("c0", "Run a marathon"), ("c1", "fail"), ("c2", "Learn piano")]
+        ]
+
+        async def fake_response(messages):
+            return "Great goal! When do you want to get there?"
+
+        class FakeMetric(FakeJudge):
+            async def score_async(self, user_input, ai_response):
+                if user_input == "fail":
+                    raise RuntimeError("judge down")
+                return {"score": 0.9, "reason": "Asks a clarifying question"}
+
+        with patch.object(run_experiments, "get_coaching_dataset", return_value=dataset), \
+             patch("app.services.ai_service.generate_chat_response", fake_response), \
+             patch("app.services.opik_service.GoalCoachingQualityMetric", FakeMetric):
+            summary = asyncio.run(run_experiments.run_coaching_experiment(max_concurrency=2))
+
+        assert [r["id"] for r in summary["results"]] == ["c0", "c1", "c2"]
+        assert summary["successful_tests"] == 2
+        assert sum("error" in r for r in summary["results"]) == 1
+
+
+class TestCoachingExperimentCache:
+    """Tests for run_coaching_experiment with a ResponseCache."""
+
+    def test_rerun_makes_no_api_calls(self, tmp_path):
+        """Test a second run over unchanged items reuses responses and scores."""
+        from app.services.response_cache import ResponseCache
+
+        dataset = [
+            {
+                "id": "c0",
+                "input": {"user_message": "Run a marathon"},
+                "metadata": {"category": "health", "difficulty": "easy"},
+            }
+        ]
+        calls = []
+
+        async def fake_response(messages):
+            calls.append("chat")
+            return "Great goal! When is the race?"
+
+        class FakeMetric(FakeJudge):
+            async def score_async(self, user_input, ai_response):
+                calls.append("score")
+                return {"score": 0.9, "reason": "Asks a clarifying question"}
+
+        cache = ResponseCache(str(tmp_path))
+        with patch.object(run_experiments, "get_coaching_dataset", return_value=dataset), \
+             patch("app.services.ai_service.generate_chat_response", fake_response), \
+             patch("app.services.opik_service.GoalCoachingQualityMetric", FakeMetric):
+            first = asyncio.run(run_experiments.run_coaching_experiment(cache=cache))
+            second = asyncio.run(run_experiments.run_coaching_experiment(cache=cache))
+
+        assert calls == ["chat", "score"]
+        assert first["results"] == second["results"]
+
+
+class TestJudgeErrorsNotCached:
+    """Tests that a failed judgement is retried rather than replayed from the cache."""
+
+    def test_judge_error_is_not_persisted(self, tmp_path):
+        """Test a judge call that fails once is scored for real on the next run."""
+        from app.services.opik_service import GoalCoachingQualityMetric
+        from app.services.response_cache import ResponseCache
+
+        dataset = [
+            {
+                "id": "c0",
+                "input": {"user_message": "Run a marathon"},
+                "metadata": {"category": "health", "difficulty": "easy"},
+            }
+        ]
+        verdicts = iter([RuntimeError("429 Too Many Requests"), '{"score": 0.9, "reason": "Specific"}'])
+
+        async def fake_judge_call(**kwargs):
+            verdict = next(verdicts)
+            if isinstance(verdict, Exception):
+                raise verdict
+            response = MagicMock()
+            response.choices[0].message.content = verdict
+            return response
+
+        async def fake_response(messages):
+            return "Great goal! When is the race?"
+
+        judge_client = MagicMock()
+        judge_client.chat.completions.create = fake_judge_call
+        cache = ResponseCache(str(tmp_path))
+        with patch.object(run_experiments, "get_coaching_dataset", return_value=dataset), \
+             patch("app.services.ai_service.generate_chat_response", fake_response), \
+             patch.object(GoalCoachingQualityMetric, "async_client", judge_client):
+            first = asyncio.run(run_experiments.run_coaching_experiment(cache=cache))
+            second = asyncio.run(run_experiments.run_coaching_experiment(cache=cache))
+
+        assert "429" in first["results"][0]["error"]
+        assert second["results"][0]["score"] == 0.9
+
+
+class TestPromptDedup:
+    """Tests for sharing calls between items with identical prompts."""
+
+    def test_duplicate_prompts_generate_once(self, capsys):
+        """Test repeated user messages are generated and scored once but reported per item."""
+        dataset = [
+            {
+                "id": item_id,
+                "input": {"user_message": message},
+                "metadata": {"category": "health", "difficulty": "easy"},
+            }
+            for item_id, message in [("c0", "Run a marathon"), ("c1", "Run a marathon"), ("c2", "Learn piano")]
+        ]
+        calls = []
+
+        async def fake_response(messages):
+            calls.append(messages[0]["content"])
+            await asyncio.sleep(0)
+            return "Great goal! When is the race?"
+
+        class FakeMetric(FakeJudge):
+            async def score_async(self, user_input, ai_response):
+                calls.append("score")
+                return {"score": 0.9, "reason": "Asks a clarifying question"}
+
+        with patch.object(run_experiments, "get_coaching_dataset", return_value=dataset), \
+             patch("app.services.ai_service.generate_chat_response", fake_response), \
+             patch("app.services.opik_service.GoalCoachingQualityMetric", FakeMetric):
+            summary = asyncio.run(run_experiments.run_coaching_experiment(max_concurrency=3))
+
+        assert sorted(calls) == ["Learn piano", "Run a marathon", "score", "score"]
+        assert [r["id"] for r in summary["results"]] == ["c0", "c1", "c2"]
+        assert "deduped: 2 unique / 3 total" in capsys.readouterr().out
+
+
+class TestExtractionExperimentBatch:
+    """Tests for run_extraction_experiment with the Batch API."""
+
+    def test_uses_batch_tool_calls(self):
+        """Test batch completions are parsed into goals without live extraction calls."""
+        dataset = [
+            {
+                "id": "e0",
+                "input": {"conversation": [{"role": "user", "content": "I want to learn Spanish"}]},
+                "expected_output": {"goal_title_contains": ["spanish"], "category": "learning"},
+            }
+        ]
+        arguments = json_utils.dumps({
+            "title": "Learn Spanish",
+            "category": "learning",
+            "milestones": [{"title": "Finish A1", "tasks": [{"title": "Daily lesson"}]}],
+        })
+        batch = {
+            "e0": {"choices": [{"message": {"tool_calls": [
+                {"function": {"name": "create_goal_roadmap", "arguments": arguments}}
+            ]}}]}
+        }
+
+        async def fake_run_batch(bodies):
+            assert list(bodies) == ["e0"]
+            return batch
+
+        async def live_extract(messages):
+            raise AssertionError("batch mode must not extract live")
+
+        class FakeMetric(FakeJudge):
+            async def score_async(self, **kwargs):
+                return {"score": 0.8, "reason": "SMART"}
+
+        with patch.object(run_experiments, "get_goal_extraction_dataset", return_value=dataset), \
+             patch.object(run_experiments, "_run_batch", fake_run_batch), \
+             patch("app.services.ai_service.extract_goal_from_conversation", live_extract), \
+             patch("app.services.opik_service.GoalExtractionQualityMetric", FakeMetric):
+            summary = asyncio.run(run_experiments.run_extraction_experiment(use_batch_api=True))
+
+        result = summary["results"][0]
+        assert result["extracted_title"] == "Learn Spanish"
+        assert result["title_match"] and result["category_match"]
+
+
+class TestRunBuffered:
+    """Tests for per-experiment output buffering."""
+
+    def test_concurrent_experiments_print_in_blocks(self, capsys):
+        """Test interleaved progress from two experiments prints grouped per experiment."""
+        from app.experiment_items import emit, run_buffered
+
+        async def experiment(name, delay):
+            emit(f"{name} start")
+            # Spawned tasks share the experiment's buffer
+            await asyncio.gather(*(asyncio.sleep(delay) for _ in range(2)))
+            emit(f"{name} item")
+            await asyncio.sleep(delay)
+            emit(f"{name} done")
+            return name
+
+        async def main():
+            return await asyncio.gather(
+                run_buffered(experiment("slow", 0.02)),
+                run_buffered(experiment("fast", 0.001)),
+            )
+
+        assert asyncio.run(main()) == ["slow", "fast"]
+        assert capsys.readouterr().out.splitlines() == [
+            "fast start", "fast item", "fast done",
+            "slow start", "slow item", "slow done",
+        ]
+
+
+class TestResultStreaming:
+    """Tests for streaming per-item results to JSONL."""
+
+    def test_items_stream_to_writer_and_leave_summary(self, tmp_path):
+        """Test each item lands in the JSONL file and the summary omits the list."""
+        from app.experiment_items import ResultWriter
+
+        dataset = [
+            {
+                "id": f"c{i}",
+                "input": {"user_message": f"Goal {i}"},
+                "metadata": {"category": "health", "difficulty": "easy"},
+            }
+            for i in range(3)
+        ]
+
+        async def fake_response(messages):
+            return "Great goal!"
+
+        class FakeMetric(FakeJudge):
+            async def score_async(self, user_input, ai_response):
+                return {"score": 0.9, "reason": "Specific"}
+
+        path = tmp_path / "results.jsonl"
+        with patch.object(run_experiments, "get_coaching_dataset", return_value=dataset), \
+             patch("app.services.ai_service.generate_chat_response", fake_response), \
+             patch("app.services.opik_service.GoalCoachingQualityMetric", FakeMetric), \
+             ResultWriter(str(path)) as writer:
+            summary = asyncio.run(run_experiments.run_coaching_experiment(writer=writer))
+
+        records = [json_utils.loads(line) for line in path.read_bytes().splitlines()]
+        assert sorted(r["id"] for r in records) == ["c0", "c1", "c2"]
+        assert {r["experiment"] for r in records} == {"coaching"}
+        assert all(isinstance(r["timestamp_ns"], int) for r in records)
+        assert "results" not in summary
+        assert summary["successful_tests"] == 3
+
+    def test_streamed_run_keeps_only_score_rows(self, tmp_path):
+        """Test a streamed item is reduced to its score row and its dict is dropped."""
+        from app.experiment_items import ResultWriter
+
+        async def item():
+            return {"id": "c0", "score": 0.8, "reason": "Specific"}
+
+        with ResultWriter(str(tmp_path / "results.jsonl")) as writer:
+            streamed = asyncio.run(experiment_items.record_item(item(), writer, "coaching", "score", [0.7, 1.0]))
+        kept = asyncio.run(experiment_items.record_item(item(), None, "coaching", "score", [0.7, 1.0]))
+
+        assert streamed == ((0.8, 0.7, 1.0), None)
+        assert kept[1]["reason"] == "Specific"
+
+
+class TestSummarize:
+    """Tests for experiment summaries built on exp_stats."""
+
+    def test_skips_errors_and_counts_in_range_items(self):
+        """Test error results are skipped and each item is checked against its own range."""
+        results = [
+            {"id": "a", "score": 0.9},
+            {"id": "b", "error": "timeout"},
+            {"id": "c", "score": 0.3},
+            {"id": "d", "score": 0.0},
+        ]
+        ranges = [(0.7, 1.0), (0.7, 1.0), (0.7, 1.0), (0.0, 0.2)]
+        outcomes = [(score_row(r, "score", rng), r) for r, rng in zip(results, ranges)]
+
+        stats = experiment_items.summarize_items(outcomes)
+
+        assert (stats.n_valid, stats.pass_count) == (3, 2)
+        assert stats.average == pytest.approx(0.4)
+        assert stats.p50 == pytest.approx(0.3)
+        assert stats.pass_rate == pytest.approx(2 / 3)
+
+    def test_no_scored_items(self):
+        """Test an all-error run summarizes to zeros instead of NaN."""
+        error = {"id": "a", "error": "x"}
+        stats = experiment_items.summarize_items([(score_row(error, "score", (0, 1)), error)])
+
+        assert (stats.n_valid, stats.average, stats.pass_rate, stats.p90) == (0, 0.0, 0.0, 0.0)
+
+
+class TestSyncScorers:
+    """Tests for scorers that only offer a sync method."""
+
+    def test_sync_metric_runs_off_the_event_loop(self):
+        """Test a sync-only metric is called in a worker thread."""
+        import threading
+
+        dataset = [
+            {
+                "id": "c0",
+                "input": {"user_message": "Run a marathon"},
+                "metadata": {"category": "health", "difficulty": "easy"},
+            }
+        ]
+        threads = []
+
+        async def fake_response(messages):
+            return "Great goal!"
+
+        class HeuristicMetric(FakeJudge):
+            def score(self, user_input, ai_response):
+                threads.append(threading.current_thread())
+                return {"score": 1.0 if "?" in ai_response else 0.5, "reason": "heuristic"}
+
+        with patch.object(run_experiments, "get_coaching_dataset", return_value=dataset), \
+             patch("app.services.ai_service.generate_chat_response", fake_response), \
+             patch("app.services.opik_service.GoalCoachingQualityMetric", HeuristicMetric):
+            summary = asyncio.run(run_experiments.run_coaching_experiment())
+
+        assert summary["average_score"] == 0.5
+        assert threads and threads[0] is not threading.main_thread()
+
+
+class TestLazyFanOut:
+    """Tests for pulling dataset coroutines lazily."""
+
+    def test_creates_coroutines_only_as_slots_free(self):
+        """Test no more than max_concurrency item coroutines exist at once."""
+        created = 0
+        finished = 0
+        peak_outstanding = 0
+
+        async def work(i):
+            nonlocal finished
+            await asyncio.sleep(0)
+            finished += 1
+            return i
+
+        def items():
+            nonlocal created, peak_outstanding
+            for i in range(20):
+                created += 1
+                peak_outstanding = max(peak_outstanding, created - finished)
+                yield work(i)
+
+        results = asyncio.run(run_experiments._gather_bounded(items(), 4))
+
+        assert results == list(range(20))
+        assert peak_outstanding <= 4
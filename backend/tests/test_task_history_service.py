@@ -0,0 +1,73 @@
+"""Tests for the task history service."""
+
+from app.agents.task_history import TASK_STATUS_CODES, TaskHistoryColumns
+from app.models.goal import Task, TaskStatus
+from app.services.task_history_service import (
+    load_goal_task_history,
+    load_goal_task_history_columns,
+    load_task_history,
+    load_task_summary,
+)
+
+
+class TestLoadTaskHistory:
+    """Tests for batched task history loading."""
+
+    def test_groups_tasks_by_goal(self, session, test_goal, test_task):
+        """Test tasks are returned as dicts grouped by goal ID."""
+        history = load_task_history(session, [test_goal.id, 999])
+
+        assert [t["id"] for t in history[test_goal.id]] == [test_task.id]
+        assert history[999] == []
+
+        task = history[test_goal.id][0]
+        assert task["title"] == test_task.title
+        assert task["status"] == TaskStatus.PENDING
+        assert task["completed_at"] is None
+
+    def test_single_goal(self, session, test_goal, test_milestone):
+        """Test the single-goal helper returns that goal's tasks."""
+        session.add(Task(goal_id=test_goal.id, milestone_id=test_milestone.id, title="Extra"))
+        session.commit()
+
+        titles = {t["title"] for t in load_goal_task_history(session, test_goal.id)}
+        assert "Extra" in titles
+
+    def test_no_goals(self, session):
+        """Test an empty goal list skips the query."""
+        assert load_task_history(session, []) == {}
+
+    def test_columns_match_dicts(self, session, test_goal, test_task):
+        """Test prebuilt columns line up with the dict rows."""
+        rows, columns = load_goal_task_history_columns(session, test_goal.id)
+
+        assert len(rows) == len(columns) == 1
+        assert columns.status.tolist() == [TASK_STATUS_CODES["pending"]]
+        assert columns.created_at[0] == TaskHistoryColumns.from_dicts(rows).created_at[0]
+
+    def test_columns_empty_goal(self, session):
+        """Test a goal without tasks yields empty columns."""
+        rows, columns = load_goal_task_history_columns(session, 999)
+
+        assert rows == []
+        assert len(columns) == 0
+
+    def test_timestamps_are_iso_8601(self, session, test_goal, test_task):
+        """Test timestamps use the ISO 'T' separator."""
+        task = load_goal_task_history(session, test_goal.id)[0]
+
+        assert task["created_at"] == test_task.created_at.isoformat()
+        assert "T" in task["created_at"]
+
+    def test_task_summary_counts_by_status(self, session, test_goal, test_milestone, test_task):
+        """Test the summary counts tasks per status in SQL."""
+        session.add(Task(
+            goal_id=test_goal.id,
+            milestone_id=test_milestone.id,
+            title="Done",
+            status=TaskStatus.COMPLETED,
+        ))
+        session.commit()
+
+        assert load_task_summary(session, test_goal.id) == {"pending": 1, "completed": 1}
+        assert load_task_summary(session, 999) == {}
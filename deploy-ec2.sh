@@ -147,7 +147,7 @@ Type=simple
 User=ubuntu
 WorkingDirectory=/var/www/milesync/backend
 Environment="PATH=/var/www/milesync/backend/venv/bin"
-ExecStart=/var/www/milesync/backend/venv/bin/uvicorn app.main:app --host 0.0.0.0 --port 8000
+ExecStart=/var/www/milesync/backend/venv/bin/uvicorn app.main:app --host 0.0.0.0 --port 8000 --loop uvloop --http httptools
 Restart=always
 RestartSec=10
 
@@ -36,6 +36,8 @@ export interface SendMessageResponse {
 export interface ChatSessionWithMessages {
   session: ChatSession;
   messages: ChatMessage[];
+  has_more?: boolean;
+  next_cursor?: number | null;
 }
 
 export interface ChatListItem {
@@ -22,8 +22,8 @@ SET row_security = off;
 -- Data for Name: users; Type: TABLE DATA; Schema: public; Owner: milesync_user
 --
 
-INSERT INTO public.users VALUES (1, 'admin@milesync.demo', '$2b$12$Qp.SKsaJk2Y7aDBaHlLihOnuGguI0UEGtfbdH45y3/JklLf82oL06', 'Admin', NULL, 'EMAIL', true, true, '2026-02-07 09:09:43.120193', '2026-02-07 09:09:43.120207', 2000, 0, NULL);
-INSERT INTO public.users VALUES (2, 'user@milesync.demo', '$2b$12$2SKC7DKDkEO3WV0Cbql2ruBdbZaaqg63dQg/U/PadKknET2kc/avO', 'Super User', NULL, 'EMAIL', true, false, '2026-02-07 09:09:43.389541', '2026-02-07 09:09:43.389553', 2000, 0, NULL);
+INSERT INTO public.users VALUES (1, 'admin@milesync.demo', '$2b$12$Qp.SKsaJk2Y7aDBaHlLihOnuGguI0UEGtfbdH45y3/JklLf82oL06', 'Admin', NULL, 0, true, true, '2026-02-07 09:09:43.120193', '2026-02-07 09:09:43.120207', 2000, 0, NULL);
+INSERT INTO public.users VALUES (2, 'user@milesync.demo', '$2b$12$2SKC7DKDkEO3WV0Cbql2ruBdbZaaqg63dQg/U/PadKknET2kc/avO', 'Super User', NULL, 0, true, false, '2026-02-07 09:09:43.389541', '2026-02-07 09:09:43.389553', 2000, 0, NULL);
 
 
 --
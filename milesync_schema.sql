@@ -18,171 +18,6 @@ SET xmloption = content;
 SET client_min_messages = warning;
 SET row_security = off;
 
---
--- Name: authprovider; Type: TYPE; Schema: public; Owner: -
---
-
-CREATE TYPE public.authprovider AS ENUM (
-    'EMAIL'
-);
-
-
---
--- Name: chatstatus; Type: TYPE; Schema: public; Owner: -
---
-
-CREATE TYPE public.chatstatus AS ENUM (
-    'ACTIVE',
-    'COMPLETED',
-    'FINALIZED'
-);
-
-
---
--- Name: goalcategory; Type: TYPE; Schema: public; Owner: -
---
-
-CREATE TYPE public.goalcategory AS ENUM (
-    'HEALTH',
-    'CAREER',
-    'EDUCATION',
-    'FINANCE',
-    'PERSONAL',
-    'OTHER'
-);
-
-
---
--- Name: goalstatus; Type: TYPE; Schema: public; Owner: -
---
-
-CREATE TYPE public.goalstatus AS ENUM (
-    'ACTIVE',
-    'COMPLETED',
-    'PAUSED',
-    'ABANDONED'
-);
-
-
---
--- Name: goaltype; Type: TYPE; Schema: public; Owner: -
---
-
-CREATE TYPE public.goaltype AS ENUM (
-    'SHORT_TERM',
-    'LONG_TERM',
-    'RESOLUTION'
-);
-
-
---
--- Name: habitstrength; Type: TYPE; Schema: public; Owner: -
---
-
-CREATE TYPE public.habitstrength AS ENUM (
-    'FORMING',
-    'DEVELOPING',
-    'ESTABLISHED',
-    'AUTOMATIC'
-);
-
-
---
--- Name: insighttype; Type: TYPE; Schema: public; Owner: -
---
-
-CREATE TYPE public.insighttype AS ENUM (
-    'PATTERN',
-    'STRENGTH',
-    'WEAKNESS',
-    'RECOMMENDATION',
-    'WARNING'
-);
-
-
---
--- Name: learningstyle; Type: TYPE; Schema: public; Owner: -
---
-
-CREATE TYPE public.learningstyle AS ENUM (
-    'VISUAL',
-    'AUDITORY',
-    'READING',
-    'KINESTHETIC'
-);
-
-
---
--- Name: messagerole; Type: TYPE; Schema: public; Owner: -
---
-
-CREATE TYPE public.messagerole AS ENUM (
-    'USER',
-    'ASSISTANT',
-    'SYSTEM'
-);
-
-
---
--- Name: motivationtype; Type: TYPE; Schema: public; Owner: -
---
-
-CREATE TYPE public.motivationtype AS ENUM (
-    'INTRINSIC',
-    'EXTRINSIC',
-    'ACHIEVEMENT',
-    'AFFILIATION',
-    'POWER'
-);
-
-
---
--- Name: personalitytype; Type: TYPE; Schema: public; Owner: -
---
-
-CREATE TYPE public.personalitytype AS ENUM (
-    'DRIVER',
-    'ANALYTICAL',
-    'EXPRESSIVE',
-    'AMIABLE'
-);
-
-
---
--- Name: taskfrequency; Type: TYPE; Schema: public; Owner: -
---
-
-CREATE TYPE public.taskfrequency AS ENUM (
-    'DAILY',
-    'WEEKLY',
-    'MONTHLY',
-    'ONE_TIME'
-);
-
-
---
--- Name: taskpriority; Type: TYPE; Schema: public; Owner: -
---
-
-CREATE TYPE public.taskpriority AS ENUM (
-    'LOW',
-    'MEDIUM',
-    'HIGH'
-);
-
-
---
--- Name: taskstatus; Type: TYPE; Schema: public; Owner: -
---
-
-CREATE TYPE public.taskstatus AS ENUM (
-    'PENDING',
-    'IN_PROGRESS',
-    'COMPLETED',
-    'SKIPPED'
-);
-
-
 SET default_tablespace = '';
 
 SET default_table_access_method = heap;
@@ -194,7 +29,7 @@ SET default_table_access_method = heap;
 CREATE TABLE public.chat_messages (
     id integer NOT NULL,
     session_id integer NOT NULL,
-    role public.messagerole NOT NULL,
+    role smallint NOT NULL,
     content character varying NOT NULL,
     created_at timestamp without time zone NOT NULL
 );
@@ -228,7 +63,7 @@ CREATE TABLE public.chat_sessions (
     id integer NOT NULL,
     user_id integer NOT NULL,
     title character varying,
-    status public.chatstatus NOT NULL,
+    status smallint NOT NULL,
     goal_id integer,
     created_at timestamp without time zone NOT NULL,
     updated_at timestamp without time zone NOT NULL
@@ -306,10 +141,10 @@ CREATE TABLE public.goals (
     chat_session_id integer,
     title character varying NOT NULL,
     description character varying,
-    category public.goalcategory NOT NULL,
-    goal_type public.goaltype NOT NULL,
+    category smallint NOT NULL,
+    goal_type smallint NOT NULL,
     target_date date,
-    status public.goalstatus NOT NULL,
+    status smallint NOT NULL,
     progress integer NOT NULL,
     motivation_score integer,
     feasibility_score integer,
@@ -362,7 +197,7 @@ CREATE TABLE public.habit_loops (
     cue character varying NOT NULL,
     routine character varying NOT NULL,
     reward character varying NOT NULL,
-    strength public.habitstrength NOT NULL,
+    strength smallint NOT NULL,
     days_tracked integer NOT NULL,
     current_streak integer NOT NULL,
     best_streak integer NOT NULL,
@@ -479,9 +314,9 @@ CREATE TABLE public.tasks (
     title character varying NOT NULL,
     description character varying,
     due_date date,
-    status public.taskstatus NOT NULL,
-    priority public.taskpriority NOT NULL,
-    frequency public.taskfrequency NOT NULL,
+    status smallint NOT NULL,
+    priority smallint NOT NULL,
+    frequency smallint NOT NULL,
     estimated_minutes integer NOT NULL,
     streak_count integer NOT NULL,
     best_streak integer NOT NULL,
@@ -523,7 +358,7 @@ CREATE TABLE public.user_insights (
     id integer NOT NULL,
     user_id integer NOT NULL,
     goal_id integer,
-    insight_type public.insighttype NOT NULL,
+    insight_type smallint NOT NULL,
     title character varying NOT NULL,
     description character varying NOT NULL,
     source_agent character varying NOT NULL,
@@ -564,9 +399,9 @@ ALTER SEQUENCE public.user_insights_id_seq OWNED BY public.user_insights.id;
 CREATE TABLE public.user_profiles (
     id integer NOT NULL,
     user_id integer NOT NULL,
-    learning_style public.learningstyle,
-    motivation_type public.motivationtype,
-    personality_type public.personalitytype,
+    learning_style smallint,
+    motivation_type smallint,
+    personality_type smallint,
     best_time_of_day character varying,
     best_days character varying,
     avg_focus_duration integer,
@@ -619,7 +454,7 @@ CREATE TABLE public.users (
     password_hash character varying,
     name character varying NOT NULL,
     avatar_url character varying,
-    auth_provider public.authprovider NOT NULL,
+    auth_provider smallint NOT NULL,
     is_active boolean NOT NULL,
     is_superuser boolean NOT NULL,
     created_at timestamp without time zone NOT NULL,